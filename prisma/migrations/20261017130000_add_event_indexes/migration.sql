@@ -0,0 +1,8 @@
+-- CreateIndex
+CREATE INDEX "Event_status_endDate_idx" ON "Event"("status", "endDate");
+
+-- CreateIndex
+CREATE INDEX "Event_status_updatedAt_idx" ON "Event"("status", "updatedAt");
+
+-- CreateIndex
+CREATE INDEX "Event_communityText_startDate_idx" ON "Event"("communityText", "startDate");
@@ -1,41 +1,35 @@
+"""
+Scrapers package.
+
+Scraper classes are resolved lazily through the registry, so
+``from scrapers import NYCBarScraper`` imports only nycbar_scraper and
+``import scrapers`` itself imports no scraper modules at all.
+"""
+
+import importlib
 import os
-from .models import Event
-from .base_scraper import BaseScraper
-from .nycbar_scraper import NYCBarScraper
-# from .fordham_scraper import FordhamScraper
-# from .lawyers_alliance_scraper import LawyersAllianceScraper
-# from .google_calendar_scraper import GoogleCalendarScraper
-# from .ics_calendar_scraper import ICSCalendarScraper
-# from .cuny_law_ics_scraper import CUNYLawICSScraper
-from .chips_network_scraper import ChIPsNetworkScraper
-from .lawline_scraper import LawlineScraper
-from .lgbtbarny_scraper import LgbtBarNyScraper
-from .nawl_scraper import NAWLScraper
-from .nycbar_scraper import NYCBarScraper
-from .nyiac_scraper import NYIACScraper
-from .nysba_scraper import NYSBAScraper
-from .wbasny_scraper import WBASNYScraper
-# from .aabany_rss_scraper import AabanyRssScraper
-# from .fedbar_ics_scraper import FBAICSScraper
-# from .hnba_ics_scraper import HNBAICSScraper
-from .barkergilmore_scraper import BarkerGilmoreScraper
-from .brooklynbar_scraper import BrooklynBarScraper
-from .lsuite_scraper import LSuiteScraper
-from .acc_scraper import AccScraper
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
+# Non-scraper names exported lazily, by module
+_LAZY_EXPORTS = {
+    'Event': 'models',
+    'BaseScraper': 'base_scraper',
+    'AsyncBaseScraper': 'async_base_scraper',
+    'ScraperSpec': 'registry',
+    'get_spec': 'registry',
+    'iter_specs': 'registry',
+}
+
 __all__ = [
-    # 'AabanyRssScraper',
     'BarkerGilmoreScraper',
     'BrooklynBarScraper',
     'ChIPsNetworkScraper',
-    # 'CUNYLawICSScraper',
-    # 'FBAICSScraper',
-    # 'FordhamScraper',
-    # 'HNBAICSScraper',
-    # 'ICSCalendarScraper',
-    # 'LawyersAllianceScraper',
+    'CUNYLawICSScraper',
+    'FBAICSScraper',
+    'FordhamScraper',
+    'HNBAICSScraper',
+    'LawlineScraper',
     'LgbtBarNyScraper',
     'LSuiteScraper',
     'NAWLScraper',
@@ -44,5 +38,21 @@ __all__ = [
     'NYSBAScraper',
     'WBASNYScraper',
     'AccScraper',
-    # 'GoogleCalendarScraper',
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f'.{_LAZY_EXPORTS[name]}', __name__)
+        return getattr(module, name)
+    from .registry import spec_for_class
+    spec = spec_for_class(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = spec.load_class()
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(__all__))
@@ -3,11 +3,30 @@ Academic Event Filter Utility
 
 This module provides filtering logic to exclude internal academic events
 from law school scrapers, ensuring only public events are included.
+
+The keyword and pattern lists are compiled once into a phrase matcher and a
+single regex with one named group per pattern. Every decision is attributed
+to a rule, and rule_hits counts them, so batch runs log one summary line
+instead of a line per filtered event.
 """
 
 import re
 import logging
-from typing import Optional
+from collections import Counter
+from typing import List, Optional, Tuple
+
+try:
+    from .phrase_matcher import PhraseMatcher
+except ImportError:
+    from phrase_matcher import PhraseMatcher
+
+# Prefixes that mark internal calendar entries, e.g. "LAW: Grades due"
+INTERNAL_PREFIXES = ('law:', 'law :', 'law-', 'law -', 'academic:', 'academic :', 'student:', 'student :', 'faculty:', 'faculty :')
+
+# Rule names reported for decisions that are not a specific keyword or pattern
+RULE_EMPTY_TITLE = 'empty_title'
+RULE_PREFIX = 'internal_prefix'
+RULE_SHORT_TITLE = 'short_title'
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +108,60 @@ class AcademicEventFilter:
             r'\b(independent\s+study|writing\s+requirement)\b',  # Academic requirements
             r'\b(course|courses)\s+(begin|end|start|stop)\b'  # Course schedules
         ]
+
+        # Number of events removed per rule (and kept, under None)
+        self.rule_hits = Counter()
+        self.compile()
+
+    def compile(self) -> None:
+        """Compile the keyword and pattern lists. Call again after changing them."""
+        self._internal_matcher = PhraseMatcher(keyword.lower() for keyword in self.internal_keywords)
+        self._public_matcher = PhraseMatcher(keyword.lower() for keyword in self.public_keywords)
+        # One alternation, with group pN for internal_patterns[N]
+        self._pattern_regex = re.compile('|'.join(
+            f'(?P<p{index}>{pattern})' for index, pattern in enumerate(self.internal_patterns)
+        ))
+
+    def explain(self, title: str, description: Optional[str] = None) -> Optional[str]:
+        """
+        Return the rule that marks an event as internal, or None if it should be kept.
+
+        Rules are reported as 'keyword:<keyword>' (the first internal keyword
+        in the title, else in the description), 'internal_prefix',
+        'pattern:<pattern>', 'short_title' or 'empty_title'.
+        """
+        if not title or not title.strip():
+            return RULE_EMPTY_TITLE
+
+        # Convert to lowercase for case-insensitive matching
+        title_lower = title.lower().strip()
+        desc_lower = (description or "").lower().strip()
+
+        # Check for internal academic indicators (the first one found is reported)
+        keyword = self._internal_matcher.search(title_lower) or self._internal_matcher.search(desc_lower)
+        if keyword:
+            return f'keyword:{keyword}'
+
+        # Check if title starts with internal prefixes
+        if title_lower.startswith(INTERNAL_PREFIXES):
+            return RULE_PREFIX
+
+        # Check for specific patterns that indicate internal events
+        match = self._pattern_regex.search(title_lower)
+        if match:
+            return f'pattern:{self.internal_patterns[int(match.lastgroup[1:])]}'
+
+        # If we have multiple public indicators, it's likely a public event
+        public_found = self._public_matcher.find(title_lower) | self._public_matcher.find(desc_lower)
+        if len(public_found) >= 2:
+            return None
+
+        # If title is very short or generic, it might be internal
+        if len(title.strip()) < 10:
+            return RULE_SHORT_TITLE
+
+        # Default: keep the event (be conservative)
+        return None
     
     def is_internal_academic_event(self, title: str, description: Optional[str] = None) -> bool:
         """
@@ -101,49 +174,15 @@ class AcademicEventFilter:
         Returns:
             True if event should be filtered out, False if it should be kept
         """
-        if not title or not title.strip():
-            return True
-            
-        # Convert to lowercase for case-insensitive matching
-        title_lower = title.lower().strip()
-        desc_lower = (description or "").lower().strip()
-        
-        # Check for internal academic indicators
-        for keyword in self.internal_keywords:
-            if keyword.lower() in title_lower or keyword.lower() in desc_lower:
-                logger.info(f"Filtering out internal academic event: '{title}' (keyword: '{keyword}')")
-                return True
-        
-        # Check if title starts with internal prefixes
-        if title_lower.startswith(('law:', 'law :', 'law-', 'law -', 'academic:', 'academic :', 'student:', 'student :', 'faculty:', 'faculty :')):
-            logger.info(f"Filtering out internal academic event: '{title}' (internal prefix)")
+        rule = self.explain(title, description)
+        self.rule_hits[rule] += 1
+        if rule is not None:
+            logger.debug(f"Filtering out internal academic event: '{title}' ({rule})")
             return True
-        
-        # Check for specific patterns that indicate internal events
-        for pattern in self.internal_patterns:
-            if re.search(pattern, title_lower):
-                logger.info(f"Filtering out internal academic event: '{title}' (pattern: '{pattern}')")
-                return True
-        
-        # Check if it's likely a public event
-        public_indicator_count = 0
-        for keyword in self.public_keywords:
-            if keyword.lower() in title_lower or keyword.lower() in desc_lower:
-                public_indicator_count += 1
-        
-        # If we have multiple public indicators, it's likely a public event
-        if public_indicator_count >= 2:
-            return False
-        
-        # If title is very short or generic, it might be internal
-        if len(title.strip()) < 10:
-            logger.info(f"Filtering out short/generic event: '{title}'")
-            return True
-        
-        # Default: keep the event (be conservative)
         return False
     
-    def filter_events(self, events: list, title_field: str = 'name', description_field: str = 'description') -> list:
+    def filter_events(self, events: list, title_field: str = 'name', description_field: str = 'description',
+                      return_rules: bool = False):
         """
         Filter a list of events to exclude internal academic events.
         
@@ -151,26 +190,39 @@ class AcademicEventFilter:
             events: List of event dictionaries
             title_field: Field name containing the event title
             description_field: Field name containing the event description
+            return_rules: Also return (event, rule) pairs for the removed events
             
         Returns:
-            Filtered list of events
+            Filtered list of events, or (filtered events, removed (event, rule) pairs)
+            when return_rules is set
         """
         if not events:
-            return events
+            return (events, []) if return_rules else events
             
         original_count = len(events)
         filtered_events = []
+        removed: List[Tuple[dict, str]] = []
+        hits = Counter()
         
         for event in events:
             title = event.get(title_field, '')
             description = event.get(description_field, '')
             
-            if not self.is_internal_academic_event(title, description):
+            rule = self.explain(title, description)
+            hits[rule] += 1
+            if rule is None:
                 filtered_events.append(event)
+            else:
+                removed.append((event, rule))
         
+        self.rule_hits.update(hits)
         filtered_count = len(filtered_events)
-        logger.info(f"Filtered {original_count} events to {filtered_count} public events")
+        top_rules = ', '.join(f"{rule} x{count}" for rule, count in hits.most_common(5) if rule is not None)
+        logger.info(f"Filtered {original_count} events to {filtered_count} public events"
+                    + (f" (top rules: {top_rules})" if top_rules else ""))
         
+        if return_rules:
+            return filtered_events, removed
         return filtered_events
 
 # Global instance for easy import
@@ -29,7 +29,7 @@ class AccScraper(BaseScraper):
 
     def get_events(self):
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = self.session.get(self.url, headers=self.headers)
             response.raise_for_status()
 
             # For debugging, save the HTML content
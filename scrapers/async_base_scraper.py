@@ -0,0 +1,199 @@
+"""
+Asyncio-native scraper base class.
+
+AsyncBaseScraper is the async counterpart of BaseScraper: subclasses implement
+``async def get_events()`` and fetch through one aiohttp connection pool shared
+by every async scraper on the running event loop. Existing blocking scrapers
+are wrapped in SyncScraperAdapter, which runs them on an executor, so both
+kinds can be awaited side by side while scrapers are migrated one at a time.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from .base_scraper import BaseScraper, ScraperException, DEFAULT_HEADERS, PROJECT_ROOT
+    from .deadline import Deadline, deadline_scope
+    from .metrics import current_metrics, span
+    from .models import Event
+    from .rate_limit import get_rate_limiter
+except ImportError:
+    from base_scraper import BaseScraper, ScraperException, DEFAULT_HEADERS, PROJECT_ROOT
+    from deadline import Deadline, deadline_scope
+    from metrics import current_metrics, span
+    from models import Event
+    from rate_limit import get_rate_limiter
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits for the shared client session
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 4
+DEFAULT_TIMEOUT_SECONDS = 30
+
+# One client session per event loop; aiohttp sessions cannot cross loops
+_shared_sessions: Dict[asyncio.AbstractEventLoop, Any] = {}
+
+
+def _import_aiohttp():
+    """Import aiohttp on first use; it is slow to import and only async scrapers need it."""
+    try:
+        import aiohttp
+    except ImportError:
+        raise ScraperException("aiohttp is required for async scrapers. Install it with: pip install aiohttp")
+    return aiohttp
+
+
+async def get_shared_session() -> 'aiohttp.ClientSession':
+    """Return the aiohttp session shared by all async scrapers on this loop."""
+    aiohttp = _import_aiohttp()
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=DEFAULT_CONNECTION_LIMIT,
+            limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_SECONDS),
+        )
+        _shared_sessions[loop] = session
+    return session
+
+
+async def close_shared_session() -> None:
+    """Close the shared session for the running loop, if one was opened."""
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+class AsyncBaseScraper(ABC):
+    """Base class for scrapers that fetch with asyncio instead of blocking requests."""
+
+    def __init__(self, community_id: Optional[str] = None):
+        self.community_id = community_id
+        # Always save to scrapers/data relative to project root
+        self.data_dir = os.path.join(PROJECT_ROOT, "scrapers", "data")
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    async def fetch_text(self, url: str, **kwargs) -> str:
+        """GET a URL through the shared session and return the body as text."""
+        body, encoding = await self._fetch(url, **kwargs)
+        return body.decode(encoding)
+
+    async def fetch_json(self, url: str, **kwargs) -> Any:
+        """GET a URL through the shared session and decode the JSON body."""
+        body, encoding = await self._fetch(url, **kwargs)
+        return json.loads(body.decode(encoding))
+
+    async def _fetch(self, url: str, **kwargs) -> Tuple[bytes, str]:
+        """GET a URL within its host's rate limit and return (body, encoding)."""
+        session = await get_shared_session()
+        aiohttp = _import_aiohttp()
+        limiter = get_rate_limiter()
+        with span('throttle'):
+            trial = await limiter.acquire_async(url)
+        with span('fetch'):
+            try:
+                async with session.get(url, **kwargs) as response:
+                    limiter.record_response(url, response.status, response.headers.get('Retry-After'))
+                    response.raise_for_status()
+                    body = await response.read()
+                    self._count_request(body)
+                    return body, response.get_encoding()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                limiter.record_failure(url)
+                raise
+            finally:
+                # Cancelled or failed before a response: don't leave a half-open trial holding the circuit
+                limiter.release_trial(url, trial)
+
+    @staticmethod
+    def _count_request(body: bytes) -> None:
+        metrics = current_metrics()
+        if metrics is not None:
+            with metrics._lock:
+                metrics.http_requests += 1
+                metrics.bytes_downloaded += len(body)
+
+    @abstractmethod
+    async def get_events(self) -> List[Event]:
+        """Get events from the source. Must be implemented by each scraper."""
+        raise NotImplementedError("Each scraper must implement this method")
+
+    save_events = BaseScraper.save_events
+
+    async def run(self) -> List[Event]:
+        """Run the scraper and return the events."""
+        with span('parse'):
+            events = await self.get_events()
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.community_id}_events_{timestamp}.json"
+        self.save_events(events, filename)
+        return events
+
+
+class SyncScraperAdapter:
+    """Exposes a blocking BaseScraper through the AsyncBaseScraper interface.
+
+    The wrapped scraper runs on ``executor`` (the loop's default executor when
+    None), so the event loop stays free while it blocks on network I/O. Each
+    call runs under a deadline of ``timeout`` seconds that only starts once a
+    worker thread picks the call up, so time spent queued for a thread is not
+    taken from the scraper's budget.
+    """
+
+    def __init__(self, scraper: BaseScraper, executor: Optional[Executor] = None,
+                 timeout: Optional[float] = None):
+        self.scraper = scraper
+        self.executor = executor
+        self.timeout = timeout
+        # Deadline of the last call, set when its worker thread starts it
+        self.deadline: Optional[Deadline] = None
+        self.started = asyncio.Event()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.scraper, name)
+
+    async def _call(self, func, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        self.started.clear()
+
+        def run_in_worker() -> Any:
+            with deadline_scope(self.timeout) as deadline:
+                self.deadline = deadline
+                loop.call_soon_threadsafe(self.started.set)
+                return func(*args)
+
+        # Carry context variables (e.g. per-run state) into the worker thread
+        call = functools.partial(contextvars.copy_context().run, run_in_worker)
+        return await loop.run_in_executor(self.executor, call)
+
+    async def get_events(self) -> List[Event]:
+        return await self._call(self.scraper.get_events)
+
+    async def run(self) -> List[Event]:
+        return await self._call(self.scraper.run)
+
+
+def as_async(scraper: Union[BaseScraper, AsyncBaseScraper],
+             executor: Optional[Executor] = None) -> Union[AsyncBaseScraper, SyncScraperAdapter]:
+    """Return an awaitable view of any scraper, adapting sync scrapers as needed."""
+    if isinstance(scraper, (AsyncBaseScraper, SyncScraperAdapter)):
+        return scraper
+    return SyncScraperAdapter(scraper, executor)
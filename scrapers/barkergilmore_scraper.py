@@ -135,7 +135,7 @@ class BarkerGilmoreScraper(BaseScraper):
                     description_tag = container.select_one('div.fusion-post-content-container p')
                     short_description = description_tag.get_text(strip=True) if description_tag else ""
                     
-                    full_description = self.get_event_description(url)
+                    full_description = self.get_event_description(url, listing_snippet=container)
 
                     event_id = hashlib.md5(url.encode()).hexdigest()
                     
@@ -165,20 +165,30 @@ class BarkerGilmoreScraper(BaseScraper):
         logger.info(f"Found {len(events)} events for BarkerGilmore.")
         return events
 
-    def get_event_description(self, event_url: str) -> str:
-        """Fetches the event's page and extracts the full description."""
+    def get_event_description(self, event_url: str, listing_snippet=None) -> str:
+        """Fetches the event's page and extracts the full description.
+
+        Given the event's listing snippet, the page is only fetched again
+        when that snippet changed since the last run.
+        """
         try:
-            response = self.session.get(event_url, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            content_area = soup.select_one('div.post-content')
-            if content_area:
-                return content_area.get_text(separator=' ', strip=True)
-            return ""
+            if listing_snippet is None:
+                return self._fetch_event_description(event_url)
+            return self.fetch_details(event_url, listing_snippet, lambda: self._fetch_event_description(event_url))
         except Exception as e:
             logger.error(f"Failed to fetch description from {event_url}: {e}")
             return ""
 
+    def _fetch_event_description(self, event_url: str) -> str:
+        """Fetches the event's page description; raises if the fetch fails."""
+        response = self.session.get(event_url, timeout=30)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, 'html.parser')
+        content_area = soup.select_one('div.post-content')
+        if content_area:
+            return content_area.get_text(separator=' ', strip=True)
+        return ""
+
 def main():
     """Main function to run the scraper for testing purposes."""
     logging.basicConfig(level=logging.INFO)
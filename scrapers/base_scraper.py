@@ -1,9 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-import requests
+from typing import Any, Callable, Dict, List, Optional
 import json
 import os
+from dataclasses import asdict
 from datetime import datetime, timezone
 try:
     from .models import Event
@@ -15,6 +15,16 @@ try:
     from .categorization_helper import EventCategorizer
 except ImportError:
     from categorization_helper import EventCategorizer
+try:
+    from .fingerprint_store import fingerprints_active, get_fingerprint_store, parse_unchanged
+    from .metrics import span
+    from .retry import RetryPolicy
+    from .transport import get_transport
+except ImportError:
+    from fingerprint_store import fingerprints_active, get_fingerprint_store, parse_unchanged
+    from metrics import span
+    from retry import RetryPolicy
+    from transport import get_transport
 
 # Configure logging
 logging.basicConfig(
@@ -26,38 +36,78 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 load_dotenv(os.path.join(PROJECT_ROOT, '.env.local'))
 
+# Default request headers shared by the sync and async scraper bases
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1.1 Safari/605.1.15',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
+
 class ScraperException(Exception):
     """Custom exception for scraper-related errors."""
     pass
 
 class BaseScraper(ABC):
     """Base class for all scrapers."""
+
+    # Retry policy for this source's requests; None uses retry.DEFAULT_RETRY_POLICY
+    retry_policy: Optional[RetryPolicy] = None
     
     def __init__(self, community_id: Optional[str] = None):
         self.community_id = community_id
         # Always save to scrapers/data relative to project root
         self.data_dir = os.path.join(PROJECT_ROOT, "scrapers", "data")
         os.makedirs(self.data_dir, exist_ok=True)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1.1 Safari/605.1.15',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        })
+        # Own headers and cookies, but pooled keep-alive connections and the
+        # revalidating HTTP cache shared with every other scraper in the process
+        self.session = get_transport().session(self.retry_policy)
+        self.session.headers.update(DEFAULT_HEADERS)
 
     @abstractmethod
     def get_events(self) -> List[Event]:
         """Get events from the source. Must be implemented by each scraper."""
         raise NotImplementedError("Each scraper must implement this method")
 
+    def fetch_details(self, detail_url: str, listing_snippet: Any, fetch: Callable[[], Any]) -> Any:
+        """Enrichment for a listing entry, refetched only when the entry is new or changed.
+
+        ``fetch`` should raise on failure so that nothing is stored for it.
+        """
+        if not fingerprints_active():
+            return fetch()
+        source = self.community_id or type(self).__name__
+        return get_fingerprint_store().enrich(source, detail_url, listing_snippet, fetch)
+
+    def parse_events(self, response: Any, parse: Callable[[Any], List[Event]]) -> List[Event]:
+        """``parse(response)``, skipped when the HTTP cache revalidated a body this scraper already parsed.
+
+        Reused events that ended before today are dropped.
+        """
+        parsed = []
+
+        def parse_rows(fresh_response: Any) -> List[Dict[str, Any]]:
+            parsed.append(True)
+            return [asdict(event) for event in parse(fresh_response)]
+
+        source = self.community_id or type(self).__name__
+        rows = parse_unchanged(source, response, parse_rows)
+        if not parsed:
+            today = datetime.now(timezone.utc).date().isoformat()
+            rows = [row for row in rows if str(row.get('endDate') or row.get('startDate') or today)[:10] >= today]
+        return [Event(**row) for row in rows]
+
     def save_events(self, events: List[Event], filename: str) -> None:
         """Save events to a JSON file."""
         filepath = os.path.join(self.data_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump([event.to_dict() for event in events], f, indent=2)
+        with span('serialize'):
+            payload = json.dumps([event.to_dict() for event in events], indent=2)
+        with span('persist'):
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(payload)
 
     def run(self) -> List[Event]:
         """Run the scraper and return the events."""
-        events = self.get_events()
+        with span('parse'):
+            events = self.get_events()
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         filename = f"{self.community_id}_events_{timestamp}.json"
         self.save_events(events, filename)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Offline parse benchmarks for the scrapers.
+
+Each scraper's get_events() is run against its recorded cassette in
+scrapers/fixtures/, so the timings measure parsing and categorization only,
+with no network. For every scraper the benchmark reports events/sec and peak
+traced memory. It can also compare against a saved baseline and fail when a
+parse path gets slower.
+
+    # Record cassettes from the live sites (once, or when a site changes)
+    python scrapers/benchmark_parsers.py --record --scrapers nycbar chips_network
+
+    # Benchmark offline and save a baseline
+    python scrapers/benchmark_parsers.py --output scrapers/fixtures/baseline.json
+
+    # Fail if anything is more than 25% slower than the baseline
+    python scrapers/benchmark_parsers.py --baseline scrapers/fixtures/baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+# Fix for relative imports when running as a script
+if __name__ == "__main__":
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    if __package__ is None:
+        __package__ = "scrapers"
+
+from .http_fixtures import RECORD, REPLAY, cassette, has_cassette
+from .registry import ScraperSpec, iter_specs
+
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+
+
+def record_scraper(spec: ScraperSpec) -> int:
+    """Run a scraper against the live site and save its cassette."""
+    with cassette(spec.name, mode=RECORD) as recorded:
+        events = spec.create().get_events()
+    print(f"📼 {spec.name}: recorded {sum(len(v) for v in recorded.interactions.values())} responses, {len(events)} events")
+    return len(events)
+
+
+def benchmark_scraper(spec: ScraperSpec, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """Time get_events() against the scraper's cassette."""
+    timings = []
+    event_count = 0
+    peak_bytes = 0
+    for iteration in range(repeat):
+        # A fresh scraper and cassette each time, so per-instance state doesn't help
+        with cassette(spec.name, mode=REPLAY):
+            scraper = spec.create()
+            if iteration == 0:
+                tracemalloc.start()
+            started = time.perf_counter()
+            events = scraper.get_events()
+            timings.append(time.perf_counter() - started)
+            if iteration == 0:
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        event_count = len(events)
+
+    # The first run is traced (slow) and warms imports and caches; report the best of the rest
+    best = min(timings[1:] or timings)
+    return {
+        'events': event_count,
+        'best_seconds': round(best, 6),
+        'events_per_second': round(event_count / best, 1) if best > 0 else None,
+        'peak_memory_kb': round(peak_bytes / 1024, 1),
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            tolerance: float) -> List[str]:
+    """Return a message for each scraper that got slower than baseline by more than tolerance."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get('best_seconds'):
+            continue
+        ratio = result['best_seconds'] / previous['best_seconds']
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {previous['best_seconds']:.4f}s -> {result['best_seconds']:.4f}s ({ratio:.2f}x)")
+        if result['events'] != previous.get('events'):
+            regressions.append(f"{name}: event count changed {previous.get('events')} -> {result['events']}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scraper parsing offline against recorded fixtures.")
+    parser.add_argument("--scrapers", nargs="+", default=None, help="Only these scrapers (by name)")
+    parser.add_argument("--record", action="store_true", help="Record cassettes from the live sites instead of benchmarking")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per scraper")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against a results file written by --output")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown versus the baseline, as a fraction")
+    args = parser.parse_args(argv)
+
+    # Keep scraper logging from dominating the timings
+    logging.disable(logging.INFO)
+
+    specs = list(iter_specs(args.scrapers))
+    if args.record:
+        for spec in specs:
+            try:
+                record_scraper(spec)
+            except Exception as e:
+                print(f"❌ {spec.name}: recording failed - {e}")
+        return 0
+
+    results = {}
+    for spec in specs:
+        name = spec.name
+        if not has_cassette(name):
+            if args.scrapers:
+                print(f"⚠️  {name}: no cassette, run with --record first")
+            continue
+        try:
+            results[name] = benchmark_scraper(spec, repeat=args.repeat)
+        except Exception as e:
+            print(f"❌ {name}: {e}")
+            continue
+        result = results[name]
+        print(f"⏱️  {name:<22} {result['events']:>5} events  {result['best_seconds'] * 1000:>9.1f} ms  "
+              f"{result['events_per_second'] or 0:>10.1f} ev/s  {result['peak_memory_kb']:>9.1f} KB peak")
+
+    if not results:
+        print("No cassettes found in scrapers/fixtures/; record some with --record")
+        return 1
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("❌ Parse regressions:")
+            for message in regressions:
+                print(f"   • {message}")
+            return 1
+        print("✅ No parse regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Query-plan benchmark for the Event table's hot queries.
+
+Builds a throwaway SQLite database with the Event schema from
+prisma/events.db, loads N synthetic events, and runs each hot query (the
+cleanup predicates and the upcoming-events listings) first without and then
+with the indexes from event_indexes.py. For every query it prints the
+EXPLAIN QUERY PLAN and the median time, so index choices are backed by
+numbers.
+
+    python scrapers/benchmark_queries.py --events 50000
+    python scrapers/benchmark_queries.py --events 200000 --output query_plans.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Fix for relative imports when running as a script
+if __name__ == "__main__":
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    if __package__ is None:
+        __package__ = "scrapers"
+
+from .event_indexes import create_event_indexes, drop_event_indexes
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_SCHEMA_DB = os.path.join(PROJECT_ROOT, "prisma", "events.db")
+
+DEFAULT_EVENTS = 50000
+DEFAULT_REPEAT = 7
+COMMUNITIES = 40
+
+# Share of synthetic events per status, roughly as in production
+STATUS_WEIGHTS = {
+    'APPROVED': 0.80, 'FEATURED': 0.03, 'PENDING': 0.08,
+    'CANCELLED': 0.03, 'DENIED': 0.03, 'ARCHIVED': 0.03,
+}
+
+# (name, SQL); parameters are filled in by hot_query_params()
+HOT_QUERIES: Tuple[Tuple[str, str], ...] = (
+    ("upcoming_listing",  # getAllEvents in src/lib/data-loader.ts
+     "SELECT * FROM Event WHERE status IN ('APPROVED', 'FEATURED') ORDER BY startDate"),
+    ("community_upcoming",
+     "SELECT * FROM Event WHERE communityId = :community AND startDate >= :now ORDER BY startDate"),
+    ("cleanup_past_events",
+     "SELECT COUNT(*) FROM Event WHERE endDate < :day_ago AND status IN ('APPROVED', 'FEATURED', 'PENDING')"),
+    ("cleanup_cancelled",
+     "SELECT COUNT(*) FROM Event WHERE status = 'CANCELLED' AND updatedAt < :day_ago"),
+    ("cleanup_denied",
+     "SELECT COUNT(*) FROM Event WHERE status = 'DENIED' AND updatedAt < :week_ago"),
+)
+
+
+def hot_query_params(now: datetime) -> Dict[str, Any]:
+    return {
+        'now': now.isoformat(),
+        'day_ago': (now - timedelta(days=1)).isoformat(),
+        'week_ago': (now - timedelta(days=7)).isoformat(),
+        'community': 'com_7',
+    }
+
+
+def event_schema(schema_db: str) -> List[str]:
+    """CREATE statements for the Event table and its own (unique) indexes."""
+    conn = sqlite3.connect(schema_db)
+    try:
+        rows = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE tbl_name = 'Event' AND sql IS NOT NULL ORDER BY type DESC"
+        ).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        raise SystemExit(f"No Event table in {schema_db}")
+    return [sql for (sql,) in rows]
+
+
+def synthetic_events(count: int, now: datetime, seed: int = 42):
+    """Rows spread over a year either side of now, with realistic status and community skew."""
+    rng = random.Random(seed)
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    for i in range(count):
+        start = now + timedelta(minutes=rng.randint(-365 * 24 * 60, 365 * 24 * 60))
+        end = start + timedelta(hours=rng.choice((1, 2, 3, 8)))
+        updated = min(now, start - timedelta(days=rng.randint(0, 60)))
+        community = f"com_{min(int(rng.paretovariate(1.2)) - 1, COMMUNITIES - 1)}"
+        yield (
+            f"evt_{i}", f"ext_{i}", f"Event {i}", "Synthetic event", start.isoformat(), end.isoformat(),
+            "TBD", f"https://example.com/events/{i}", rng.choices(statuses, weights)[0],
+            "benchmark", updated.isoformat(), community,
+        )
+
+
+def build_database(path: str, schema_db: str, count: int, now: datetime) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    for sql in event_schema(schema_db):
+        conn.execute(sql)
+    conn.executemany(
+        """
+        INSERT INTO Event (id, externalId, name, description, startDate, endDate, locationName, url,
+                           status, submittedBy, updatedAt, communityId)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        synthetic_events(count, now),
+    )
+    conn.commit()
+    return conn
+
+
+def query_plan(conn: sqlite3.Connection, sql: str, params: Dict[str, Any]) -> List[str]:
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def time_query(conn: sqlite3.Connection, sql: str, params: Dict[str, Any], repeat: int) -> Tuple[float, int]:
+    """Median seconds over ``repeat`` runs, and the number of rows returned."""
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(conn.execute(sql, params).fetchall())
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), rows
+
+
+def run_benchmark(conn: sqlite3.Connection, params: Dict[str, Any], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {name: {} for name, _ in HOT_QUERIES}
+    for variant, prepare in (('without_indexes', drop_event_indexes), ('with_indexes', create_event_indexes)):
+        prepare(conn)
+        conn.execute("ANALYZE")
+        for name, sql in HOT_QUERIES:
+            seconds, rows = time_query(conn, sql, params, repeat)
+            results[name][variant] = {
+                'median_ms': round(seconds * 1000, 3),
+                'rows': rows,
+                'plan': query_plan(conn, sql, params),
+            }
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    for name, variants in results.items():
+        before, after = variants['without_indexes'], variants['with_indexes']
+        speedup = before['median_ms'] / after['median_ms'] if after['median_ms'] else float('inf')
+        print(f"\n⏱️  {name}: {before['median_ms']:.2f} ms -> {after['median_ms']:.2f} ms "
+              f"({speedup:.1f}x, {after['rows']} rows)")
+        for variant, label in (('without_indexes', 'before'), ('with_indexes', 'after')):
+            for step in variants[variant]['plan']:
+                print(f"     {label:<6} {step}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Show query plans and timings for the Event table's hot queries.")
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS, help="Synthetic events to load")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per query; the median is reported")
+    parser.add_argument("--schema-db", default=DEFAULT_SCHEMA_DB, help="Database to copy the Event schema from")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        conn = build_database(os.path.join(tmp, "bench.db"), args.schema_db, args.events, now)
+        print(f"📦 Loaded {args.events} synthetic events in {time.perf_counter() - started:.1f}s")
+        try:
+            results = run_benchmark(conn, hot_query_params(now), args.repeat)
+        finally:
+            conn.close()
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'events': args.events, 'queries': results}, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
@@ -23,7 +22,7 @@ class BronxBarScraper(BaseScraper):
         url = "https://www.bronxbar.com/calendar/"
         
         try:
-            response = requests.get(url, timeout=30, headers={
+            response = self.session.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             })
             response.raise_for_status()
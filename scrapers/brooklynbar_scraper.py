@@ -21,62 +21,71 @@ class BrooklynBarScraper(BaseScraper):
         self.events_url = f"{self.base_url}/?pg=events&evAction=listAll"
         self.url = self.events_url
 
-    def get_event_details(self, event_id: str) -> dict:
-        """Fetch detailed information for a specific event."""
+    def get_event_details(self, event_id: str, listing_snippet=None) -> dict:
+        """Fetch detailed information for a specific event.
+
+        Given the event's listing snippet, the detail page is only fetched
+        again when that snippet changed since the last run.
+        """
         detail_url = f"{self.base_url}/?pg=events&evAction=showDetail&eid={event_id}&evSubAction=listAll"
         try:
-            response = self.session.get(detail_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            details = {}
-            
-            # Extract full description
-            description_parts = []
-            content_divs = soup.find_all('div')
-            for div in content_divs:
-                text = div.get_text(strip=True)
-                if text and len(text) > 50:  # Look for substantial content
-                    description_parts.append(text)
-            
-            if description_parts:
-                details['full_description'] = ' '.join(description_parts[:3])  # Take first 3 substantial parts
-            
-            # Extract CLE credits
-            cle_match = re.search(r'(\d+(?:\.\d+)?)\s+CLE\s+CREDITS?', soup.get_text(), re.IGNORECASE)
-            if cle_match:
-                details['cle_credits'] = float(cle_match.group(1))
-            
-            # Extract location information
-            location_text = soup.get_text()
-            if 'Brooklyn Bar Association' in location_text:
-                details['location'] = 'Brooklyn Bar Association, 123 Remsen Street, Brooklyn, NY 11201'
-            elif '123 Remsen Street' in location_text:
-                details['location'] = 'Brooklyn Bar Association, 123 Remsen Street, Brooklyn, NY 11201'
-            elif 'BBA Building' in location_text:
-                details['location'] = 'BBA Building, 123 Remsen Street, Brooklyn, NY 11201'
-            
-            # Extract registration status
-            if 'registration for this event is closed' in soup.get_text().lower():
-                details['registration_status'] = 'closed'
-            elif 'register' in soup.get_text().lower():
-                details['registration_status'] = 'open'
-            
-            # Extract location
-            location_match = re.search(r'at\s+([^,\n]+)', soup.get_text())
-            if location_match:
-                details['location'] = location_match.group(1).strip()
-            
-            # Extract pricing info
-            if 'students free' in soup.get_text().lower():
-                details['student_pricing'] = 'free'
-            
-            return details
-            
+            if listing_snippet is None:
+                return self._fetch_event_details(detail_url)
+            return self.fetch_details(detail_url, listing_snippet, lambda: self._fetch_event_details(detail_url))
         except Exception as e:
             logger.warning(f"Error fetching details for event {event_id}: {e}")
             return {}
 
+    def _fetch_event_details(self, detail_url: str) -> dict:
+        """Fetch and parse an event's detail page; raises if the fetch fails."""
+        response = self.session.get(detail_url)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        details = {}
+        
+        # Extract full description
+        description_parts = []
+        content_divs = soup.find_all('div')
+        for div in content_divs:
+            text = div.get_text(strip=True)
+            if text and len(text) > 50:  # Look for substantial content
+                description_parts.append(text)
+        
+        if description_parts:
+            details['full_description'] = ' '.join(description_parts[:3])  # Take first 3 substantial parts
+        
+        # Extract CLE credits
+        cle_match = re.search(r'(\d+(?:\.\d+)?)\s+CLE\s+CREDITS?', soup.get_text(), re.IGNORECASE)
+        if cle_match:
+            details['cle_credits'] = float(cle_match.group(1))
+        
+        # Extract location information
+        location_text = soup.get_text()
+        if 'Brooklyn Bar Association' in location_text:
+            details['location'] = 'Brooklyn Bar Association, 123 Remsen Street, Brooklyn, NY 11201'
+        elif '123 Remsen Street' in location_text:
+            details['location'] = 'Brooklyn Bar Association, 123 Remsen Street, Brooklyn, NY 11201'
+        elif 'BBA Building' in location_text:
+            details['location'] = 'BBA Building, 123 Remsen Street, Brooklyn, NY 11201'
+        
+        # Extract registration status
+        if 'registration for this event is closed' in soup.get_text().lower():
+            details['registration_status'] = 'closed'
+        elif 'register' in soup.get_text().lower():
+            details['registration_status'] = 'open'
+        
+        # Extract location
+        location_match = re.search(r'at\s+([^,\n]+)', soup.get_text())
+        if location_match:
+            details['location'] = location_match.group(1).strip()
+        
+        # Extract pricing info
+        if 'students free' in soup.get_text().lower():
+            details['student_pricing'] = 'free'
+        
+        return details
+
     def determine_event_type(self, name: str, category: List[str], description: str) -> str:
         """Determine the event type based on name, category, and description."""
         text_to_check = f"{name} {' '.join(category or [])} {description or ''}".lower()
@@ -156,7 +165,7 @@ class BrooklynBarScraper(BaseScraper):
                     details = {}
                     if event_id:
                         logger.info(f"Fetching details for event {event_id}")
-                        details = self.get_event_details(event_id)
+                        details = self.get_event_details(event_id, listing_snippet=div)
                     
                     # Date and time
                     date_text = ""
@@ -239,7 +248,7 @@ class BrooklynBarScraper(BaseScraper):
                         endDate=endDate,
                         locationId=None,
                         locationName=details.get('location', 'TBD'),
-                        communityId="com_brooklynbar",
+                        communityId=self.community_id,
                         image=None,
                         price=None,
                         metadata=metadata,
@@ -0,0 +1,146 @@
+"""
+Chunked, compressed uploads of scraped events to the app's bulk API.
+
+A scraper's events are split into chunks of ``chunk_size`` and posted to
+``/api/events/bulk`` with gzip-compressed JSON bodies, with up to
+``max_in_flight`` chunks in flight at once. Each chunk carries an
+``Idempotency-Key`` derived from its content, and the API upserts by
+externalId, so a chunk retried after a timeout or a 5xx is not applied twice.
+A chunk that still fails is reported in the errors and does not affect the
+other chunks.
+
+    uploader = BulkUploader("http://localhost:3000/api/events/bulk", secret)
+    result = uploader.upload([event.to_dict() for event in events], "nycbar")
+    print(result.created, result.updated, result.errors)
+"""
+
+import contextvars
+import gzip
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+
+try:
+    from .retry import IDEMPOTENT_METHODS, RetryPolicy
+    from .transport import get_session
+except ImportError:
+    from retry import IDEMPOTENT_METHODS, RetryPolicy
+    from transport import get_session
+
+logger = logging.getLogger(__name__)
+
+# Events per request, and how many requests may be in flight at once
+DEFAULT_CHUNK_SIZE = int(os.environ.get("SCRAPER_UPLOAD_CHUNK_SIZE", "100"))
+DEFAULT_MAX_IN_FLIGHT = 3
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+# Chunks carry an idempotency key, so their POSTs are safe to retry. The API
+# writes events one by one, so a chunk gets a longer timeout than a scrape.
+UPLOAD_RETRY_POLICY = RetryPolicy(
+    max_attempts=4,
+    timeout=60.0,
+    total_budget=180.0,
+    retry_methods=IDEMPOTENT_METHODS | {"POST"},
+)
+
+
+class UploadResult:
+    """Created, updated and unchanged counts and errors merged over all chunks."""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.errors: List[str] = []
+        self.chunks = 0
+        self.failed_chunks = 0
+
+    @property
+    def success(self) -> bool:
+        return self.failed_chunks == 0
+
+    def add_chunk(self, response: Dict[str, Any]) -> None:
+        self.chunks += 1
+        self.created += response.get('created', 0)
+        self.updated += response.get('updated', 0)
+        self.unchanged += response.get('unchanged', 0)
+        self.errors.extend(response.get('errors') or [])
+
+    def add_failure(self, index: int, error: str) -> None:
+        self.chunks += 1
+        self.failed_chunks += 1
+        self.errors.append(f"Chunk {index} failed: {error}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'errors': self.errors,
+            'chunks': self.chunks,
+            'failed_chunks': self.failed_chunks,
+        }
+
+
+def idempotency_key(scraper: str, chunk: List[Dict[str, Any]]) -> str:
+    """Key for a chunk that stays the same when the same events are sent again."""
+    payload = json.dumps([scraper, chunk], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+class BulkUploader:
+    """Posts events to the bulk API in parallel, compressed, retried chunks."""
+
+    def __init__(self, url: str, secret: Optional[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, compress: bool = True,
+                 session: Optional[requests.Session] = None):
+        self.url = url
+        self.secret = secret
+        self.chunk_size = max(1, chunk_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.compress = compress
+        self.session = session or get_session(UPLOAD_RETRY_POLICY)
+
+    def upload(self, events: List[Dict[str, Any]], scraper: str) -> UploadResult:
+        """Upload event dicts for one scraper; never raises for a failed chunk."""
+        chunks = [events[i:i + self.chunk_size] for i in range(0, len(events), self.chunk_size)]
+        result = UploadResult()
+        if not chunks:
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(chunks)),
+                                thread_name_prefix="upload") as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._post_chunk, index, chunk, scraper)
+                for index, chunk in enumerate(chunks)
+            ]
+            for index, future in enumerate(futures):
+                try:
+                    result.add_chunk(future.result())
+                except (requests.RequestException, ValueError) as e:
+                    logger.warning(f"Uploading chunk {index} of {scraper} failed: {e}")
+                    result.add_failure(index, str(e))
+        return result
+
+    def _post_chunk(self, index: int, chunk: List[Dict[str, Any]], scraper: str) -> Dict[str, Any]:
+        body = json.dumps({'events': chunk, 'scraper': scraper, 'secret': self.secret}).encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.secret}',
+            'Idempotency-Key': idempotency_key(scraper, chunk),
+        }
+        if self.compress and len(body) >= MIN_COMPRESS_BYTES:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+
+        response = self.session.post(self.url, data=body, headers=headers)
+        if response.status_code != 200:
+            raise requests.HTTPError(f"{response.status_code} - {response.text[:500]}", response=response)
+        logger.debug(f"Uploaded chunk {index} of {scraper} ({len(chunk)} events, {len(body)} bytes)")
+        return response.json()
@@ -46,7 +46,7 @@ class CardozoLawScraper(BaseScraper):
         for url in self.urls:
             logger.info(f"Fetching events from {url}")
             try:
-                response = requests.get(url, headers=self.headers)
+                response = self.session.get(url, headers=self.headers)
                 response.raise_for_status()
                 
                 # Save debug file for the first URL
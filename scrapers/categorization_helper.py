@@ -3,7 +3,55 @@ Categorization helper for legal event scrapers.
 Provides common functionality for tagging and categorizing events.
 """
 
-from typing import List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import FrozenSet, List
+
+try:
+    from .metrics import span
+    from .phrase_matcher import PhraseMatcher
+except ImportError:
+    from metrics import span
+    from phrase_matcher import PhraseMatcher
+
+
+@dataclass
+class EventAnalysis:
+    """Everything EventCategorizer derives from one scan of an event's text."""
+    practice_areas: List[str] = field(default_factory=list)
+    is_cle: bool = False
+    is_networking: bool = False
+    is_webinar: bool = False
+
+    @property
+    def tags(self) -> List[str]:
+        tags = []
+        if self.is_cle:
+            tags.append('CLE')
+        if self.is_networking:
+            tags.append('Networking')
+        if self.is_webinar:
+            tags.append('Webinar')
+        return tags
+
+    @property
+    def event_type(self) -> str:
+        if self.is_cle:
+            return 'CLE'
+        if self.is_webinar:
+            return 'Webinar'
+        if self.is_networking:
+            return 'Networking'
+        return 'General'
+
+    @property
+    def categories(self) -> List[str]:
+        categories = list(self.practice_areas)
+        if self.is_cle:
+            categories.append('CLE')
+        if self.is_networking:
+            categories.append('Networking')
+        return categories
 
 
 class EventCategorizer:
@@ -40,61 +88,65 @@ class EventCategorizer:
     WEBINAR_INDICATORS = [
         'webinar', 'webcast', 'virtual event', 'online event', 'virtual seminar', 'online presentation'
     ]
+
+    # One matcher over every indicator list, built on first use
+    _matcher = None
+
+    @classmethod
+    def _get_matcher(cls) -> PhraseMatcher:
+        if cls._matcher is None:
+            cls._matcher = PhraseMatcher(
+                cls.PRACTICE_AREAS + cls.CLE_INDICATORS + cls.NETWORKING_INDICATORS + cls.WEBINAR_INDICATORS
+            )
+        return cls._matcher
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _find_phrases(cls, text: str) -> FrozenSet[str]:
+        # Memoized so scrapers calling several of the wrappers below scan once
+        return frozenset(cls._get_matcher().find(text))
+
+    @classmethod
+    def analyze(cls, title: str, description: str = "") -> EventAnalysis:
+        """Scan title and description once and derive practice areas, tags and event type."""
+        with span('categorize'):
+            found = cls._find_phrases(f"{title} {description or ''}".lower())
+            return EventAnalysis(
+                practice_areas=[area.title() for area in cls.PRACTICE_AREAS if area in found],
+                is_cle=any(indicator in found for indicator in cls.CLE_INDICATORS),
+                is_networking=any(indicator in found for indicator in cls.NETWORKING_INDICATORS),
+                is_webinar=any(indicator in found for indicator in cls.WEBINAR_INDICATORS),
+            )
     
     @classmethod
     def extract_practice_areas(cls, title: str, description: str = "") -> List[str]:
         """Extract practice areas from event title and description."""
-        categories = []
-        text = f"{title} {description or ''}".lower()
-        
-        for area in cls.PRACTICE_AREAS:
-            if area in text:
-                categories.append(area.title())
-        
-        return categories
+        return cls.analyze(title, description).practice_areas
     
     @classmethod
     def is_cle_event(cls, title: str, description: str = "") -> bool:
         """Determine if this is a CLE event."""
-        text = f"{title} {description or ''}".lower()
-        return any(indicator in text for indicator in cls.CLE_INDICATORS)
+        return cls.analyze(title, description).is_cle
     
     @classmethod
     def is_networking_event(cls, title: str, description: str = "") -> bool:
         """Determine if this is a networking event."""
-        text = f"{title} {description or ''}".lower()
-        return any(indicator in text for indicator in cls.NETWORKING_INDICATORS)
+        return cls.analyze(title, description).is_networking
     
     @classmethod
     def is_webinar(cls, title: str, description: str = "") -> bool:
         """Determine if this is a webinar."""
-        text = f"{title} {description or ''}".lower()
-        return any(indicator in text for indicator in cls.WEBINAR_INDICATORS)
+        return cls.analyze(title, description).is_webinar
     
     @classmethod
     def get_tags(cls, title: str, description: str = "") -> List[str]:
         """Extract relevant tags from event details."""
-        tags = []
-        if cls.is_cle_event(title, description):
-            tags.append('CLE')
-        if cls.is_networking_event(title, description):
-            tags.append('Networking')
-        if cls.is_webinar(title, description):
-            tags.append('Webinar')
-        # This can be expanded to extract more tags
-        return tags
+        return cls.analyze(title, description).tags
     
     @classmethod
     def get_event_type(cls, title: str, description: str = "") -> str:
         """Determine the primary type of the event."""
-        if cls.is_cle_event(title, description):
-            return 'CLE'
-        if cls.is_webinar(title, description):
-            return 'Webinar'
-        if cls.is_networking_event(title, description):
-            return 'Networking'
-        # Can be expanded with more sophisticated logic
-        return 'General'
+        return cls.analyze(title, description).event_type
     
     @classmethod
     def categorize_event(cls, title: str, description: str = "", 
@@ -112,16 +164,8 @@ class EventCategorizer:
         """
         categories = list(base_categories) if base_categories else []
         
-        # Add practice areas
-        practice_areas = cls.extract_practice_areas(title, description)
-        categories.extend(practice_areas)
-        
-        # Add event type tags
-        if cls.is_cle_event(title, description):
-            categories.append('CLE')
-        
-        if cls.is_networking_event(title, description):
-            categories.append('Networking')
+        # Practice areas, then CLE / Networking tags
+        categories.extend(cls.analyze(title, description).categories)
         
         # Remove duplicates while preserving order
         return list(dict.fromkeys(categories))
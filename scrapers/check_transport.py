@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Fail when scraper code bypasses the shared HTTP transport.
+
+Calls such as ``requests.get(...)``, ``requests.Session()`` or
+``(session or requests).get(...)`` open their own connections, skip the HTTP
+cache and are missing from the run metrics. Scrapers should use
+``self.session`` or ``transport.get_session()`` instead.
+
+    python scrapers/check_transport.py            # check every module in scrapers/
+    python scrapers/check_transport.py a.py b.py  # check specific files
+"""
+
+import ast
+import os
+import sys
+from typing import Iterable, List, Optional
+
+SCRAPERS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Module-level requests functions that each open a new session
+REQUESTS_CALLS = {'get', 'post', 'put', 'patch', 'delete', 'head', 'options', 'request', 'Session', 'session'}
+
+# Modules that legitimately talk to requests directly
+ALLOWED_MODULES = {
+    'transport.py',         # builds the shared sessions
+    'http_cache.py',        # adapter underneath the transport
+    'http_fixtures.py',     # patches requests.Session.send for record/replay
+    'metrics.py',           # defines ScraperSession
+    'check_transport.py',
+    'cleanup_via_api.py',   # admin script calling the app's API
+}
+
+
+def _is_requests(node: ast.AST) -> bool:
+    """``requests``, or an ``a or requests`` fallback expression."""
+    if isinstance(node, ast.Name):
+        return node.id == 'requests'
+    if isinstance(node, ast.BoolOp):
+        return any(_is_requests(value) for value in node.values)
+    return False
+
+
+def find_violations(source: str, filename: str = '<string>') -> List[str]:
+    """Return one message per direct use of the requests module's request functions."""
+    violations = []
+    for node in ast.walk(ast.parse(source, filename=filename)):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if node.func.attr in REQUESTS_CALLS and _is_requests(node.func.value):
+                violations.append(f"{filename}:{node.lineno}: requests.{node.func.attr}() bypasses the shared transport; "
+                                  f"use self.session or transport.get_session()")
+        elif isinstance(node, ast.ImportFrom) and node.module == 'requests':
+            for alias in node.names:
+                if alias.name in REQUESTS_CALLS:
+                    violations.append(f"{filename}:{node.lineno}: 'from requests import {alias.name}' bypasses "
+                                      f"the shared transport")
+    return violations
+
+
+def iter_default_paths() -> Iterable[str]:
+    for name in sorted(os.listdir(SCRAPERS_DIR)):
+        if name.endswith('.py') and name not in ALLOWED_MODULES:
+            yield os.path.join(SCRAPERS_DIR, name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    paths = (argv if argv is not None else sys.argv[1:]) or list(iter_default_paths())
+    violations = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        try:
+            violations.extend(find_violations(source, os.path.relpath(path)))
+        except SyntaxError as e:
+            # A module that doesn't parse can't be checked, so it fails the lint too
+            violations.append(f"{os.path.relpath(path)}:{e.lineno}: does not parse ({e.msg})")
+
+    for message in violations:
+        print(f"❌ {message}")
+    if violations:
+        print(f"\n{len(violations)} problem(s) found")
+        return 1
+    print(f"✅ {len(paths)} modules use the shared transport")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
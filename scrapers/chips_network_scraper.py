@@ -9,7 +9,7 @@ ChIPs is a nonprofit organization focused on advancing and connecting women in t
 
 import logging
 import requests
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from bs4 import BeautifulSoup
 import re
@@ -19,11 +19,16 @@ import json
 from .base_scraper import BaseScraper
 from .models import Event
 from .categorization_helper import EventCategorizer
+from .pagination import Page, Paginator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How far ahead to fetch events, and the API page size
+DAYS_AHEAD = 30
+PER_PAGE = 50
+
 class ChIPsNetworkScraper(BaseScraper):
     """Scraper for ChIPs Network events from their JSON API."""
     
@@ -52,25 +57,31 @@ class ChIPsNetworkScraper(BaseScraper):
                 'query[order]': 'asc',
                 'query[with_location]': '',
                 'query[gte_start_date]': '',
-                'query[active_during_next_x_days]': '30',  # Get events for next 30 days
-                'page': '1',
-                'per_page': '50'  # Get more events per page
+                'query[active_during_next_x_days]': str(DAYS_AHEAD),
+                'per_page': str(PER_PAGE)
             }
             
-            # Fetch the events data
-            response = self.session.get(
-                self.api_url, 
-                params=params, 
-                headers=headers, 
-                timeout=30
-            )
-            response.raise_for_status()
+            def fetch_page(page: int) -> Page:
+                response = self.session.get(
+                    self.api_url, 
+                    params={**params, 'page': str(page)}, 
+                    headers=headers, 
+                    timeout=30
+                )
+                response.raise_for_status()
+                data = response.json()
+                return Page(data.get('events', []), total_items=data.get('total_items'))
             
-            data = response.json()
-            logger.info(f"Successfully fetched {data.get('total_items', 0)} total events from ChIPs Network")
+            # Events come sorted by start date, so stop at the first one past the horizon
+            paginator = Paginator(
+                fetch_page,
+                per_page=PER_PAGE,
+                item_start=self._event_start,
+                horizon=datetime.now(timezone.utc) + timedelta(days=DAYS_AHEAD),
+            )
             
             events = []
-            for event_data in data.get('events', []):
+            for event_data in paginator:
                 try:
                     event = self._parse_event(event_data)
                     if event:
@@ -79,6 +90,7 @@ class ChIPsNetworkScraper(BaseScraper):
                     logger.warning(f"Failed to parse event '{event_data.get('title', 'Unknown')}': {e}")
                     continue
             
+            logger.info(f"Fetched {paginator.pages_fetched} page(s) of {paginator.total_items or 0} total events from ChIPs Network")
             logger.info(f"Successfully parsed {len(events)} events from ChIPs Network")
             return events
             
@@ -204,6 +216,11 @@ class ChIPsNetworkScraper(BaseScraper):
             content = f"chips_{title}"
             return f"chips_{hashlib.md5(content.encode()).hexdigest()[:12]}"
     
+    def _event_start(self, event_data: Dict[str, Any]) -> Optional[datetime]:
+        """Start time of a raw API event, for the paginator's horizon check."""
+        start_date = event_data.get('start_date')
+        return self._parse_datetime(start_date, event_data.get('timezone', 'UTC')) if start_date else None
+    
     def _parse_datetime(self, date_str: str, timezone_str: str) -> Optional[datetime]:
         """Parse datetime string with timezone information."""
         try:
@@ -8,12 +8,18 @@ The script will:
 - Delete events that ended more than 1 day ago
 - Delete cancelled events that were cancelled more than 1 day ago
 - Archive denied events that are more than 1 week old
+
+Rows are deleted and archived in primary-key batches (--batch-size, default
+1000) with a short pause between batches, so no single statement holds locks
+on the Event table for long. --dry-run only reports what would be cleaned up.
 """
 
+import argparse
+import asyncio
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 # Add the parent directory to the path so we can import from scrapers
@@ -35,9 +41,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows deleted or archived per statement, and seconds to pause between batches
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_BATCH_PAUSE = 0.1
+
+# Statuses of events that are deleted once they have ended
+PAST_EVENT_STATUSES = ['APPROVED', 'FEATURED', 'PENDING']
+
 class EventCleanup:
-    def __init__(self):
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, batch_pause: float = DEFAULT_BATCH_PAUSE,
+                 dry_run: bool = False):
         self.prisma = Prisma()
+        self.batch_size = max(1, batch_size)
+        self.batch_pause = batch_pause
+        self.dry_run = dry_run
         self.deleted_count = 0
         self.archived_count = 0
         self.errors = []
@@ -58,6 +75,27 @@ class EventCleanup:
             logger.info("✅ Disconnected from database")
         except Exception as e:
             logger.error(f"❌ Error disconnecting from database: {e}")
+
+    @staticmethod
+    def cleanup_filters(now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """Where clauses for past, old cancelled and old denied events, by stats key"""
+        now = now or datetime.now()
+        one_day_ago = now - timedelta(days=1)
+        one_week_ago = now - timedelta(days=7)
+        return {
+            'pastEvents': {
+                'endDate': {'lt': one_day_ago},
+                'status': {'in': PAST_EVENT_STATUSES},
+            },
+            'oldCancelledEvents': {
+                'status': 'CANCELLED',
+                'updatedAt': {'lt': one_day_ago},
+            },
+            'oldDeniedEvents': {
+                'status': 'DENIED',
+                'updatedAt': {'lt': one_week_ago},
+            },
+        }
     
     async def cleanup_old_events(self) -> Tuple[int, int, List[str]]:
         """Main cleanup function"""
@@ -65,59 +103,33 @@ class EventCleanup:
         logger.info(f"📅 Current time: {datetime.now().isoformat()}")
         
         try:
-            # Calculate time thresholds
-            one_day_ago = datetime.now() - timedelta(days=1)
-            one_week_ago = datetime.now() - timedelta(days=7)
-            
+            filters = self.cleanup_filters()
+
+            if self.dry_run:
+                stats = await self.get_cleanup_stats(filters)
+                logger.info("\n🧪 Dry run, no events were changed. Would clean up:")
+                logger.info(f"   Delete past events: {stats['pastEvents']}")
+                logger.info(f"   Delete old cancelled events: {stats['oldCancelledEvents']}")
+                logger.info(f"   Archive old denied events: {stats['oldDeniedEvents']}")
+                return self.deleted_count, self.archived_count, self.errors
+
             # Delete events that ended more than a day ago
-            past_events_result = await self.prisma.event.delete_many(
-                where={
-                    'endDate': {
-                        'lt': one_day_ago
-                    },
-                    'status': {
-                        'in': ['APPROVED', 'FEATURED', 'PENDING']
-                    }
-                }
-            )
-            
+            past_events_result = await self._delete_in_batches(filters['pastEvents'])
             self.deleted_count += past_events_result
             logger.info(f"✅ Deleted {past_events_result} past events")
             
             # Delete cancelled events that were cancelled more than a day ago
-            cancelled_events_result = await self.prisma.event.delete_many(
-                where={
-                    'status': 'CANCELLED',
-                    'updatedAt': {
-                        'lt': one_day_ago
-                    }
-                }
-            )
-            
+            cancelled_events_result = await self._delete_in_batches(filters['oldCancelledEvents'])
             self.deleted_count += cancelled_events_result
             logger.info(f"✅ Deleted {cancelled_events_result} old cancelled events")
             
             # Archive denied events that are more than a week old
-            denied_events_result = await self.prisma.event.update_many(
-                where={
-                    'status': 'DENIED',
-                    'updatedAt': {
-                        'lt': one_week_ago
-                    }
-                },
-                data={
-                    'status': 'ARCHIVED',
-                    'updatedAt': datetime.now(),
-                    'updatedBy': 'system@cleanup-python',
-                    'notes': 'Auto-archived old denied event via Python cleanup script'
-                }
-            )
-            
+            denied_events_result = await self._archive_in_batches(filters['oldDeniedEvents'])
             self.archived_count += denied_events_result
             logger.info(f"📦 Archived {denied_events_result} old denied events")
             
             # Get cleanup statistics
-            stats = await self.get_cleanup_stats()
+            stats = await self.get_cleanup_stats(filters)
             logger.info("\n📊 Current cleanup statistics:")
             logger.info(f"   Past events: {stats['pastEvents']}")
             logger.info(f"   Old cancelled events: {stats['oldCancelledEvents']}")
@@ -133,60 +145,80 @@ class EventCleanup:
             self.errors.append(error_msg)
         
         return self.deleted_count, self.archived_count, self.errors
+
+    async def _next_batch(self, where: Dict[str, Any]) -> List[str]:
+        """Ids of the next batch of events matching where, in primary-key order"""
+        events = await self.prisma.event.find_many(where=where, take=self.batch_size, order={'id': 'asc'})
+        return [event.id for event in events]
+
+    async def _delete_in_batches(self, where: Dict[str, Any]) -> int:
+        """Delete the events matching where, one batch of ids per statement"""
+        deleted = 0
+        while True:
+            ids = await self._next_batch(where)
+            if not ids:
+                return deleted
+            deleted += await self.prisma.event.delete_many(where={'id': {'in': ids}})
+            if len(ids) < self.batch_size:
+                return deleted
+            await asyncio.sleep(self.batch_pause)
+
+    async def _archive_in_batches(self, where: Dict[str, Any]) -> int:
+        """Archive the events matching where; archived rows no longer match, so each batch is new"""
+        archived = 0
+        while True:
+            ids = await self._next_batch(where)
+            if not ids:
+                return archived
+            archived += await self.prisma.event.update_many(
+                where={'id': {'in': ids}},
+                data={
+                    'status': 'ARCHIVED',
+                    'updatedAt': datetime.now(),
+                    'updatedBy': 'system@cleanup-python',
+                    'notes': 'Auto-archived old denied event via Python cleanup script'
+                }
+            )
+            if len(ids) < self.batch_size:
+                return archived
+            await asyncio.sleep(self.batch_pause)
     
-    async def get_cleanup_stats(self) -> Dict[str, int]:
+    async def get_cleanup_stats(self, filters: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, int]:
         """Get statistics about events that can be cleaned up"""
+        stats = {key: 0 for key in ('pastEvents', 'oldCancelledEvents', 'oldDeniedEvents')}
         try:
-            one_day_ago = datetime.now() - timedelta(days=1)
-            one_week_ago = datetime.now() - timedelta(days=7)
-            
-            # Get counts for different types of events that can be cleaned up
-            past_events = await self.prisma.event.count(
-                where={
-                    'endDate': {
-                        'lt': one_day_ago
-                    },
-                    'status': {
-                        'in': ['APPROVED', 'FEATURED', 'PENDING']
-                    }
-                }
-            )
-            
-            old_cancelled_events = await self.prisma.event.count(
-                where={
-                    'status': 'CANCELLED',
-                    'updatedAt': {
-                        'lt': one_day_ago
-                    }
-                }
-            )
-            
-            old_denied_events = await self.prisma.event.count(
-                where={
-                    'status': 'DENIED',
-                    'updatedAt': {
-                        'lt': one_week_ago
-                    }
-                }
+            filters = filters or self.cleanup_filters()
+
+            # The three groups have disjoint statuses, so one count grouped by
+            # status over their union gives all of them in a single query
+            groups = await self.prisma.event.group_by(
+                by=['status'],
+                where={'OR': list(filters.values())},
+                count=True,
             )
-            
-            return {
-                'pastEvents': past_events,
-                'oldCancelledEvents': old_cancelled_events,
-                'oldDeniedEvents': old_denied_events
-            }
+            for group in groups:
+                count = group['_count']['_all']
+                if group['status'] in PAST_EVENT_STATUSES:
+                    stats['pastEvents'] += count
+                elif group['status'] == 'CANCELLED':
+                    stats['oldCancelledEvents'] += count
+                elif group['status'] == 'DENIED':
+                    stats['oldDeniedEvents'] += count
+            return stats
             
         except Exception as e:
             logger.error(f"Error getting cleanup stats: {e}")
-            return {
-                'pastEvents': 0,
-                'oldCancelledEvents': 0,
-                'oldDeniedEvents': 0
-            }
+            return stats
 
 async def main():
     """Main function to run the cleanup"""
-    cleanup = EventCleanup()
+    parser = argparse.ArgumentParser(description="Delete past and cancelled events and archive old denied events.")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'Events deleted or archived per statement (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--batch-pause', type=float, default=DEFAULT_BATCH_PAUSE, help=f'Seconds to pause between batches (default: {DEFAULT_BATCH_PAUSE})')
+    parser.add_argument('--dry-run', action='store_true', help='Only report how many events would be cleaned up')
+    args = parser.parse_args()
+
+    cleanup = EventCleanup(batch_size=args.batch_size, batch_pause=args.batch_pause, dry_run=args.dry_run)
     
     try:
         await cleanup.connect()
@@ -207,5 +239,4 @@ async def main():
         await cleanup.disconnect()
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main()) 
\ No newline at end of file
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Event cleanup for the local SQLite database.
+
+Runs the same operations as the production ``/api/admin/cleanup`` endpoint
+(see cleanup_via_api.py) directly against ``prisma/events.db`` with sqlite3,
+so the local database used by ScraperManagerDB is pruned too:
+
+- ``past``: delete APPROVED, FEATURED and PENDING events that ended over a day ago
+- ``cancelled``: delete CANCELLED events last updated over a day ago
+- ``denied``: archive DENIED events last updated over a week ago
+- ``corrupted``: delete events with the corrupted 2025-07-22 16:14 timestamps
+
+Rows are removed in batches of ``batch_size`` ids, one short transaction per
+batch, together with their UserEvent stars (ON DELETE CASCADE in the schema,
+but SQLite foreign keys are off on this connection) and stored content hashes.
+With an archive (``--archive``), past events are appended to the compressed
+month files of event_archive.py before they are deleted, so their history is
+kept outside the Event table. Afterwards free pages are returned to the filesystem: the first cleanup
+switches the database to incremental auto-vacuum with one full VACUUM, later
+ones only run ``PRAGMA incremental_vacuum``.
+
+    python scrapers/cleanup_sqlite.py --operations past cancelled
+    python scrapers/cleanup_sqlite.py --archive
+    python -m scrapers.cron_handler_db --cleanup
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+# Fix for relative imports when running as a script
+if __name__ == "__main__":
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    if __package__ is None:
+        __package__ = "scrapers"
+
+try:
+    from .event_db import EventDatabase
+except ImportError:
+    from event_db import EventDatabase
+
+if TYPE_CHECKING:
+    from .event_archive import EventArchive
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_DB_PATH = os.path.join(PROJECT_ROOT, "prisma", "events.db")
+
+OPERATIONS = ('past', 'cancelled', 'denied', 'corrupted')
+
+# Rows per transaction, and seconds to pause between transactions
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_BATCH_PAUSE = 0.01
+
+# Events whose startDate fell in this window were written with corrupted timestamps
+CORRUPTED_START = "2025-07-22T16:14:00"
+CORRUPTED_END = "2025-07-22T16:15:00.000+00:00"
+
+# Statuses are literals, not parameters, so SQLite can use the partial indexes
+# from event_indexes.py for the cancelled and denied cleanups
+SELECT_BATCH_SQL = {
+    'past': """
+        SELECT id FROM Event
+        WHERE endDate < :day_ago AND status IN ('APPROVED', 'FEATURED', 'PENDING')
+        LIMIT :limit
+    """,
+    'cancelled': """
+        SELECT id FROM Event WHERE status = 'CANCELLED' AND updatedAt < :day_ago LIMIT :limit
+    """,
+    'denied': """
+        SELECT id FROM Event WHERE status = 'DENIED' AND updatedAt < :week_ago LIMIT :limit
+    """,
+    'corrupted': """
+        SELECT id FROM Event WHERE startDate >= :corrupted_start AND startDate <= :corrupted_end LIMIT :limit
+    """,
+}
+
+# Tables whose rows (keyed by eventId) go with a deleted event
+DEPENDENT_TABLES = ('UserEvent', 'EventContentHash')
+
+# Result keys, as returned by the cleanup API
+RESULT_KEYS = {
+    'past': 'deletedPastEvents',
+    'cancelled': 'deletedCancelledEvents',
+    'denied': 'archivedDeniedEvents',
+    'corrupted': 'deletedCorruptedEvents',
+}
+
+
+def cutoffs(now: Optional[datetime] = None) -> Dict[str, str]:
+    """Query parameters for the cleanup thresholds, in the format events are stored in."""
+    now = now or datetime.now(timezone.utc)
+    return {
+        'day_ago': (now - timedelta(days=1)).isoformat(),
+        'week_ago': (now - timedelta(days=7)).isoformat(),
+        'corrupted_start': CORRUPTED_START,
+        'corrupted_end': CORRUPTED_END,
+    }
+
+
+def delete_events(conn, ids: List[str]) -> None:
+    """Delete events by id, along with their rows in DEPENDENT_TABLES."""
+    placeholders = ", ".join("?" * len(ids))
+    existing = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for table in DEPENDENT_TABLES:
+        if table in existing:
+            conn.execute(f'DELETE FROM "{table}" WHERE eventId IN ({placeholders})', ids)
+    conn.execute(f"DELETE FROM Event WHERE id IN ({placeholders})", ids)
+
+
+class SQLiteCleanup:
+    """Batched cleanup of the local Event table; reuses the run's connection when given one."""
+
+    def __init__(self, db: EventDatabase, batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_pause: float = DEFAULT_BATCH_PAUSE, dry_run: bool = False,
+                 archive: Optional['EventArchive'] = None):
+        self.db = db
+        # Past events are appended here before they are deleted
+        self.archive = archive
+        self.batch_size = max(1, batch_size)
+        self.batch_pause = batch_pause
+        self.dry_run = dry_run
+
+    def run(self, operations: Optional[Sequence[str]] = None, vacuum: bool = True) -> Dict[str, Any]:
+        """Run the given operations (default: all); returns counts keyed like the cleanup API."""
+        results: Dict[str, Any] = {key: 0 for key in RESULT_KEYS.values()}
+        results['errors'] = []
+        params = cutoffs()
+
+        for operation in operations or OPERATIONS:
+            try:
+                if self.dry_run:
+                    results[RESULT_KEYS[operation]] = self.count(operation, params)
+                else:
+                    results[RESULT_KEYS[operation]] = self._run_operation(operation, params)
+            except Exception as e:
+                results['errors'].append(f"Cleanup operation '{operation}' failed: {e}")
+
+        removed = sum(results[key] for key in RESULT_KEYS.values())
+        if vacuum and not self.dry_run and removed:
+            try:
+                results['freedPages'] = self.vacuum()
+            except Exception as e:
+                results['errors'].append(f"Vacuum failed: {e}")
+        return results
+
+    def count(self, operation: str, params: Dict[str, str]) -> int:
+        """How many events an operation would touch."""
+        sql = SELECT_BATCH_SQL[operation]
+        with self.db.transaction() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM ({sql})", {**params, 'limit': -1}).fetchone()[0]
+
+    def _run_operation(self, operation: str, params: Dict[str, str]) -> int:
+        total = 0
+        while True:
+            with self.db.transaction() as conn:
+                ids = [row[0] for row in conn.execute(SELECT_BATCH_SQL[operation],
+                                                      {**params, 'limit': self.batch_size})]
+                if ids:
+                    if operation == 'denied':
+                        self._archive(conn, ids)
+                    else:
+                        if operation == 'past' and self.archive is not None:
+                            self.archive.append(self._rows(conn, ids))
+                        delete_events(conn, ids)
+            total += len(ids)
+            if len(ids) < self.batch_size:
+                return total
+            time.sleep(self.batch_pause)
+
+    @staticmethod
+    def _rows(conn, ids: List[str]) -> List[Dict[str, Any]]:
+        placeholders = ", ".join("?" * len(ids))
+        cursor = conn.execute(f"SELECT * FROM Event WHERE id IN ({placeholders})", ids)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, values)) for values in cursor]
+
+    @staticmethod
+    def _archive(conn, ids: List[str]) -> None:
+        placeholders = ", ".join("?" * len(ids))
+        conn.execute(
+            f"""
+            UPDATE Event
+            SET status = 'ARCHIVED', updatedAt = ?, updatedBy = 'system@cleanup-sqlite',
+                notes = 'Auto-archived old denied event via SQLite cleanup'
+            WHERE id IN ({placeholders})
+            """,
+            [datetime.now(timezone.utc).isoformat(), *ids],
+        )
+
+    def vacuum(self) -> int:
+        """Return free pages to the filesystem; returns how many pages were freed."""
+        conn = self.db.connection
+        with self.db.transaction():
+            free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            incremental = conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        with self.db.transaction():
+            if incremental:
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+            else:
+                # Switching auto_vacuum mode only takes effect through a full VACUUM
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return free_before - free_after
+
+
+def print_results(results: Dict[str, Any], dry_run: bool = False) -> None:
+    print("🧪 Dry run, no events were changed. Would clean up:" if dry_run else "✅ Local cleanup completed")
+    print(f"   Deleted past events: {results['deletedPastEvents']}")
+    print(f"   Deleted cancelled events: {results['deletedCancelledEvents']}")
+    print(f"   Archived denied events: {results['archivedDeniedEvents']}")
+    print(f"   Deleted corrupted events: {results['deletedCorruptedEvents']}")
+    if results.get('freedPages'):
+        print(f"   Freed pages: {results['freedPages']}")
+    if results['errors']:
+        print("❌ Errors:")
+        for error in results['errors']:
+            print(f"   - {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Clean up events in the local SQLite database")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='SQLite database (default: prisma/events.db)')
+    parser.add_argument('--operations', nargs='+', choices=OPERATIONS,
+                        help='Specific cleanup operations to run (default: all)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Events per transaction (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--archive', action='store_true',
+                        help='Keep past events in the compressed archive (scrapers/data/archive) instead of dropping them')
+    parser.add_argument('--no-vacuum', action='store_true', help='Skip returning free pages to the filesystem')
+    parser.add_argument('--dry-run', action='store_true', help='Only report how many events would be cleaned up')
+    args = parser.parse_args(argv)
+
+    archive = None
+    if args.archive:
+        # event_archive imports this module, so it is only imported when needed
+        try:
+            from .event_archive import EventArchive
+        except ImportError:
+            from event_archive import EventArchive
+        archive = EventArchive()
+
+    with EventDatabase(args.db) as db:
+        cleanup = SQLiteCleanup(db, batch_size=args.batch_size, dry_run=args.dry_run, archive=archive)
+        results = cleanup.run(args.operations, vacuum=not args.no_vacuum)
+    print_results(results, args.dry_run)
+    return 1 if results['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,20 @@ import os
 import argparse
 from datetime import datetime, timezone
 from typing import List, Dict, Any
-from models import Event
+try:
+    from .models import Event
+    from .registry import get_spec
+except ImportError:
+    from models import Event
+    from registry import get_spec
 
 # NOTE: This is the only script that should write to public/data. All other scrapers should write to scrapers/data.
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
+# The scrapers whose output is published to public/data
+SCRAPER_NAMES = ("nycbar", "fordham", "lawyers_alliance", "nyiac", "google_calendar")
+
 class ScraperManager:
     """Manages all scrapers and combines their output."""
     
@@ -18,29 +26,28 @@ class ScraperManager:
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "public", "data")
         os.makedirs(self.data_dir, exist_ok=True)
 
-        # Lazy import and instantiate scrapers
-        scraper_configs = [
-            ("nycbar", "nycbar_scraper", "NYCBarScraper", "com_nycbar"),
-            ("fordham", "fordham_scraper", "FordhamScraper", "com_fordham"),
-            ("lawyers_alliance", "lawyers_alliance_scraper", "LawyersAllianceScraper", "com_lawyers_alliance"),
-            ("nyiac", "nyiac_scraper", "NYIACScraper", "com_nyiac"),
-            ("google_calendar", "google_calendar_scraper", "GoogleCalendarScraper", "com_google_calendar"),
-            ("ics_calendar", "ics_calendar_scraper", "ICSCalendarScraper", "com_ics_calendar"),
-        ]
-        for name, module_name, class_name, community_id in scraper_configs:
+        # Scrapers are imported from the registry only when they run
+        self.scraper_names = list(SCRAPER_NAMES)
+
+    def load_scraper(self, name: str):
+        """Import and instantiate a scraper by name, or return None if that fails."""
+        if name not in self.scrapers:
+            try:
+                spec = get_spec(name)
+            except KeyError:
+                print(f"Scraper '{name}' not found.")
+                return None
             try:
-                module = __import__(module_name, fromlist=[class_name])
-                klass = getattr(module, class_name)
-                self.scrapers[name] = klass(community_id)
+                self.scrapers[name] = spec.create()
             except Exception as e:
-                print(f"Error importing {class_name} from {module_name}: {e}")
-                continue
+                print(f"Error importing {spec.class_name} from {spec.module}: {e}")
+                return None
+        return self.scrapers[name]
     
     def run_scraper(self, name: str) -> List[Event]:
         """Run a single scraper and return its results."""
-        scraper = self.scrapers.get(name)
+        scraper = self.load_scraper(name)
         if not scraper:
-            print(f"Scraper '{name}' not found.")
             return []
         try:
             events = scraper.run()
@@ -53,7 +60,11 @@ class ScraperManager:
     def run_all(self) -> Dict[str, List[Event]]:
         """Run all scrapers and return their results."""
         results = {}
-        for name, scraper in self.scrapers.items():
+        for name in self.scraper_names:
+            scraper = self.load_scraper(name)
+            if not scraper:
+                results[name] = []
+                continue
             try:
                 events = scraper.run()
                 results[name] = events
@@ -102,7 +113,7 @@ class ScraperManager:
 
 def main():
     parser = argparse.ArgumentParser(description="Run legal event scrapers.")
-    parser.add_argument('--scraper', type=str, help='Name of a single scraper to run (e.g. nycbar, fordham, lawyers_alliance, nyiac, google_calendar, ics_calendar)')
+    parser.add_argument('--scraper', type=str, help='Name of a single registered scraper to run (e.g. nycbar, fordham, nyiac)')
     args = parser.parse_args()
     manager = ScraperManager()
     manager.run(only_scraper=args.scraper)
@@ -1,10 +1,13 @@
 import json
 import os
 import argparse
+import asyncio
+import contextvars
+import functools
 import hashlib
-import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 import sys
 import re
 
@@ -16,66 +19,235 @@ sys.path.append(PROJECT_ROOT)
 # Import models
 try:
     from .models import Event
+    from .deadline import DeadlineExceeded, current_deadline, deadline_scope, exit_process
+    from .event_db import EventDatabase
+    from .event_indexes import create_event_indexes
+    from .metrics import ScraperMetrics, collect, slowest_stages, span, write_prometheus
+    from .registry import DAILY, ScraperSpec, get_spec, iter_specs
+    from .transport import get_transport
 except ImportError:
     from models import Event
+    from deadline import DeadlineExceeded, current_deadline, deadline_scope, exit_process
+    from event_db import EventDatabase
+    from event_indexes import create_event_indexes
+    from metrics import ScraperMetrics, collect, slowest_stages, span, write_prometheus
+    from registry import DAILY, ScraperSpec, get_spec, iter_specs
+    from transport import get_transport
+
+# Only needed for async scrapers, production saves or --cleanup, so they are
+# imported when used; aiohttp alone takes longer to import than everything above
+if TYPE_CHECKING:
+    from .async_base_scraper import AsyncBaseScraper
+
+# Concurrency limits for run_all: how many scrapers are in flight at once, and
+# how many threads are available to sync scrapers that still block on requests
+DEFAULT_MAX_CONCURRENCY = 50
+DEFAULT_SYNC_WORKERS = 8
+
+# Wall-clock budgets in seconds: per scraper, and for the whole run so the cron
+# job ends inside its window. A scraper that ignores its deadline is abandoned
+# DEADLINE_GRACE_SECONDS after it.
+DEFAULT_SCRAPER_TIMEOUT = 300
+DEFAULT_RUN_TIMEOUT = 1800
+DEADLINE_GRACE_SECONDS = 30
 
 # Check if we're in production (PostgreSQL) or local (SQLite)
 DATABASE_URL = os.environ.get("DATABASE_URL", "file:./prisma/events.db")
 IS_PRODUCTION = DATABASE_URL.startswith("postgresql://") or DATABASE_URL.startswith("postgres://")
 
+# Set-based upsert for the local SQLite database. A scraper's batch is staged
+# into a temp table, each staged row is matched to an existing event, and the
+# matched and new rows are written with one INSERT ... ON CONFLICT each.
+# Matched rows whose content hash equals the one stored for the event are
+# left alone, so re-scraping an unchanged event writes nothing.
+STAGE_COLUMNS = """
+    id, externalId, name, description, startDate, endDate, locationName, url,
+    cleCredits, locationId, communityId, category, tags, eventType, image, price, metadata,
+    contentHash
+"""
+
+CREATE_STAGE_TABLE_SQL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS EventStage (
+        seq INTEGER PRIMARY KEY,
+        {STAGE_COLUMNS},
+        targetId TEXT,
+        unchanged INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+INSERT_STAGE_SQL = f"""
+    INSERT INTO EventStage (seq, {STAGE_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Content hash of each event as last written by a scraper. A side table, so
+# the Prisma-managed Event table keeps its schema.
+CREATE_CONTENT_HASH_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS EventContentHash (
+        eventId TEXT PRIMARY KEY,
+        contentHash TEXT NOT NULL,
+        updatedAt TEXT NOT NULL
+    )
+"""
+
+RESOLVE_STAGE_TARGETS_SQL = """
+    UPDATE EventStage SET targetId = COALESCE(
+        (SELECT Event.id FROM Event
+         WHERE EventStage.externalId != '' AND Event.externalId = EventStage.externalId),
+        (SELECT Event.id FROM Event
+         WHERE Event.name = EventStage.name
+           AND Event.startDate = EventStage.startDate
+           AND Event.communityId = EventStage.communityId)
+    )
+"""
+
+MARK_UNCHANGED_SQL = """
+    UPDATE EventStage SET unchanged = 1
+    WHERE targetId IS NOT NULL
+      AND contentHash = (SELECT contentHash FROM EventContentHash WHERE eventId = EventStage.targetId)
+"""
+
+# After the insert, new rows are matched again to find the id they were written under
+RESOLVE_NEW_TARGETS_SQL = RESOLVE_STAGE_TARGETS_SQL + " WHERE targetId IS NULL"
+
+RECORD_CONTENT_HASHES_SQL = """
+    INSERT INTO EventContentHash (eventId, contentHash, updatedAt)
+    SELECT targetId, contentHash, :now
+    FROM EventStage WHERE targetId IS NOT NULL AND NOT unchanged ORDER BY seq
+    ON CONFLICT(eventId) DO UPDATE SET contentHash = excluded.contentHash, updatedAt = excluded.updatedAt
+"""
+
+INSERT_EVENT_COLUMNS = """
+    id, externalId, name, description, startDate, endDate,
+    locationName, url, cleCredits, status, submittedBy,
+    submittedAt, updatedAt, updatedBy, locationId, communityId,
+    category, tags, eventType, image, price, metadata
+"""
+
+SELECT_STAGED_EVENT_COLUMNS = """
+    externalId, name, description, startDate, endDate,
+    locationName, url, cleCredits, 'APPROVED', :scraper,
+    :now, :now, :scraper, locationId, communityId,
+    category, tags, eventType, image, price, metadata
+"""
+
+UPSERT_UPDATE_SET = """
+    externalId = excluded.externalId,
+    description = excluded.description,
+    endDate = excluded.endDate,
+    locationName = excluded.locationName,
+    url = excluded.url,
+    cleCredits = excluded.cleCredits,
+    updatedAt = excluded.updatedAt,
+    updatedBy = excluded.updatedBy,
+    locationId = excluded.locationId,
+    communityId = excluded.communityId,
+    category = excluded.category,
+    tags = excluded.tags,
+    eventType = excluded.eventType,
+    image = excluded.image,
+    price = excluded.price,
+    metadata = excluded.metadata
+"""
+
+# Every row here conflicts on id, so this only ever takes the DO UPDATE branch
+UPDATE_EXISTING_SQL = f"""
+    INSERT INTO Event ({INSERT_EVENT_COLUMNS})
+    SELECT targetId, {SELECT_STAGED_EVENT_COLUMNS}
+    FROM EventStage WHERE targetId IS NOT NULL AND NOT unchanged ORDER BY seq
+    ON CONFLICT(id) DO UPDATE SET {UPSERT_UPDATE_SET}
+"""
+
+# Later rows repeating an externalId (or name/startDate/communityId) from earlier
+# in the batch update that row; any other collision (url, generated id) is skipped
+INSERT_NEW_SQL = f"""
+    INSERT INTO Event ({INSERT_EVENT_COLUMNS})
+    SELECT id, {SELECT_STAGED_EVENT_COLUMNS}
+    FROM EventStage WHERE targetId IS NULL ORDER BY seq
+    ON CONFLICT(externalId) DO UPDATE SET {UPSERT_UPDATE_SET} WHERE excluded.externalId != ''
+    ON CONFLICT(name, startDate, communityId) DO UPDATE SET {UPSERT_UPDATE_SET}
+    ON CONFLICT DO NOTHING
+"""
+
 if IS_PRODUCTION:
     print("Using production PostgreSQL database - this requires API calls")
 else:
     print("Using local SQLite database directly")
 
+def is_async_scraper(scraper) -> bool:
+    """Whether a scraper is an AsyncBaseScraper, without importing the async module for sync-only runs."""
+    return asyncio.iscoroutinefunction(getattr(scraper, 'run', None))
+
+
+async def close_async_session() -> None:
+    """Close the aiohttp session shared by async scrapers on this loop, if one was opened."""
+    try:
+        from .async_base_scraper import close_shared_session
+    except ImportError:
+        from async_base_scraper import close_shared_session
+    await close_shared_session()
+
+
 class ScraperManagerDB:
     """Manages all scrapers and saves directly to database."""
 
-    def __init__(self):
+    def __init__(self, scraper_timeout: Optional[float] = DEFAULT_SCRAPER_TIMEOUT,
+                 run_timeout: Optional[float] = DEFAULT_RUN_TIMEOUT,
+                 upload_chunk_size: Optional[int] = None):
         self.scrapers = {}
+        self.scraper_timeout = scraper_timeout
+        self.run_timeout = run_timeout
+        # Events per request when saving through the production API (None: bulk_upload's default)
+        self.upload_chunk_size = upload_chunk_size
         self.db_path = os.path.join(PROJECT_ROOT, "prisma", "events.db") if not IS_PRODUCTION else None
+        # Tuned SQLite connection shared by every save of the run; opened on first save
+        self.event_db: Optional[EventDatabase] = None
         self.api_url = os.environ.get("VERCEL_URL", "https://legal.somethingtodo.nyc")
         self.secret = os.environ.get("SCRAPER_SECRET")
+        # Metrics of the scrapers run so far, by scraper name
+        self.metrics: Dict[str, ScraperMetrics] = {}
+        # Created, updated and unchanged events of each scraper's last save
+        self.write_counts: Dict[str, Dict[str, int]] = {}
+        # Sync scrapers abandoned past their deadline; their threads may still be running
+        self.abandoned = 0
+
+        # Specs of the scrapers this handler runs; each is imported only when it runs
+        self.specs: Dict[str, ScraperSpec] = {spec.name: spec for spec in iter_specs(schedule=DAILY)}
+
+    def load_scraper(self, name: str):
+        """Import and instantiate a scraper by name (any registered scraper, not just daily ones)."""
+        if name not in self.scrapers:
+            spec = self.specs.get(name) or get_spec(name)
+            self.scrapers[name] = spec.create()
+            print(f"Successfully loaded {spec.class_name} from {spec.module}")
+        return self.scrapers[name]
+
+    def _get_scraper(self, name: str):
+        try:
+            return self.load_scraper(name)
+        except KeyError:
+            print(f"Scraper '{name}' not found.")
+        except Exception as e:
+            print(f"Error importing scraper '{name}': {e}")
+        return None
+
+    def database(self) -> EventDatabase:
+        """The run's SQLite connection, with the side tables and indexes created on first use."""
+        if self.event_db is None:
+            event_db = EventDatabase(self.db_path)
+            with event_db.transaction() as conn:
+                conn.execute(CREATE_CONTENT_HASH_TABLE_SQL)
+                create_event_indexes(conn)
+                conn.execute(CREATE_STAGE_TABLE_SQL)
+            self.event_db = event_db
+        return self.event_db
+
+    def close(self) -> None:
+        """Close the run's SQLite connection, if one was opened."""
+        if self.event_db is not None:
+            self.event_db.close()
+            self.event_db = None
 
-        # Lazy import and instantiate scrapers
-        scraper_configs = [
-            # ("aabany_rss", "aabany_rss_scraper", "AabanyRssScraper", "com_aabany_rss"),
-            ("brooklynbar", "brooklynbar_scraper", "BrooklynBarScraper", "com_brooklynbar"),
-            ("nysba", "nysba_scraper", "NYSBAScraper", "com_nysba"),
-            ("hnba_ics", "hnba_ics_scraper", "HNBAICSScraper", "com_hnba_ics"),
-            ("lgbtbarny", "lgbtbarny_scraper", "LgbtBarNyScraper", "com_lgbtbarny"),
-            ("wbasny", "wbasny_scraper", "WBASNYScraper", "com_wbasny"),
-            ("nawl", "nawl_scraper", "NAWLScraper", "com_nawl"),
-            ("fedbar_ics", "fedbar_ics_scraper", "FBAICSScraper", "com_fedbar_ics"),
-            ("cuny_law_ics", "cuny_law_ics_scraper", "CUNYLawICSScraper", "com_cuny_law_ics"),
-            ("chips_network", "chips_network_scraper", "ChIPsNetworkScraper", "com_chips_network"),
-            ("nycbar", "nycbar_scraper", "NYCBarScraper", "com_nycbar"),
-            ("fordham", "fordham_scraper", "FordhamScraper", "com_fordham"),
-            ("nyiac", "nyiac_scraper", "NYIACScraper", "com_nyiac"),
-        ]
-        
-        for name, module_name, class_name, community_id in scraper_configs:
-            try:
-                # Use importlib for more reliable imports
-                import importlib
-                try:
-                    # Try relative import first (when running as module)
-                    module = importlib.import_module(f".{module_name}", package="scrapers")
-                except ImportError:
-                    try:
-                        # Fall back to absolute import
-                        module = importlib.import_module(f"scrapers.{module_name}")
-                    except ImportError:
-                        # Final fallback - direct import
-                        module = importlib.import_module(module_name)
-                
-                klass = getattr(module, class_name)
-                self.scrapers[name] = klass(community_id)
-                print(f"Successfully loaded {class_name} from {module_name}")
-            except Exception as e:
-                print(f"Error importing {class_name} from {module_name}: {e}")
-                continue
-    
     def save_events_to_db(self, events: List[Event], scraper_name: str) -> bool:
         """Save events directly to database using SQLite."""
         if not events:
@@ -86,274 +258,390 @@ class ScraperManagerDB:
             return self._save_events_via_api(events, scraper_name)
 
         # Local SQLite database
-        created_count = 0
-        updated_count = 0
+        now = datetime.now(timezone.utc).isoformat()
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            for event in events:
-                event_dict = event.to_dict()
-
-                # Generate event ID
-                event_id = f"evt_{hashlib.sha256((event_dict['name'] + event_dict['startDate'] + str(event_dict.get('communityId', ''))).encode()).hexdigest()[:12]}"
-
-                # Convert ISO strings to datetime objects
-                start_date = datetime.fromisoformat(event_dict['startDate'].replace('Z', '+00:00'))
-                end_date = datetime.fromisoformat(event_dict.get('endDate', event_dict['startDate']).replace('Z', '+00:00'))
-                now = datetime.now(timezone.utc)
-
-                # Check if event exists by externalId first, then by name/startDate/communityId
-                existing = None
-                if event_dict.get('externalId'):
-                    cursor.execute("""
-                        SELECT id FROM Event WHERE externalId = ?
-                    """, (event_dict['externalId'],))
-                    existing = cursor.fetchone()
-
-                if not existing:
-                    cursor.execute("""
-                        SELECT id FROM Event
-                        WHERE name = ? AND startDate = ? AND communityId = ?
-                    """, (event_dict['name'], start_date.isoformat(), event_dict.get('communityId')))
-                    existing = cursor.fetchone()
-
-                if existing:
-                    # Update existing event
-                    cursor.execute("""
-                        UPDATE Event SET
-                            externalId = ?,
-                            description = ?,
-                            endDate = ?,
-                            locationName = ?,
-                            url = ?,
-                            cleCredits = ?,
-                            updatedAt = ?,
-                            updatedBy = ?,
-                            locationId = ?,
-                            communityId = ?,
-                            category = ?,
-                            tags = ?,
-                            eventType = ?,
-                            image = ?,
-                            price = ?,
-                            metadata = ?
-                        WHERE id = ?
-                    """, (
-                        event_dict.get('externalId'),
-                        event_dict.get('description', ''),
-                        end_date.isoformat(),
-                        event_dict.get('locationName', 'TBD'),
-                        event_dict.get('url'),
-                        event_dict.get('cleCredits'),
-                        now.isoformat(),
-                        scraper_name,
-                        event_dict.get('locationId'),
-                        event_dict.get('communityId'),
-                        ','.join(event_dict.get('category', [])) if event_dict.get('category') else None,
-                        ','.join(event_dict.get('tags', [])) if event_dict.get('tags') else None,
-                        event_dict.get('eventType'),
-                        event_dict.get('image'),
-                        json.dumps(event_dict.get('price')) if event_dict.get('price') else None,
-                        json.dumps(event_dict.get('metadata')) if event_dict.get('metadata') else None,
-                        existing[0]
-                    ))
-                    updated_count += 1
-                else:
-                    # Create new event
-                    try:
-                        cursor.execute("""
-                            INSERT INTO Event (
-                                id, externalId, name, description, startDate, endDate,
-                                locationName, url, cleCredits, status, submittedBy,
-                                submittedAt, updatedAt, updatedBy, locationId, communityId,
-                                category, tags, eventType, image, price, metadata
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            event_id,
-                            event_dict.get('externalId'),
-                            event_dict['name'],
-                            event_dict.get('description', ''),
-                            start_date.isoformat(),
-                            end_date.isoformat(),
-                            event_dict.get('locationName', 'TBD'),
-                            event_dict.get('url'),
-                            event_dict.get('cleCredits'),
-                            'APPROVED',
-                            scraper_name,
-                            now.isoformat(),
-                            now.isoformat(),
-                            scraper_name,
-                            event_dict.get('locationId'),
-                            event_dict.get('communityId'),
-                            ','.join(event_dict.get('category', [])) if event_dict.get('category') else None,
-                            ','.join(event_dict.get('tags', [])) if event_dict.get('tags') else None,
-                            event_dict.get('eventType'),
-                            event_dict.get('image'),
-                            json.dumps(event_dict.get('price')) if event_dict.get('price') else None,
-                            json.dumps(event_dict.get('metadata')) if event_dict.get('metadata') else None
-                        ))
-                        created_count += 1
-                    except sqlite3.IntegrityError as e:
-                        if 'UNIQUE constraint failed' in str(e):
-                            print(f"Event with externalId {event_dict.get('externalId')} or similar already exists, skipping creation")
-                            # Try to find and update the existing event instead
-                            if event_dict.get('externalId'):
-                                cursor.execute("""
-                                    SELECT id FROM Event WHERE externalId = ?
-                                """, (event_dict['externalId'],))
-                                existing_duplicate = cursor.fetchone()
-                                if existing_duplicate:
-                                    cursor.execute("""
-                                        UPDATE Event SET
-                                            description = ?,
-                                            endDate = ?,
-                                            locationName = ?,
-                                            url = ?,
-                                            cleCredits = ?,
-                                            updatedAt = ?,
-                                            updatedBy = ?,
-                                            locationId = ?,
-                                            communityId = ?,
-                                            category = ?,
-                                            tags = ?,
-                                            eventType = ?,
-                                            image = ?,
-                                            price = ?,
-                                            metadata = ?
-                                        WHERE id = ?
-                                    """, (
-                                        event_dict.get('description', ''),
-                                        end_date.isoformat(),
-                                        event_dict.get('locationName', 'TBD'),
-                                        event_dict.get('url'),
-                                        event_dict.get('cleCredits'),
-                                        now.isoformat(),
-                                        scraper_name,
-                                        event_dict.get('locationId'),
-                                        event_dict.get('communityId'),
-                                        ','.join(event_dict.get('category', [])) if event_dict.get('category') else None,
-                                        ','.join(event_dict.get('tags', [])) if event_dict.get('tags') else None,
-                                        event_dict.get('eventType'),
-                                        event_dict.get('image'),
-                                        json.dumps(event_dict.get('price')) if event_dict.get('price') else None,
-                                        json.dumps(event_dict.get('metadata')) if event_dict.get('metadata') else None,
-                                        existing_duplicate[0]
-                                    ))
-                                    updated_count += 1
-                        else:
-                            raise
-
-            conn.commit()
+            rows = [self._stage_row(seq, event) for seq, event in enumerate(events)]
+
+            with self.database().transaction() as conn:
+                cursor = conn.cursor()
+
+                # Stage the whole batch, then resolve every match with set-based statements
+                cursor.execute("DELETE FROM EventStage")
+                cursor.executemany(INSERT_STAGE_SQL, rows)
+                cursor.execute(RESOLVE_STAGE_TARGETS_SQL)
+                cursor.execute(MARK_UNCHANGED_SQL)
+
+                # Existing events (matched by externalId, then name/startDate/communityId) that changed
+                cursor.execute("SELECT COUNT(*) FROM EventStage WHERE unchanged")
+                unchanged_count = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) FROM EventStage WHERE targetId IS NOT NULL AND NOT unchanged")
+                updated_count = cursor.fetchone()[0]
+                cursor.execute(UPDATE_EXISTING_SQL, {'scraper': scraper_name, 'now': now})
+
+                # New events; duplicates within the batch update the row inserted before them
+                cursor.execute("SELECT MAX(rowid) FROM Event")
+                last_rowid = cursor.fetchone()[0] or 0
+                changes_before = conn.total_changes
+                cursor.execute(INSERT_NEW_SQL, {'scraper': scraper_name, 'now': now})
+                insert_changes = conn.total_changes - changes_before
+                cursor.execute("SELECT COUNT(*) FROM Event WHERE rowid > ?", (last_rowid,))
+                created_count = cursor.fetchone()[0]
+                updated_count += insert_changes - created_count
+
+                cursor.execute(RESOLVE_NEW_TARGETS_SQL)
+                cursor.execute(RECORD_CONTENT_HASHES_SQL, {'now': now})
 
         except Exception as e:
             print(f"Error saving events from {scraper_name}: {e}")
             return False
-        finally:
-            if 'conn' in locals():
-                conn.close()
 
+        skipped_count = len(events) - created_count - updated_count - unchanged_count
+        self.write_counts[scraper_name] = {
+            'created': created_count, 'updated': updated_count, 'unchanged': unchanged_count,
+        }
         print(f"Successfully saved {len(events)} events from {scraper_name}")
         print(f"  - Created: {created_count}")
         print(f"  - Updated: {updated_count}")
+        print(f"  - Unchanged: {unchanged_count}")
+        if skipped_count:
+            print(f"  - Skipped (conflicting url or id): {skipped_count}")
         return True
 
+    @staticmethod
+    def _stage_row(seq: int, event: Event) -> tuple:
+        """Flatten an event into an EventStage row."""
+        event_dict = event.to_dict()
+
+        # Generate event ID
+        event_id = f"evt_{hashlib.sha256((event_dict['name'] + event_dict['startDate'] + str(event_dict.get('communityId', ''))).encode()).hexdigest()[:12]}"
+
+        # Convert ISO strings to datetime objects
+        start_date = datetime.fromisoformat(event_dict['startDate'].replace('Z', '+00:00'))
+        end_date = datetime.fromisoformat(event_dict.get('endDate', event_dict['startDate']).replace('Z', '+00:00'))
+
+        return (
+            seq,
+            event_id,
+            event_dict.get('externalId'),
+            event_dict['name'],
+            event_dict.get('description', ''),
+            start_date.isoformat(),
+            end_date.isoformat(),
+            event_dict.get('locationName', 'TBD'),
+            event_dict.get('url'),
+            event_dict.get('cleCredits'),
+            event_dict.get('locationId'),
+            event_dict.get('communityId'),
+            ','.join(event_dict.get('category', [])) if event_dict.get('category') else None,
+            ','.join(event_dict.get('tags', [])) if event_dict.get('tags') else None,
+            event_dict.get('eventType'),
+            event_dict.get('image'),
+            json.dumps(event_dict.get('price')) if event_dict.get('price') else None,
+            json.dumps(event_dict.get('metadata')) if event_dict.get('metadata') else None,
+            event.content_hash(),
+        )
+
     def _save_events_via_api(self, events: List[Event], scraper_name: str) -> bool:
         """Save events via API call for production database."""
-        import requests
-
         try:
-            url = f"{self.api_url}/api/events/bulk"
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.secret}'
-            }
-
-            events_data = [event.to_dict() for event in events]
-            data = {
-                'events': events_data,
-                'scraper': scraper_name,
-                'secret': self.secret
-            }
-
-            response = requests.post(url, json=data, headers=headers, timeout=30)
-            if response.status_code == 200:
-                result = response.json()
-                print(f"Successfully saved {len(events)} events from {scraper_name} via API")
-                print(f"  - API Response: Created {result.get('created', 0)}, Updated {result.get('updated', 0)}")
-                if result.get('errors'):
-                    print(f"  - API Errors: {result['errors']}")
-                return True
-            else:
-                print(f"Failed to save events via API: {response.status_code} - {response.text}")
-                return False
-
+            try:
+                from .bulk_upload import BulkUploader
+            except ImportError:
+                from bulk_upload import BulkUploader
+            chunk_size = {'chunk_size': self.upload_chunk_size} if self.upload_chunk_size else {}
+            uploader = BulkUploader(f"{self.api_url}/api/events/bulk", self.secret, **chunk_size)
+            # The API skips events whose stored content hash matches
+            events_data = [{**event.to_dict(), 'contentHash': event.content_hash()} for event in events]
+            result = uploader.upload(events_data, scraper_name)
         except Exception as e:
             print(f"Error saving events via API from {scraper_name}: {e}")
             return False
+
+        self.write_counts[scraper_name] = {
+            'created': result.created, 'updated': result.updated, 'unchanged': result.unchanged,
+        }
+        if result.success:
+            print(f"Successfully saved {len(events)} events from {scraper_name} via API in {result.chunks} chunk(s)")
+        else:
+            print(f"Saved events from {scraper_name} via API with {result.failed_chunks} of {result.chunks} chunk(s) failing")
+        print(f"  - API Response: Created {result.created}, Updated {result.updated}, Unchanged {result.unchanged}")
+        if result.errors:
+            print(f"  - API Errors: {result.errors}")
+        return result.success
     
     def run_scraper(self, name: str) -> List[Event]:
         """Run a single scraper and send results to database."""
-        scraper = self.scrapers.get(name)
+        scraper = self._get_scraper(name)
         if not scraper:
-            print(f"Scraper '{name}' not found.")
             return []
 
-        try:
-            print(f"Running {name} scraper...")
-            events = scraper.run()
-            print(f"Found {len(events)} events from {name}")
+        metrics = self.metrics[name] = ScraperMetrics(name)
+        with collect(metrics):
+            try:
+                print(f"Running {name} scraper...")
+                with deadline_scope(self.scraper_timeout) as deadline:
+                    try:
+                        if is_async_scraper(scraper):
+                            events = asyncio.run(self._run_async_scraper(scraper))
+                        else:
+                            events = scraper.run()
+                    except DeadlineExceeded:
+                        events = []
+                metrics.timed_out = deadline.hit or deadline.expired
+                self._report_found(name, events, metrics.timed_out)
+                metrics.events = len(events)
+
+                # Save to database
+                success = metrics.success = self._persist(events, name)
+                if success:
+                    print(f"Successfully processed {name} scraper")
+                else:
+                    print(f"Failed to save events from {name} to database")
 
-            # Save to database
-            success = self.save_events_to_db(events, name)
-            if success:
-                print(f"Successfully processed {name} scraper")
-            else:
-                print(f"Failed to save events from {name} to database")
+                return events
+            except Exception as e:
+                metrics.success = False
+                print(f"Error running {name} scraper: {e}")
+                return []
 
-            return events
-        except Exception as e:
-            print(f"Error running {name} scraper: {e}")
-            return []
+    def _persist(self, events: List[Event], name: str) -> bool:
+        with span('persist'):
+            return self.save_events_to_db(events, name)
     
-    def run_all(self) -> Dict[str, List[Event]]:
-        """Run all scrapers and send results to database."""
-        results = {}
-        total_events = 0
+    async def _run_async_scraper(self, scraper: 'AsyncBaseScraper') -> List[Event]:
+        """Run one async scraper on its own loop, closing the shared session afterwards."""
+        try:
+            return await scraper.run()
+        finally:
+            await close_async_session()
+
+    async def run_scraper_async(self, name: str, executor: ThreadPoolExecutor,
+                                save_executor: ThreadPoolExecutor) -> List[Event]:
+        """Run a single scraper on the event loop and send results to database.
+
+        Saves run on ``save_executor``, a single thread apart from the scrapers'
+        pool, so scraper threads abandoned past their deadline can't hold them up.
+        """
+        run_deadline = current_deadline()
+        if run_deadline is not None and run_deadline.expired:
+            print(f"Skipping {name} scraper: the run's time budget is used up")
+            metrics = self.metrics[name] = ScraperMetrics(name)
+            metrics.timed_out = True
+            metrics.success = False
+            return []
 
-        print(f"Starting scraper run at {datetime.now(timezone.utc).isoformat()}")
+        scraper = self._get_scraper(name)
+        if not scraper:
+            return []
 
-        for name, scraper in self.scrapers.items():
+        loop = asyncio.get_running_loop()
+        metrics = self.metrics[name] = ScraperMetrics(name)
+        with collect(metrics):
             try:
-                events = self.run_scraper(name)
-                results[name] = events
-                total_events += len(events)
+                print(f"Running {name} scraper...")
+                events, metrics.timed_out = await self._scrape_within_deadline(scraper, executor)
+                self._report_found(name, events, metrics.timed_out)
+                metrics.events = len(events)
+
+                # Carry the metrics context into the save thread
+                persist = functools.partial(contextvars.copy_context().run, self._persist, events, name)
+                success = metrics.success = await loop.run_in_executor(save_executor, persist)
+                if success:
+                    print(f"Successfully processed {name} scraper")
+                else:
+                    print(f"Failed to save events from {name} to database")
+
+                return events
             except Exception as e:
+                metrics.success = False
                 print(f"Error running {name} scraper: {e}")
-                results[name] = []
+                return []
+
+    async def _scrape_within_deadline(self, scraper, executor: ThreadPoolExecutor) -> Tuple[List[Event], bool]:
+        """Run a scraper under its deadline; returns (events, timed_out).
+
+        Past the deadline the scraper's requests fail fast, so it normally
+        returns the events it already has. One that still hasn't returned
+        after the grace period is abandoned with no events.
+        """
+        if is_async_scraper(scraper):
+            with deadline_scope(self.scraper_timeout) as deadline:
+                try:
+                    events = await asyncio.wait_for(scraper.run(), self._wait_timeout(deadline))
+                except asyncio.TimeoutError:
+                    return [], True
+                except DeadlineExceeded:
+                    return [], True
+            return events, deadline.hit or deadline.expired
+
+        try:
+            from .async_base_scraper import SyncScraperAdapter
+        except ImportError:
+            from async_base_scraper import SyncScraperAdapter
+        # A sync scraper's deadline starts in its worker thread, not while it waits for one
+        adapter = SyncScraperAdapter(scraper, executor, timeout=self.scraper_timeout)
+        task = asyncio.ensure_future(adapter.run())
+        started = asyncio.ensure_future(adapter.started.wait())
+        try:
+            await asyncio.wait({task, started}, timeout=self._wait_timeout(current_deadline()),
+                               return_when=asyncio.FIRST_COMPLETED)
+            if not adapter.started.is_set():
+                # Still queued when the run ran out of time; cancelling drops it from the queue
+                task.cancel()
+                return [], True
+            events = await asyncio.wait_for(task, self._wait_timeout(adapter.deadline))
+        except asyncio.TimeoutError:
+            self.abandoned += 1
+            return [], True
+        except DeadlineExceeded:
+            return [], True
+        finally:
+            started.cancel()
+        return events, adapter.deadline.hit or adapter.deadline.expired
+
+    @staticmethod
+    def _wait_timeout(deadline) -> Optional[float]:
+        """How long to wait for work under ``deadline`` before abandoning it."""
+        remaining = deadline.remaining() if deadline is not None else None
+        return remaining + DEADLINE_GRACE_SECONDS if remaining is not None else None
+
+    @staticmethod
+    def _report_found(name: str, events: List[Event], timed_out: bool) -> None:
+        if timed_out:
+            print(f"{name} ran out of time; keeping the {len(events)} events found so far")
+        else:
+            print(f"Found {len(events)} events from {name}")
+
+    async def run_all_async(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                            sync_workers: int = DEFAULT_SYNC_WORKERS) -> Dict[str, List[Event]]:
+        """Run all scrapers concurrently from one event loop.
+
+        Async scrapers share a single connection pool; sync scrapers are run
+        through an adapter on a bounded thread pool of ``sync_workers`` threads.
+        """
+        total_events = 0
+        semaphore = asyncio.Semaphore(max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=sync_workers, thread_name_prefix="scraper")
+        # SQLite has a single writer, so saves go through one thread of their own
+        save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+
+        print(f"Starting scraper run at {datetime.now(timezone.utc).isoformat()}")
+
+        async def run_bounded(name: str) -> List[Event]:
+            async with semaphore:
+                return await self.run_scraper_async(name, executor, save_executor)
+
+        run_deadline = None
+        try:
+            names = list(self.specs)
+            with deadline_scope(self.run_timeout) as run_deadline:
+                outcomes = await asyncio.gather(*(run_bounded(name) for name in names))
+        finally:
+            # Don't wait for scrapers that ignored their deadline
+            stuck = self.abandoned or (run_deadline is not None and run_deadline.expired)
+            executor.shutdown(wait=not stuck, cancel_futures=True)
+            save_executor.shutdown(wait=True)
+            await close_async_session()
+
+        results = dict(zip(names, outcomes))
+        for events in outcomes:
+            total_events += len(events)
 
         print(f"Scraper run completed. Total events processed: {total_events}")
+        self.print_write_counts()
+        transport = get_transport().stats()
+        if transport['connection_reuse_ratio'] is not None:
+            print(f"Connection reuse: {transport['connection_reuse_ratio']:.0%} "
+                  f"({transport['connections_opened']} connections for {transport['requests']} requests)")
+        timed_out = [name for name, metrics in self.metrics.items() if metrics.timed_out]
+        if timed_out:
+            print(f"Timed out (partial or no results): {', '.join(timed_out)}")
+        self.print_slowest_stages()
         return results
 
-    def run(self, only_scraper: str = None) -> None:
-        """Run all scrapers or a single scraper."""
-        if only_scraper:
-            self.run_scraper(only_scraper)
-        else:
-            self.run_all()
+    def print_write_counts(self) -> None:
+        """Print how many events the run created, updated and left unchanged."""
+        totals = {key: sum(counts.get(key, 0) for counts in self.write_counts.values())
+                  for key in ('created', 'updated', 'unchanged')}
+        print(f"Database writes: {totals['created']} created, {totals['updated']} updated, "
+              f"{totals['unchanged']} unchanged")
+
+    def print_slowest_stages(self) -> None:
+        """Print the (scraper, stage) pairs that took the most wall time."""
+        slowest = slowest_stages(self.metrics.values())
+        if slowest:
+            print("Slowest stages:")
+            for entry in slowest:
+                print(f"  - {entry['scraper']} {entry['stage']}: {entry['wall_seconds']}s")
+
+    def write_metrics(self, path: str) -> None:
+        """Write the collected metrics to a Prometheus text file."""
+        write_prometheus(path, self.metrics.values())
+        print(f"Metrics saved to {path}")
+
+    def run_all(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                sync_workers: int = DEFAULT_SYNC_WORKERS) -> Dict[str, List[Event]]:
+        """Run all scrapers and send results to database."""
+        return asyncio.run(self.run_all_async(max_concurrency, sync_workers))
+
+    def cleanup_local_db(self) -> Dict[str, Any]:
+        """Prune the local SQLite database like the production cleanup API does.
+
+        Past events are moved to the compressed archive (event_archive.py)
+        rather than dropped.
+        """
+        try:
+            from .cleanup_sqlite import SQLiteCleanup, print_results as print_cleanup_results
+            from .event_archive import EventArchive
+        except ImportError:
+            from cleanup_sqlite import SQLiteCleanup, print_results as print_cleanup_results
+            from event_archive import EventArchive
+        print("Cleaning up local database...")
+        results = SQLiteCleanup(self.database(), archive=EventArchive()).run()
+        print_cleanup_results(results)
+        return results
+
+    def run(self, only_scraper: str = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            sync_workers: int = DEFAULT_SYNC_WORKERS, metrics_file: Optional[str] = None,
+            cleanup: bool = False) -> None:
+        """Run all scrapers or a single scraper, then optionally clean up the local database."""
+        try:
+            if only_scraper:
+                self.run_scraper(only_scraper)
+            else:
+                self.run_all(max_concurrency, sync_workers)
+            if cleanup:
+                if IS_PRODUCTION:
+                    print("Skipping local cleanup: production is cleaned up through /api/admin/cleanup")
+                else:
+                    self.cleanup_local_db()
+        finally:
+            self.close()
+        if metrics_file:
+            self.write_metrics(metrics_file)
 
 def main():
     parser = argparse.ArgumentParser(description="Run legal event scrapers and send to database.")
-    parser.add_argument('--scraper', type=str, help='Name of a single scraper to run (e.g. nycbar, fordham, lawyers_alliance, nyiac, google_calendar, ics_calendar)')
+    parser.add_argument('--scraper', type=str, help='Name of a single registered scraper to run (e.g. nycbar, nysba, chips_network)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY, help=f'Maximum scrapers in flight at once (default: {DEFAULT_MAX_CONCURRENCY})')
+    parser.add_argument('--sync-workers', type=int, default=DEFAULT_SYNC_WORKERS, help=f'Threads available to sync scrapers (default: {DEFAULT_SYNC_WORKERS})')
+    parser.add_argument('--scraper-timeout', type=float, default=DEFAULT_SCRAPER_TIMEOUT, help=f'Seconds each scraper may run (default: {DEFAULT_SCRAPER_TIMEOUT})')
+    parser.add_argument('--run-timeout', type=float, default=DEFAULT_RUN_TIMEOUT, help=f'Seconds the whole run may take (default: {DEFAULT_RUN_TIMEOUT})')
+    parser.add_argument('--upload-chunk-size', type=int, default=None, help='Events per bulk API request in production (default: SCRAPER_UPLOAD_CHUNK_SIZE, or 100)')
+    parser.add_argument('--cleanup', action='store_true', help='Clean up past, cancelled, denied and corrupted events in the local SQLite database after the run')
+    parser.add_argument('--metrics-file', type=str, default=None, help='Write per-scraper metrics to this file in Prometheus text format')
     args = parser.parse_args()
 
     try:
-        manager = ScraperManagerDB()
-        manager.run(only_scraper=args.scraper)
+        manager = ScraperManagerDB(scraper_timeout=args.scraper_timeout, run_timeout=args.run_timeout,
+                                   upload_chunk_size=args.upload_chunk_size)
+        manager.run(only_scraper=args.scraper, max_concurrency=args.concurrency, sync_workers=args.sync_workers,
+                    metrics_file=args.metrics_file, cleanup=args.cleanup)
     except Exception as e:
         print(f"Fatal error: {e}")
-        exit(1)
+        exit_process(1)
+    exit_process(0)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
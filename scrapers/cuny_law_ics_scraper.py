@@ -5,14 +5,13 @@ CUNY School of Law ICS Calendar Scraper
 This scraper fetches events from CUNY School of Law's ICS export URL:
 https://www.law.cuny.edu/events/list/?ical=1
 
-The scraper uses the ics library to parse the calendar data and extract event information.
+The scraper streams the calendar data through ics_stream and extracts event information.
 """
 
 import logging
 import requests
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional
-from ics import Calendar, Event as ICSEvent
 from .base_scraper import BaseScraper
 from .models import Event
 import hashlib
@@ -20,6 +19,7 @@ import re
 from .categorization_helper import EventCategorizer
 from .calendar_configs import ICS_CALENDARS
 from .academic_event_filter import academic_filter
+from .ics_stream import VEvent, iter_vevents
 import json
 
 # Configure logging
@@ -44,29 +44,9 @@ class CUNYLawICSScraper(BaseScraper):
             response = self.session.get(self.url, timeout=30)
             response.raise_for_status()
             
-            # Parse the ICS data
-            calendar = Calendar(response.text)
-            logger.info(f"Successfully parsed ICS calendar with {len(calendar.events)} events")
-            
-            events = []
-            for ics_event in calendar.events:
-                try:
-                    # Filter out internal academic events
-                    if academic_filter.is_internal_academic_event(ics_event.name, getattr(ics_event, 'description', None)):
-                        logger.info(f"Filtering out internal academic event: '{ics_event.name}'")
-                        continue
-                        
-                    event = self._parse_ics_event(ics_event)
-                    if event:
-                        events.append(event)
-                        logger.info(f"Added public event: '{ics_event.name}'")
-                except Exception as e:
-                    logger.warning(f"Failed to parse event '{ics_event.name}': {e}")
-                    continue
-            
-            logger.info(f"Successfully parsed {len(events)} public events from CUNY School of Law (filtered from {len(calendar.events)} total events)")
-            return events
-            
+            # A feed unchanged since the last run is not parsed again
+            return self.parse_events(response, self._parse_feed)
+
         except requests.RequestException as e:
             logger.error(f"Failed to fetch ICS data: {e}")
             return []
@@ -74,7 +54,31 @@ class CUNYLawICSScraper(BaseScraper):
             logger.error(f"Failed to parse ICS calendar: {e}")
             return []
     
-    def _parse_ics_event(self, ics_event: ICSEvent) -> Optional[Event]:
+    def _parse_feed(self, response: requests.Response) -> List[Event]:
+        """Parse the public events out of the ICS feed."""
+        # Parse the ICS data one VEVENT at a time
+        events = []
+        total_events = 0
+        for ics_event in iter_vevents(response.text):
+            total_events += 1
+            try:
+                # Filter out internal academic events
+                if academic_filter.is_internal_academic_event(ics_event.name, getattr(ics_event, 'description', None)):
+                    logger.debug(f"Filtering out internal academic event: '{ics_event.name}'")
+                    continue
+                    
+                event = self._parse_ics_event(ics_event)
+                if event:
+                    events.append(event)
+                    logger.info(f"Added public event: '{ics_event.name}'")
+            except Exception as e:
+                logger.warning(f"Failed to parse event '{ics_event.name}': {e}")
+                continue
+        
+        logger.info(f"Successfully parsed {len(events)} public events from CUNY School of Law (filtered from {total_events} total events)")
+        return events
+
+    def _parse_ics_event(self, ics_event: VEvent) -> Optional[Event]:
         """Parse an individual ICS event into our Event model."""
         try:
             # Generate a unique ID based on event name and start time
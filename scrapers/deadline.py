@@ -0,0 +1,128 @@
+"""
+Wall-clock deadlines for scraper runs.
+
+The run managers open a ``deadline_scope`` around each scraper (and the whole
+run). Inside it every HTTP request made through the shared transport checks
+the deadline first and has its timeout cut to the time left. Once the
+deadline has passed, requests fail immediately with DeadlineExceeded.
+
+DeadlineExceeded is a ``requests.Timeout``, so a scraper that already
+tolerates failed detail-page fetches simply stops fetching and returns the
+events it has parsed so far. That is the cooperative part of the
+cancellation: nothing is killed, and the partial results are kept.
+
+Long CPU-bound loops can call ``check_deadline()`` to stop early as well.
+
+    with deadline_scope(300) as deadline:
+        events = scraper.run()
+    if deadline.hit:
+        print("ran out of time, kept", len(events), "events")
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import requests
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised instead of sending a request once the scraper's deadline has passed."""
+    pass
+
+
+class Deadline:
+    """A point in monotonic time after which work should stop."""
+
+    def __init__(self, seconds: Optional[float], parent: Optional['Deadline'] = None):
+        self.seconds = seconds
+        self.parent = parent
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        if parent is not None and parent.expires_at is not None:
+            if self.expires_at is None or parent.expires_at < self.expires_at:
+                self.expires_at = parent.expires_at
+        # Set once something was refused or cut short because of this deadline
+        self.hit = False
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None if there is no deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self, what: str = "work") -> None:
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expired:
+            self._mark_hit()
+            raise DeadlineExceeded(f"Deadline of {self.seconds}s exceeded, not starting {what}")
+
+    def _mark_hit(self) -> None:
+        deadline = self
+        while deadline is not None:
+            if deadline.expired:
+                deadline.hit = True
+            deadline = deadline.parent
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar('scraper_deadline', default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float], parent: Optional[Deadline] = None):
+    """Run the block under a deadline of ``seconds``, never later than ``parent``.
+
+    ``parent`` defaults to the enclosing scope's deadline; pass it explicitly
+    in worker threads, which do not inherit the context.
+    """
+    deadline = Deadline(seconds, parent=parent or _current_deadline.get())
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def check_deadline(what: str = "work") -> None:
+    """Raise DeadlineExceeded if the current deadline (if any) has passed."""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(what)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left on the current deadline, or None if there is none."""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+def exit_process(code: int = 0) -> None:
+    """Exit with ``code`` without joining worker threads that are still running.
+
+    Interpreter shutdown joins every ThreadPoolExecutor thread, so a sync
+    scraper abandoned past its deadline (stuck in a call that never checks
+    it) would keep the process alive. If any such thread is left, output is
+    flushed and the process exits immediately instead.
+    """
+    stuck = [thread for thread in threading.enumerate()
+             if thread is not threading.current_thread() and not thread.daemon and thread.is_alive()]
+    if not stuck:
+        sys.exit(code)
+    print(f"⏰ Exiting without waiting for {len(stuck)} stuck worker threads: "
+          f"{', '.join(thread.name for thread in stuck)}")
+    logging.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
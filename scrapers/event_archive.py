@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Compressed archive of past events, kept out of the hot Event table.
+
+Archived events are Event rows written as one JSON object per line to
+month-partitioned, gzip-compressed NDJSON files under
+``scrapers/data/archive/`` (``events-2025-07.ndjson.gz`` holds the events
+that started in July 2025). New batches are appended as extra gzip members,
+so archiving never rewrites a file. ``EventArchive.scan`` streams the events
+of a date range and only opens the months that overlap it.
+
+``archive_events`` moves every event that ended before a cutoff out of the
+local SQLite database: each batch is appended to the archive, then deleted in
+the same short transaction. ``cleanup_sqlite.py --archive`` does the same for
+the past events it would otherwise drop.
+
+    python scrapers/event_archive.py archive --older-than-days 30
+    python scrapers/event_archive.py scan --start 2025-01-01 --end 2025-04-01
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+# Fix for relative imports when running as a script
+if __name__ == "__main__":
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    if __package__ is None:
+        __package__ = "scrapers"
+
+try:
+    from .cleanup_sqlite import DEFAULT_BATCH_SIZE, DEFAULT_DB_PATH, delete_events
+    from .event_db import EventDatabase
+except ImportError:
+    from cleanup_sqlite import DEFAULT_BATCH_SIZE, DEFAULT_DB_PATH, delete_events
+    from event_db import EventDatabase
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "archive")
+# Events that ended more than this many days ago are moved to the archive
+DEFAULT_ARCHIVE_AFTER_DAYS = 30
+
+PARTITION_PREFIX = "events-"
+PARTITION_SUFFIX = ".ndjson.gz"
+
+SELECT_ARCHIVABLE_SQL = "SELECT * FROM Event WHERE endDate < :before LIMIT :limit"
+
+DateLike = Union[str, date, datetime]
+
+
+def _iso(value: DateLike) -> str:
+    return value if isinstance(value, str) else value.isoformat()
+
+
+class EventArchive:
+    """Month-partitioned gzip NDJSON files of archived Event rows."""
+
+    def __init__(self, archive_dir: str = DEFAULT_ARCHIVE_DIR):
+        self.archive_dir = archive_dir
+
+    def partition_path(self, month: str) -> str:
+        """File holding the events that started in month ("YYYY-MM")."""
+        return os.path.join(self.archive_dir, f"{PARTITION_PREFIX}{month}{PARTITION_SUFFIX}")
+
+    def months(self) -> List[str]:
+        """Months that have a partition, oldest first."""
+        paths = glob.glob(os.path.join(self.archive_dir, f"{PARTITION_PREFIX}*{PARTITION_SUFFIX}"))
+        return sorted(os.path.basename(path)[len(PARTITION_PREFIX):-len(PARTITION_SUFFIX)] for path in paths)
+
+    def append(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Append rows to their month's partition; returns how many were written."""
+        by_month: Dict[str, List[str]] = {}
+        for row in rows:
+            line = json.dumps(row, separators=(',', ':'), ensure_ascii=False, default=str)
+            by_month.setdefault(str(row['startDate'])[:7], []).append(line)
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        for month, lines in by_month.items():
+            # Each append is a complete gzip member; readers decode consecutive members as one stream
+            with open(self.partition_path(month), 'ab') as f:
+                f.write(gzip.compress(("\n".join(lines) + "\n").encode('utf-8')))
+                f.flush()
+                os.fsync(f.fileno())
+        return sum(len(lines) for lines in by_month.values())
+
+    def scan(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> Iterator[Dict[str, Any]]:
+        """Stream archived events with start <= startDate < end, month by month.
+
+        An event archived twice (a batch appended but not deleted before a
+        crash) is yielded once.
+        """
+        start_iso = _iso(start) if start is not None else None
+        end_iso = _iso(end) if end is not None else None
+        for month in self.months():
+            if (start_iso and month < start_iso[:7]) or (end_iso and month > end_iso[:7]):
+                continue
+            seen = set()
+            with gzip.open(self.partition_path(month), 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    row = json.loads(line)
+                    started = str(row['startDate'])
+                    if (start_iso and started < start_iso) or (end_iso and started >= end_iso):
+                        continue
+                    if row['id'] in seen:
+                        continue
+                    seen.add(row['id'])
+                    yield row
+
+
+def archive_events(db: EventDatabase, archive: EventArchive, before: DateLike,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Move events that ended before ``before`` from the Event table to the archive."""
+    params = {'before': _iso(before), 'limit': max(1, batch_size)}
+    moved = 0
+    while True:
+        with db.transaction() as conn:
+            cursor = conn.execute(SELECT_ARCHIVABLE_SQL, params)
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, values)) for values in cursor]
+            if rows:
+                archive.append(rows)
+                delete_events(conn, [row['id'] for row in rows])
+        moved += len(rows)
+        if len(rows) < params['limit']:
+            return moved
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Archive past events and scan the archive")
+    parser.add_argument('--archive-dir', default=DEFAULT_ARCHIVE_DIR, help='Archive directory (default: scrapers/data/archive)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    archive_parser = commands.add_parser('archive', help='Move old events from the local database to the archive')
+    archive_parser.add_argument('--db', default=DEFAULT_DB_PATH, help='SQLite database (default: prisma/events.db)')
+    archive_parser.add_argument('--older-than-days', type=int, default=DEFAULT_ARCHIVE_AFTER_DAYS,
+                                help=f'Archive events that ended more than this many days ago (default: {DEFAULT_ARCHIVE_AFTER_DAYS})')
+    archive_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                                help=f'Events per transaction (default: {DEFAULT_BATCH_SIZE})')
+
+    scan_parser = commands.add_parser('scan', help='Print archived events as NDJSON')
+    scan_parser.add_argument('--start', help='First start date to include (ISO date)')
+    scan_parser.add_argument('--end', help='Start date to stop before (ISO date)')
+    args = parser.parse_args(argv)
+
+    archive = EventArchive(args.archive_dir)
+    if args.command == 'archive':
+        before = datetime.now(timezone.utc) - timedelta(days=args.older_than_days)
+        with EventDatabase(args.db) as db:
+            moved = archive_events(db, archive, before, args.batch_size)
+        print(f"📦 Archived {moved} events that ended before {before.date().isoformat()} to {args.archive_dir}")
+    else:
+        for row in archive.scan(args.start, args.end):
+            print(json.dumps(row, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Tuned, long-lived connection to the local SQLite events database.
+
+ScraperManagerDB opens one EventDatabase per run instead of one connection
+per scraper. The connection runs in WAL mode, so the local API or a worker
+can keep reading while the run writes, and with ``synchronous=NORMAL``, so a
+commit appends to the WAL without an fsync of the main database. A larger
+page cache and memory-mapped reads keep the Event table and its indexes hot
+between saves, and because the connection outlives each save, sqlite3's
+statement cache reuses the prepared upsert statements for every scraper.
+
+    with EventDatabase(path) as db:
+        with db.transaction() as conn:
+            conn.execute(...)
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+# Applied to every connection, in order
+SQLITE_PRAGMAS: Tuple[Tuple[str, object], ...] = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -64 * 1024),         # in KiB when negative: 64 MiB
+    ("mmap_size", 256 * 1024 * 1024),
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", 30000),            # ms to wait for a reader/writer lock
+)
+# Prepared statements kept per connection
+STATEMENT_CACHE_SIZE = 256
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a connection to path with the run's pragmas applied."""
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    for name, value in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+class EventDatabase:
+    """One connection shared by every save in a run; transactions are serialized."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                self._conn = connect(self.path)
+            return self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the connection for one transaction; commits on success, rolls back on error."""
+        with self._lock:
+            conn = self.connection
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the connection, checkpointing the WAL back into the database file."""
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                conn.close()
+
+    def __enter__(self) -> 'EventDatabase':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,46 @@
+"""
+Secondary indexes on the local SQLite Event table.
+
+The Prisma schema (and its Postgres migrations) declares matching indexes
+with ``@@index``; this module applies them to ``prisma/events.db``, which is
+not managed by Prisma migrations. ``create_event_indexes`` is idempotent and
+runs before every scraper save.
+
+Each index serves one access path:
+
+- ``(endDate, status)``: the past-events cleanup, answered from the index alone
+- ``(updatedAt)`` for CANCELLED and for DENIED rows: the two status cleanups
+- ``(communityId, startDate)``: a community's upcoming events, already in order
+
+SQLite keeps no statistics on how skewed ``status`` is, so with a
+``(status, ...)`` index it would also use that index for the full listing of
+APPROVED and FEATURED events, which is most of the table, and get slower than
+a scan. The shapes above leave that listing on a scan (Postgres, with real
+column statistics, gets plain ``(status, ...)`` indexes). benchmark_queries.py
+shows the query plans and timings with and without these indexes.
+"""
+
+import sqlite3
+from typing import Optional, Tuple, Union
+
+# (name, columns, partial index condition)
+EVENT_INDEXES: Tuple[Tuple[str, Tuple[str, ...], Optional[str]], ...] = (
+    ("Event_endDate_status_idx", ("endDate", "status"), None),
+    ("Event_cancelled_updatedAt_idx", ("updatedAt",), "status = 'CANCELLED'"),
+    ("Event_denied_updatedAt_idx", ("updatedAt",), "status = 'DENIED'"),
+    ("Event_communityId_startDate_idx", ("communityId", "startDate"), None),
+)
+
+
+def create_event_indexes(conn: Union[sqlite3.Connection, sqlite3.Cursor]) -> None:
+    """Create any of the Event indexes that are missing."""
+    for name, columns, where in EVENT_INDEXES:
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        condition = f" WHERE {where}" if where else ""
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "Event" ({column_list}){condition}')
+
+
+def drop_event_indexes(conn: Union[sqlite3.Connection, sqlite3.Cursor]) -> None:
+    """Drop the Event indexes (for benchmarking the table without them)."""
+    for name, _, _ in EVENT_INDEXES:
+        conn.execute(f'DROP INDEX IF EXISTS "{name}"')
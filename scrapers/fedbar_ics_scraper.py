@@ -2,7 +2,7 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 import requests
-from ics import Calendar, Event as ICSEvent
+from .ics_stream import iter_vevents
 
 from .base_scraper import BaseScraper
 from .models import Event
@@ -79,8 +79,7 @@ class FBAICSScraper(BaseScraper):
         try:
             response = self.session.get(self.ics_url)
             response.raise_for_status()
-            cal = Calendar(response.text)
-            for event in cal.events:
+            for event in iter_vevents(response.text):
                 try:
                     summary = event.name or ''
                     description = event.description or ''
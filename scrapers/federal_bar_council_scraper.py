@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
@@ -23,7 +22,7 @@ class FederalBarCouncilScraper(BaseScraper):
         url = "https://www.federalbarcouncil.org/calendar/events/"
         
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -0,0 +1,206 @@
+"""
+Persistent listing fingerprints for incremental detail-page fetching.
+
+Several scrapers read a listing page and then fetch one detail page per
+event to enrich it. Most listing entries are unchanged from one run to the
+next, and so are their detail pages. The FingerprintStore keeps, per source
+and detail URL, a hash of the listing snippet and the last enrichment result
+in a small SQLite database under scrapers/data. A detail page is only fetched
+again when its listing entry is new or has changed, or when the stored result
+is older than ``max_age_seconds`` (so detail-only changes are still picked up
+eventually).
+
+    details = self.fetch_details(detail_url, listing_div,
+                                 lambda: self._fetch_event_details(detail_url))
+
+Only results of fetches that returned are stored; a fetch that raised is
+retried on the next run.
+
+The same table also keeps what a scraper parsed out of a whole listing or
+feed body (``parse_unchanged``). When the HTTP cache answers a request with a
+304 (``response.from_cache``) and the body is the one parsed last time, the
+stored result is returned and the body is not parsed again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from .metrics import current_metrics
+except ImportError:
+    from metrics import current_metrics
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_FINGERPRINT_PATH = os.path.join(PROJECT_ROOT, "scrapers", "data", "fingerprints.sqlite3")
+# Unchanged entries are still re-enriched once their result is this old
+DEFAULT_MAX_AGE_SECONDS = 14 * 24 * 3600
+# Entries whose listing has not been seen for this long are dropped
+PRUNE_AFTER_SECONDS = 90 * 24 * 3600
+
+# Set SCRAPER_FINGERPRINTS=0 to fetch every detail page on every run
+FINGERPRINTS_ENABLED = os.environ.get("SCRAPER_FINGERPRINTS", "1") != "0"
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS fingerprints (
+        source TEXT NOT NULL,
+        url TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        details TEXT NOT NULL,
+        enriched_at REAL NOT NULL,
+        seen_at REAL NOT NULL,
+        PRIMARY KEY (source, url)
+    )
+"""
+
+# Prefix of the keys parsed listing and feed bodies are stored under
+PARSED_PREFIX = "parsed:"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def listing_fingerprint(snippet: Any) -> str:
+    """Hash of a listing entry (an HTML string or a BeautifulSoup tag), ignoring whitespace."""
+    text = _WHITESPACE.sub(" ", str(snippet)).strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """SQLite-backed map of (source, detail URL) to listing fingerprint and enrichment result."""
+
+    def __init__(self, path: str = DEFAULT_FINGERPRINT_PATH,
+                 max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute(CREATE_TABLE_SQL)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS fingerprints_seen_at ON fingerprints (seen_at)")
+        self._conn.execute("DELETE FROM fingerprints WHERE seen_at < ?", (time.time() - PRUNE_AFTER_SECONDS,))
+        self._conn.commit()
+
+    def lookup(self, source: str, url: str, fingerprint: str) -> Tuple[bool, Any]:
+        """``(True, details)`` if the entry is unchanged and its result still fresh, else ``(False, None)``."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, details, enriched_at FROM fingerprints WHERE source = ? AND url = ?",
+                (source, url),
+            ).fetchone()
+            if row is None or row[0] != fingerprint or now - row[2] > self.max_age_seconds:
+                return False, None
+            self._conn.execute(
+                "UPDATE fingerprints SET seen_at = ? WHERE source = ? AND url = ?",
+                (now, source, url),
+            )
+            self._conn.commit()
+        return True, json.loads(row[1])
+
+    def record(self, source: str, url: str, fingerprint: str, details: Any) -> None:
+        """Store the enrichment result for a listing entry."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO fingerprints (source, url, fingerprint, details, enriched_at, seen_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (source, url, fingerprint, json.dumps(details), now, now),
+            )
+            self._conn.commit()
+
+    def enrich(self, source: str, url: str, snippet: Any, fetch: Callable[[], Any]) -> Any:
+        """The stored result for an unchanged listing entry, otherwise ``fetch()`` (which is then stored)."""
+        fingerprint = listing_fingerprint(snippet)
+        found, details = self.lookup(source, url, fingerprint)
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.add_detail_lookup(reused=found)
+        if found:
+            logger.debug(f"Listing unchanged, reusing details for {url}")
+            return details
+        details = fetch()
+        self.record(source, url, fingerprint, details)
+        return details
+
+    def parse_unchanged(self, source: str, response: Any, parse: Callable[[Any], Any]) -> Any:
+        """``parse(response)``, or the stored result if the HTTP cache revalidated the body last parsed."""
+        url = PARSED_PREFIX + response.url
+        fingerprint = hashlib.sha256(response.content).hexdigest()
+        if getattr(response, "from_cache", False):
+            found, parsed = self.lookup(source, url, fingerprint)
+            if found:
+                logger.debug(f"Response unchanged, reusing parsed result for {response.url}")
+                return parsed
+        parsed = parse(response)
+        self.record(source, url, fingerprint, parsed)
+        return parsed
+
+    def forget(self, source: str, url: Optional[str] = None) -> None:
+        """Drop one entry, or every entry of a source, so it is re-enriched next run."""
+        with self._lock:
+            if url is None:
+                self._conn.execute("DELETE FROM fingerprints WHERE source = ?", (source,))
+            else:
+                self._conn.execute("DELETE FROM fingerprints WHERE source = ? AND url = ?", (source, url))
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Stored entries per source."""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT source, COUNT(*) FROM fingerprints GROUP BY source ORDER BY source"
+            ).fetchall())
+
+
+_default_store: Optional[FingerprintStore] = None
+_default_store_lock = threading.Lock()
+
+# Depth of nested suspend_fingerprints() blocks
+_suspended = 0
+_suspended_lock = threading.Lock()
+
+
+def get_fingerprint_store() -> FingerprintStore:
+    """Return the process-wide store under scrapers/data."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = FingerprintStore()
+        return _default_store
+
+
+def fingerprints_active() -> bool:
+    """Whether stored results are used: not with SCRAPER_FINGERPRINTS=0 or inside suspend_fingerprints()."""
+    return FINGERPRINTS_ENABLED and not _suspended
+
+
+@contextmanager
+def suspend_fingerprints():
+    """Neither reuse nor store results in this block, e.g. while a cassette is recorded or replayed."""
+    global _suspended
+    with _suspended_lock:
+        _suspended += 1
+    try:
+        yield
+    finally:
+        with _suspended_lock:
+            _suspended -= 1
+
+
+def parse_unchanged(source: str, response: Any, parse: Callable[[Any], Any]) -> Any:
+    """``parse(response)`` unless the HTTP cache revalidated a body already parsed; the result must be JSON-serializable."""
+    if not fingerprints_active():
+        return parse(response)
+    return get_fingerprint_store().parse_unchanged(source, response, parse)
@@ -1,7 +1,6 @@
 import os
 import json
 import re
-import requests
 import logging
 from typing import Dict, List, Optional
 from googleapiclient.discovery import build
@@ -17,6 +16,7 @@ import pickle
 from .base_scraper import BaseScraper
 from .models import Event
 from .calendar_configs import GOOGLE_CALENDARS
+from .transport import get_session
 from dotenv import load_dotenv
 
 # Setup paths
@@ -367,7 +367,7 @@ def format_google_event(event: Dict, community_id: str) -> Dict:
             # Download and save image if not already present
             if not os.path.exists(full_image_path):
                 try:
-                    img_response = requests.get(image_url, stream=True)
+                    img_response = get_session().get(image_url, stream=True)
                     if img_response.status_code == 200:
                         with open(full_image_path, 'wb') as img_f:
                             for chunk in img_response.iter_content(1024):
@@ -2,7 +2,7 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 import requests
-from ics import Calendar
+from .ics_stream import iter_vevents
 
 from .base_scraper import BaseScraper
 from .models import Event
@@ -23,34 +23,12 @@ class HNBAICSScraper(BaseScraper):
     def get_events(self) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.url)
+            response = self.session.get(self.url)
             response.raise_for_status()
             
-            # Pre-process the ICS data to remove the problematic line
-            lines = response.text.splitlines()
-            filtered_lines = [line for line in lines if not line.startswith('X-TKF-PROMOTION-BUTTON')]
-            ics_text = "\n".join(filtered_lines)
-
-            cal = Calendar(ics_text)
             logger.info(f"Loaded ICS feed for HNBA")
-            for component in cal.events:
-                try:
-                    event = Event(
-                        id=f"hnba_{component.uid}",
-                        name=str(component.name),
-                        description=str(component.description),
-                        url=str(component.url),
-                        startDate=component.begin.isoformat(),
-                        endDate=component.end.isoformat() if component.end else None,
-                        communityId=self.community_id,
-                        locationId=str(component.location) if component.location else "Unknown",
-                        tags=[],
-                        event_type="Unknown",
-                        category="Unknown"
-                    )
-                    events.append(event)
-                except Exception as e:
-                    logger.error(f"Error parsing HNBA event: {e}")
+            # A feed unchanged since the last run is not parsed again
+            events = self.parse_events(response, self._parse_feed)
         except requests.RequestException as e:
             logger.error(f"Error fetching HNBA ICS feed: {e}")
         except Exception as e:
@@ -59,6 +37,29 @@ class HNBAICSScraper(BaseScraper):
         logger.info(f"Successfully scraped {len(events)} events from HNBA")
         return events
 
+    def _parse_feed(self, response: requests.Response) -> List[Event]:
+        events = []
+        # Drop the problematic Tockify property while reading
+        for component in iter_vevents(response.text, skip_properties=['X-TKF-PROMOTION-BUTTON']):
+            try:
+                event = Event(
+                    id=f"hnba_{component.uid}",
+                    name=str(component.name),
+                    description=str(component.description),
+                    url=str(component.url),
+                    startDate=component.begin.isoformat(),
+                    endDate=component.end.isoformat() if component.end else None,
+                    communityId=self.community_id,
+                    locationId=str(component.location) if component.location else "Unknown",
+                    tags=[],
+                    event_type="Unknown",
+                    category="Unknown"
+                )
+                events.append(event)
+            except Exception as e:
+                logger.error(f"Error parsing HNBA event: {e}")
+        return events
+
 if __name__ == '__main__':
     scraper = HNBAICSScraper()
     events = scraper.get_events()
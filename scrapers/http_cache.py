@@ -0,0 +1,275 @@
+"""
+Persistent HTTP response cache with conditional GET.
+
+CachingAdapter is a requests transport adapter that keeps GET response bodies
+in a small SQLite database under scrapers/data. When a cached entry carries
+an ETag or Last-Modified validator, the next request for the same URL sends
+If-None-Match / If-Modified-Since, and a 304 reply is answered with the
+cached body. Unchanged listing pages and ICS feeds then cost one tiny round
+trip instead of a full download.
+
+Responses served from the cache have ``response.from_cache = True`` so a
+scraper can skip re-parsing a body it has already processed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_CACHE_PATH = os.path.join(PROJECT_ROOT, "scrapers", "data", "http_cache.sqlite3")
+# Entries older than this are dropped and refetched unconditionally
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# Least recently used entries are evicted once the stored bodies exceed this
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Set SCRAPER_HTTP_CACHE=0 to bypass the cache entirely
+HTTP_CACHE_ENABLED = os.environ.get("SCRAPER_HTTP_CACHE", "1") != "0"
+
+# Request headers that change the representation and so belong in the key
+KEY_HEADERS = ("Accept", "Accept-Language")
+
+# Stored bodies are already decoded, so framing headers are not kept or replayed
+FRAMING_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding")
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        body BLOB NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        size INTEGER NOT NULL,
+        stored_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+"""
+
+
+def cache_key(request: requests.PreparedRequest) -> str:
+    """Key a request by method, full URL (including query parameters) and representation headers."""
+    parts = [request.method or "GET", request.url or ""]
+    parts.extend(f"{name}:{request.headers.get(name, '')}" for name in KEY_HEADERS)
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store of response bodies with TTL and size-bounded LRU eviction."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute(CREATE_TABLE_SQL)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the stored entry for a key, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[6] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return {
+            "url": row[0],
+            "status": row[1],
+            "headers": json.loads(row[2]),
+            "body": row[3],
+            "etag": row[4],
+            "last_modified": row[5],
+        }
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as used (and still valid) so LRU eviction keeps it."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ?, stored_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._conn.commit()
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """Store a response body along with its validators."""
+        now = time.time()
+        body = response.content
+        headers = {name: value for name, value in response.headers.items()
+                   if name.title() not in FRAMING_HEADERS}
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, url, status, headers, body, etag, last_modified, size, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used until under max_bytes."""
+        self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl_seconds,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that revalidates cached GET responses with conditional requests.
+
+    With ``cache=None`` it behaves like a plain HTTPAdapter.
+    """
+
+    def __init__(self, cache: Optional[ResponseCache], **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        # Streamed downloads (e.g. images) and non-GET requests go straight through
+        if self.cache is None or http_cache_suspended() or request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        key = cache_key(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry["etag"] and "If-None-Match" not in request.headers:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"] and "If-Modified-Since" not in request.headers:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Not modified, serving cached body for {request.url}")
+            self.cache.touch(key)
+            return self._build_cached_response(request, response, entry)
+
+        if response.status_code == 200 and self._is_cacheable(response):
+            self.cache.put(key, response)
+        return response
+
+    @staticmethod
+    def _is_cacheable(response: requests.Response) -> bool:
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        return bool(response.headers.get("ETag") or response.headers.get("Last-Modified"))
+
+    def _build_cached_response(self, request: requests.PreparedRequest,
+                               not_modified: requests.Response, entry: dict) -> requests.Response:
+        """Rebuild the original 200 response, refreshed with the 304's headers."""
+        headers = CaseInsensitiveDict(entry["headers"])
+        for name, value in not_modified.headers.items():
+            if name.title() not in FRAMING_HEADERS:
+                headers[name] = value
+        headers["Content-Length"] = str(len(entry["body"]))
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = entry["body"]
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+# Depth of nested suspend_http_cache() blocks
+_suspended = 0
+_suspended_lock = threading.Lock()
+
+
+def http_cache_suspended() -> bool:
+    return _suspended > 0
+
+
+@contextmanager
+def suspend_http_cache():
+    """Send every request as if nothing were cached, and cache nothing, in this block."""
+    global _suspended
+    with _suspended_lock:
+        _suspended += 1
+    try:
+        yield
+    finally:
+        with _suspended_lock:
+            _suspended -= 1
+
+
+def get_default_cache() -> ResponseCache:
+    """Return the process-wide cache stored under scrapers/data."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
+
+
+def install_cache(session: requests.Session, cache: Optional[ResponseCache] = None) -> requests.Session:
+    """Mount a CachingAdapter for http and https on a session."""
+    if not HTTP_CACHE_ENABLED and cache is None:
+        return session
+    adapter = CachingAdapter(cache or get_default_cache())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
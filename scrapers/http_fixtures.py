@@ -0,0 +1,181 @@
+"""
+Record/replay HTTP fixtures for offline scraper runs.
+
+A cassette is a JSON file under scrapers/fixtures/ holding the responses a
+scraper received. While a cassette is active, every request made through a
+requests Session goes through it. That includes BaseScraper.session and
+module-level ``requests.get`` calls, which use a Session internally. In
+"record" mode requests go to the network and the responses are saved; in
+"replay" mode they are answered from the file and nothing leaves the machine.
+
+    with cassette("nycbar", mode="record"):
+        NYCBarScraper("com_nycbar").get_events()
+
+    with cassette("nycbar"):  # replay
+        NYCBarScraper("com_nycbar").get_events()
+
+While a cassette is active, the fingerprint store, the HTTP cache and the
+Luma details cache are suspended. Every detail page is requested (and so
+recorded) and parsed on every replay, and nothing is written to the stores
+under scrapers/data.
+
+Async scrapers fetching with aiohttp are not covered.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    from .fingerprint_store import suspend_fingerprints
+    from .http_cache import suspend_http_cache
+except ImportError:
+    from fingerprint_store import suspend_fingerprints
+    from http_cache import suspend_http_cache
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+FIXTURES_DIR = os.path.join(PROJECT_ROOT, "scrapers", "fixtures")
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Decoded bodies are stored, so these would describe the wrong bytes on replay
+FRAMING_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding")
+
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """Raised in replay mode for a request the cassette has no response for.
+
+    Not a ConnectionError, so the retrying session fails it at once instead of
+    backing off and retrying.
+    """
+    pass
+
+
+def request_key(request: requests.PreparedRequest) -> str:
+    """Identify a request by method, full URL and a digest of its body."""
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+    return f"{request.method} {request.url} {digest}"
+
+
+class Cassette:
+    """Responses for one scraper, keyed by request and replayed in recorded order."""
+
+    def __init__(self, name: str, mode: str = REPLAY, fixtures_dir: str = FIXTURES_DIR):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.name = name
+        self.mode = mode
+        self.path = os.path.join(fixtures_dir, f"{name}.json")
+        self.interactions: Dict[str, List[dict]] = defaultdict(list)
+        self._play_counts: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if mode == REPLAY:
+            self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"No cassette at {self.path}; record it first")
+        with open(self.path, "r", encoding="utf-8") as f:
+            for interaction in json.load(f)["interactions"]:
+                self.interactions[interaction["key"]].append(interaction)
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        interactions = [entry for entries in self.interactions.values() for entry in entries]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"name": self.name, "interactions": interactions}, f, indent=2, ensure_ascii=False)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        content = response.content
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        with self._lock:
+            self.interactions[request_key(request)].append({
+                "key": request_key(request),
+                "status": response.status_code,
+                "reason": response.reason,
+                "url": response.url,
+                "headers": {name: value for name, value in response.headers.items()
+                            if name.title() not in FRAMING_HEADERS},
+                "body": body,
+                "body_encoding": encoding,
+            })
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        key = request_key(request)
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                raise CassetteMissError(f"Cassette {self.name!r} has no response for {key}", request=request)
+            # Repeated requests get the recorded responses in order, then the last one again
+            index = min(self._play_counts[key], len(entries) - 1)
+            self._play_counts[key] += 1
+            entry = entries[index]
+
+        content = entry["body"].encode("utf-8") if entry["body_encoding"] == "utf-8" else base64.b64decode(entry["body"])
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["Content-Length"] = str(len(content))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        response.url = entry.get("url") or request.url
+        response.request = request
+        return response
+
+
+_active: Optional[Cassette] = None
+_active_lock = threading.Lock()
+_original_send = requests.Session.send
+
+
+def _send(session: requests.Session, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+    active = _active
+    if active is None:
+        return _original_send(session, request, **kwargs)
+    if active.mode == REPLAY:
+        return active.play(request)
+    response = _original_send(session, request, **kwargs)
+    active.record(request, response)
+    return response
+
+
+@contextmanager
+def cassette(name: str, mode: str = REPLAY, fixtures_dir: str = FIXTURES_DIR):
+    """Route every requests Session through a cassette for the duration of the block."""
+    global _active
+    current = Cassette(name, mode=mode, fixtures_dir=fixtures_dir)
+    with _active_lock:
+        if _active is not None:
+            raise RuntimeError(f"Cassette {_active.name!r} is already active")
+        _active = current
+        requests.Session.send = _send
+    try:
+        with suspend_fingerprints(), suspend_http_cache():
+            yield current
+    finally:
+        with _active_lock:
+            _active = None
+            requests.Session.send = _original_send
+        if mode == RECORD:
+            current.save()
+
+
+def has_cassette(name: str, fixtures_dir: str = FIXTURES_DIR) -> bool:
+    return os.path.exists(os.path.join(fixtures_dir, f"{name}.json"))
@@ -1,18 +1,25 @@
 import os
 import json
 import requests
+import contextvars
 import hashlib
 import logging
 import pytz
 import re
+import threading
+import time
 from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
-from ics import Calendar, Event as ICSEvent
 from .base_scraper import BaseScraper
 from .models import Event
 from .categorization_helper import EventCategorizer
 from .calendar_configs import ICS_CALENDARS
+from .fingerprint_store import parse_unchanged
+from .http_cache import http_cache_suspended
+from .ics_stream import iter_vevents
+from .transport import get_session
 
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -24,6 +31,11 @@ CONFIG_DATA_DIR = os.path.join(PROJECT_ROOT, 'public', 'data')
 # Directory for scraper's own output (will be refined in later refactoring stages)
 OUTPUT_DATA_DIR = os.path.join(PROJECT_ROOT, 'scrapers', 'data')
 
+# Luma detail enrichment: parallel page fetches, a per-run memo and an on-disk TTL cache
+LUMA_DETAILS_WORKERS = 8
+LUMA_DETAILS_TTL_SECONDS = 24 * 3600
+LUMA_DETAILS_CACHE_FILE = os.path.join(OUTPUT_DATA_DIR, 'luma_details_cache.json')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,26 +55,146 @@ try:
 except Exception as e:
     logging.error(f"Error loading communities data from {CONFIG_DATA_DIR}: {e}")
 
-def get_luma_event_details(event_url: str) -> Optional[Dict]:
+class LumaDetailsCache:
+    """Luma event details keyed by event URL, persisted as JSON with a TTL."""
+
+    def __init__(self, path: str = LUMA_DETAILS_CACHE_FILE, ttl_seconds: float = LUMA_DETAILS_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                if os.path.exists(self.path):
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._entries = json.load(f)
+            except Exception as e:
+                logging.warning(f"Ignoring unreadable Luma details cache {self.path}: {e}")
+        return self._entries
+
+    def get(self, url: str) -> Optional[Dict]:
+        # Like the HTTP cache, bypassed while it is suspended (under a cassette)
+        if http_cache_suspended():
+            return None
+        with self._lock:
+            entry = self._load().get(url)
+        if entry and time.time() - entry.get('fetched_at', 0) <= self.ttl_seconds:
+            return entry['details']
+        return None
+
+    def put(self, url: str, details: Dict) -> None:
+        if http_cache_suspended():
+            return
+        with self._lock:
+            self._load()[url] = {'fetched_at': time.time(), 'details': details}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk, dropping expired entries."""
+        with self._lock:
+            if not self._dirty:
+                return
+            cutoff = time.time() - self.ttl_seconds
+            entries = {url: entry for url, entry in self._load().items() if entry.get('fetched_at', 0) >= cutoff}
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+                self._entries = entries
+                self._dirty = False
+            except Exception as e:
+                logging.warning(f"Could not save Luma details cache {self.path}: {e}")
+
+
+luma_details_cache = LumaDetailsCache()
+
+# Details already looked up in this run, so the ICS pass and parse_location
+# never fetch the same page twice. Failed lookups are not kept, so the next
+# lookup tries again; clear_luma_details_memo() starts a new run.
+_luma_details_memo: Dict[str, Dict] = {}
+_luma_details_memo_lock = threading.Lock()
+
+
+def clear_luma_details_memo() -> None:
+    """Forget the details looked up so far; called at the start of each run."""
+    with _luma_details_memo_lock:
+        _luma_details_memo.clear()
+
+
+def normalize_luma_url(event_url) -> Optional[str]:
+    """Return the Luma page URL for an ICS URL/location value, or None if it is not one."""
+    # Make sure we have a valid URL
+    if not event_url or not isinstance(event_url, str):
+        return None
+
+    # Normalize URL format if needed
+    if event_url.startswith('LOCATION:'):
+        event_url = event_url.replace('LOCATION:', '')
+    event_url = event_url.strip()
+
+    # Ensure URL is a Luma URL
+    if 'lu.ma' not in event_url:
+        return None
+    return event_url
+
+
+def get_luma_event_details(event_url: str, session: Optional[requests.Session] = None) -> Optional[Dict]:
+    """Return detailed event information for a Luma event page.
+
+    Looks in the per-run memo, then the on-disk cache, and only then fetches
+    the page.
+    """
+    event_url = normalize_luma_url(event_url)
+    if not event_url:
+        return None
+
+    with _luma_details_memo_lock:
+        if event_url in _luma_details_memo:
+            return _luma_details_memo[event_url]
+
+    details = luma_details_cache.get(event_url)
+    if details is None:
+        details = fetch_luma_event_details(event_url, session)
+        if details is not None:
+            luma_details_cache.put(event_url, details)
+
+    if details is not None:
+        with _luma_details_memo_lock:
+            _luma_details_memo[event_url] = details
+    return details
+
+
+def enrich_luma_details(urls: Iterable[str], session: Optional[requests.Session] = None,
+                        max_workers: int = LUMA_DETAILS_WORKERS) -> Dict[str, Optional[Dict]]:
+    """Look up details for many Luma URLs at once, fetching uncached pages in parallel."""
+    unique_urls = list(dict.fromkeys(filter(None, map(normalize_luma_url, urls))))
+    if not unique_urls:
+        return {}
+
+    session = session or get_session()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_urls)))) as executor:
+        # Each task carries the caller's context so its requests count toward the caller's metrics
+        futures = [executor.submit(contextvars.copy_context().run, get_luma_event_details, url, session)
+                   for url in unique_urls]
+        results = [future.result() for future in futures]
+    luma_details_cache.save()
+    return dict(zip(unique_urls, results))
+
+
+def fetch_luma_event_details(event_url: str, session: Optional[requests.Session] = None) -> Optional[Dict]:
     """Fetch detailed event information from Luma event page"""
     try:
-        # Make sure we have a valid URL
-        if not event_url or not isinstance(event_url, str):
-            return None
-            
-        # Normalize URL format if needed
-        if event_url.startswith('LOCATION:'):
-            event_url = event_url.replace('LOCATION:', '')
-            
-        # Ensure URL is a Luma URL
-        if 'lu.ma' not in event_url:
-            return None
-            
         logging.info(f"Fetching details from Luma event URL: {event_url}")
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(event_url, headers=headers, timeout=30)
+        response = (session or get_session()).get(event_url, headers=headers, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -187,14 +319,14 @@ def get_luma_event_details(event_url: str) -> Optional[Dict]:
         logging.error(f"Error fetching Luma event details: {e}")
         return None
 
-def get_luma_events(ics_url):
+def get_luma_events(ics_url, session: Optional[requests.Session] = None):
     """Fetch and parse Luma calendar events from ICS feed"""
     try:
         logging.info(f"Fetching ICS feed from: {ics_url}")
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(ics_url, headers=headers, timeout=30)
+        response = (session or get_session()).get(ics_url, headers=headers, timeout=30)
         response.raise_for_status()
         
         if not response.text:
@@ -202,54 +334,11 @@ def get_luma_events(ics_url):
             return []
             
         logging.info(f"Successfully fetched ICS feed, size: {len(response.text)} bytes")
-        cal = Calendar(response.text)
-        events = []
+        # A feed unchanged since the last run is neither parsed nor enriched again
+        events = parse_unchanged("luma", response, lambda fresh: _parse_luma_feed(fresh, session))
+        # Drop the events a reused result holds that have ended since
         now = datetime.now(pytz.utc)
-        
-        for event in cal.events:
-            try:
-                # Skip past events (end time in past)
-                if not hasattr(event, 'end') or event.end is None or event.end < now:
-                    continue
-                # Get event name/summary
-                event_name = getattr(event, 'name', None) or getattr(event, 'summary', None)
-                if not event_name:
-                    continue
-                # Skip if missing start
-                if not hasattr(event, 'begin') or event.begin is None:
-                    continue
-                # Get event URL from:
-                # 1. URL property
-                # 2. Location field if it contains a Luma URL
-                # 3. Description field if it contains a Luma URL
-                event_url = getattr(event, 'url', '')
-                location = getattr(event, 'location', '')
-                description = getattr(event, 'description', '')
-                # Check if location is a Luma URL
-                if not event_url and location and 'lu.ma' in location:
-                    event_url = location
-                # Alternative: Extract URL from description if needed
-                if not event_url and description:
-                    urls = re.findall(r'https?://lu\.ma/\S+', description)
-                    if urls:
-                        event_url = urls[0]
-                # Get detailed event information if we have a URL
-                event_details = get_luma_event_details(event_url) if event_url else None
-                events.append({
-                    "uid": getattr(event, 'uid', ''),
-                    "summary": event_name,
-                    "start": event.begin.datetime.isoformat() if event.begin.datetime else None,
-                    "end": event.end.datetime.isoformat() if event.end.datetime else None,
-                    "location": location,
-                    "description": description,
-                    "organizer": getattr(event, 'organizer', ''),
-                    "geo": getattr(event, 'geo', ''),
-                    "url": event_url,
-                    "additional_details": event_details
-                })
-            except Exception as e:
-                logging.error(f"Error processing event: {e}")
-                continue
+        events = [e for e in events if e['end'] is None or datetime.fromisoformat(e['end']) >= now]
         logging.info(f"Found {len(events)} upcoming events")
         return events
     except requests.exceptions.RequestException as e:
@@ -259,6 +348,63 @@ def get_luma_events(ics_url):
         logging.error(f"Unexpected error processing ICS feed: {e}")
         return []
 
+def _parse_luma_feed(response: requests.Response, session: Optional[requests.Session] = None) -> List[dict]:
+    """Upcoming events of a Luma ICS feed, with their event page details."""
+    events = []
+    now = datetime.now(pytz.utc)
+
+    for event in iter_vevents(response.text, ends_after=now):
+        try:
+            # Skip past events (end time in past)
+            if not hasattr(event, 'end') or event.end is None or event.end < now:
+                continue
+            # Get event name/summary
+            event_name = getattr(event, 'name', None) or getattr(event, 'summary', None)
+            if not event_name:
+                continue
+            # Skip if missing start
+            if not hasattr(event, 'begin') or event.begin is None:
+                continue
+            # Get event URL from:
+            # 1. URL property
+            # 2. Location field if it contains a Luma URL
+            # 3. Description field if it contains a Luma URL
+            event_url = getattr(event, 'url', '')
+            location = getattr(event, 'location', '')
+            description = getattr(event, 'description', '')
+            # Check if location is a Luma URL
+            if not event_url and location and 'lu.ma' in location:
+                event_url = location
+            # Alternative: Extract URL from description if needed
+            if not event_url and description:
+                urls = re.findall(r'https?://lu\.ma/\S+', description)
+                if urls:
+                    event_url = urls[0]
+            # Detailed event information is filled in below, once per feed
+            events.append({
+                "uid": getattr(event, 'uid', ''),
+                "summary": event_name,
+                "start": event.begin.datetime.isoformat() if event.begin.datetime else None,
+                "end": event.end.datetime.isoformat() if event.end.datetime else None,
+                "location": location,
+                "description": description,
+                "organizer": getattr(event, 'organizer', ''),
+                "geo": getattr(event, 'geo', ''),
+                "url": event_url,
+                "additional_details": None
+            })
+        except Exception as e:
+            logging.error(f"Error processing event: {e}")
+            continue
+
+    # Fetch every event page (and Luma location page, used later by
+    # parse_location) in parallel; repeats are served from the memo
+    location_urls = [e['location'].replace('\\', '') for e in events if e['location']]
+    details = enrich_luma_details([e['url'] for e in events] + location_urls, session=session)
+    for event in events:
+        event['additional_details'] = details.get(normalize_luma_url(event['url']))
+    return events
+
 def parse_location(raw_location):
     """Extract structured location data from ICS location field"""
     if not raw_location:
@@ -458,6 +604,7 @@ def main():
     except Exception as e:
         logging.error(f"Error loading existing events: {e}")
     
+    clear_luma_details_memo()
     for calendar_name, calendar_config in ICS_CALENDARS.items():
         logging.info(f"Fetching events for {calendar_name}")
         calendar_events = get_luma_events(calendar_config["id"])
@@ -496,11 +643,12 @@ class ICSCalendarScraper(BaseScraper):
 
     def get_events(self) -> List[Event]:
         events = []
+        clear_luma_details_memo()
         # Iterate through all configured ICS calendars
         for calendar_name, calendar_config in ICS_CALENDARS.items():
             try:
                 logging.info(f"Fetching events for {calendar_name} from {calendar_config['id']}")
-                ics_events = get_luma_events(calendar_config["id"])
+                ics_events = get_luma_events(calendar_config["id"], session=self.session)
                 # Filter out None values
                 ics_events = [e for e in ics_events if e is not None]
                 logging.info(f"Processing {len(ics_events)} events (type: {[type(e) for e in ics_events]}) from {calendar_name}")
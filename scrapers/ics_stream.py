@@ -0,0 +1,279 @@
+"""
+Streaming ICS reader.
+
+``ics.Calendar(text)`` builds every component of a feed in memory before the
+first event can be looked at, which is slow on large multi-year feeds. This
+module reads a feed line by line, unfolds continuation lines, and yields one
+lightweight VEvent per VEVENT block. Only the raw property values are kept;
+dates and text are decoded on first access, so callers can drop an event
+(e.g. one that has already ended) before paying for the rest of it.
+
+VEvent exposes the same attributes the scrapers used from ``ics.Event``
+(``uid``, ``name``, ``description``, ``location``, ``url``, ``begin``,
+``end``, ``categories``, ``organizer``, ``geo``), with ``begin``/``end`` as
+Arrow objects, so it is a drop-in replacement.
+"""
+
+import io
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import arrow
+from dateutil import tz
+
+logger = logging.getLogger(__name__)
+
+# Properties whose values are TEXT and carry RFC 5545 escapes
+TEXT_PROPERTIES = {"SUMMARY", "DESCRIPTION", "LOCATION", "COMMENT", "CONTACT"}
+
+_TEXT_ESCAPES = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+
+Property = Tuple[Dict[str, str], str]
+
+
+def unescape_text(value: str) -> str:
+    """Decode RFC 5545 TEXT escapes (\\n, \\, \\; and \\\\)."""
+    if "\\" not in value:
+        return value
+    out = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            nxt = next(chars, "")
+            out.append(_TEXT_ESCAPES.get(nxt, nxt))
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Join RFC 5545 continuation lines (those starting with a space or tab)."""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Split ``NAME;PARAM=x:value`` into its name, parameters and value."""
+    # The value starts at the first colon that is not inside a quoted parameter
+    in_quotes = False
+    split_at = -1
+    for index, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            split_at = index
+            break
+    if split_at < 0:
+        return line.upper(), {}, ""
+    head, value = line[:split_at], line[split_at + 1:]
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw in raw_params:
+        key, _, param_value = raw.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+
+def parse_ics_datetime(value: str, params: Dict[str, str]) -> Tuple[arrow.Arrow, bool]:
+    """Return (Arrow, is_all_day) for a DTSTART/DTEND value."""
+    value = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+        parsed = datetime.strptime(value[:8], "%Y%m%d")
+        return arrow.get(parsed, tzinfo=timezone.utc), True
+    if value.endswith("Z"):
+        parsed = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S")
+        return arrow.get(parsed, tzinfo=timezone.utc), False
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    tzid = params.get("TZID")
+    tzinfo = tz.gettz(tzid) if tzid else None
+    # Floating times and unknown zones are read as UTC, as ics.Calendar does
+    return arrow.get(parsed, tzinfo=tzinfo or timezone.utc), False
+
+
+def parse_ics_duration(value: str) -> timedelta:
+    """Parse an RFC 5545 DURATION such as ``PT1H30M`` or ``-P1D``."""
+    value = value.strip()
+    sign = -1 if value.startswith("-") else 1
+    value = value.lstrip("+-")[1:]  # drop the leading P
+    total = timedelta()
+    number = ""
+    in_time = False
+    units = {"W": "weeks", "D": "days", "H": "hours", "M": "minutes", "S": "seconds"}
+    for char in value:
+        if char == "T":
+            in_time = True
+        elif char.isdigit():
+            number += char
+        elif char in units and number:
+            unit = units[char]
+            if char == "M" and not in_time:
+                unit = "days"  # months are not valid in durations; treat leniently
+            total += timedelta(**{unit: int(number)})
+            number = ""
+    return sign * total
+
+
+class VEvent:
+    """A single VEVENT with lazily decoded properties."""
+
+    __slots__ = ("properties", "_begin", "_end", "_all_day")
+
+    def __init__(self, properties: Dict[str, List[Property]]):
+        self.properties = properties
+        self._begin = None
+        self._end = None
+        self._all_day = None
+
+    def raw(self, name: str) -> Optional[Property]:
+        """Return the first (params, value) pair for a property, or None."""
+        values = self.properties.get(name)
+        return values[0] if values else None
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a property's value, unescaped for TEXT properties."""
+        prop = self.raw(name)
+        if prop is None:
+            return default
+        value = prop[1]
+        return unescape_text(value) if name in TEXT_PROPERTIES else value
+
+    @property
+    def uid(self) -> Optional[str]:
+        return self.get("UID")
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.get("SUMMARY")
+
+    @property
+    def description(self) -> Optional[str]:
+        return self.get("DESCRIPTION")
+
+    @property
+    def location(self) -> Optional[str]:
+        return self.get("LOCATION")
+
+    @property
+    def url(self) -> Optional[str]:
+        return self.get("URL")
+
+    @property
+    def organizer(self) -> Optional[str]:
+        return self.get("ORGANIZER")
+
+    @property
+    def geo(self) -> Optional[str]:
+        return self.get("GEO")
+
+    @property
+    def categories(self) -> set:
+        categories = set()
+        for _, value in self.properties.get("CATEGORIES", []):
+            categories.update(unescape_text(part).strip() for part in value.split(",") if part.strip())
+        return categories
+
+    @property
+    def begin(self) -> Optional[arrow.Arrow]:
+        if self._begin is None:
+            prop = self.raw("DTSTART")
+            if prop is None:
+                return None
+            self._begin, self._all_day = parse_ics_datetime(prop[1], prop[0])
+        return self._begin
+
+    @property
+    def all_day(self) -> bool:
+        self.begin
+        return bool(self._all_day)
+
+    @property
+    def end(self) -> Optional[arrow.Arrow]:
+        """DTEND, or DTSTART + DURATION; all-day events default to one day."""
+        if self._end is None:
+            begin = self.begin
+            if begin is None:
+                return None
+            dtend = self.raw("DTEND")
+            duration = self.raw("DURATION")
+            if dtend is not None:
+                self._end, _ = parse_ics_datetime(dtend[1], dtend[0])
+            elif duration is not None:
+                self._end = begin + parse_ics_duration(duration[1])
+            elif self._all_day:
+                self._end = begin.shift(days=1)
+            else:
+                self._end = begin
+        return self._end
+
+    def __repr__(self) -> str:
+        return f"<VEvent uid={self.uid!r} name={self.name!r}>"
+
+
+def _iter_source_lines(source: Union[str, bytes, Iterable[str], io.IOBase]) -> Iterable[str]:
+    if isinstance(source, bytes):
+        source = source.decode("utf-8", errors="replace")
+    if isinstance(source, str):
+        return io.StringIO(source)
+    return source
+
+
+def iter_vevents(source: Union[str, bytes, Iterable[str], io.IOBase],
+                 skip_properties: Iterable[str] = (),
+                 ends_after: Optional[Union[datetime, date]] = None,
+                 predicate: Optional[Callable[[VEvent], bool]] = None) -> Iterator[VEvent]:
+    """Yield the VEVENTs of an ICS feed one at a time.
+
+    ``source`` may be feed text, bytes, a file object or any iterable of lines.
+    Properties named in ``skip_properties`` are dropped as they are read.
+    Events that ended before ``ends_after`` and events for which ``predicate``
+    returns False are skipped without decoding anything else. Events whose
+    dates cannot be parsed are logged and skipped.
+    """
+    skip = {name.upper() for name in skip_properties}
+    cutoff = arrow.get(ends_after) if ends_after is not None else None
+    properties: Optional[Dict[str, List[Property]]] = None
+    depth = 0  # nesting inside the current VEVENT (e.g. VALARM)
+
+    for line in unfold_lines(_iter_source_lines(source)):
+        if not line:
+            continue
+        name, params, value = parse_content_line(line)
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and properties is None:
+                properties = {}
+            elif properties is not None:
+                depth += 1
+            continue
+        if name == "END":
+            if properties is None:
+                continue
+            if depth:
+                depth -= 1
+                continue
+            if value.upper() == "VEVENT":
+                event = VEvent(properties)
+                properties = None
+                try:
+                    if cutoff is not None and (event.end is None or event.end < cutoff):
+                        continue
+                except ValueError as e:
+                    logger.warning(f"Skipping VEVENT {event.uid!r} with unparseable dates: {e}")
+                    continue
+                if predicate is not None and not predicate(event):
+                    continue
+                yield event
+            continue
+        if properties is None or depth or name in skip:
+            continue
+        properties.setdefault(name, []).append((params, value))
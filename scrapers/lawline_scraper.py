@@ -11,7 +11,7 @@ Lawline provides online CLE courses for attorneys.
 import logging
 import requests
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from .base_scraper import BaseScraper
 from .models import Event
 import hashlib
@@ -19,13 +19,22 @@ import re
 import json
 import brotli
 from .categorization_helper import EventCategorizer
+from .pagination import Page, Paginator
+from .retry import IDEMPOTENT_METHODS, RetryPolicy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How far ahead to fetch courses, and the search page size
+DAYS_AHEAD = 30
+PER_PAGE = 50
+
 class LawlineScraper(BaseScraper):
     """Scraper for Lawline CLE courses and events from their API."""
+
+    # The instant-search endpoint is a read-only POST, so it is safe to retry
+    retry_policy = RetryPolicy(retry_methods=IDEMPOTENT_METHODS | {"POST"})
     
     def __init__(self):
         super().__init__(community_id="com_lawline")
@@ -65,63 +74,44 @@ class LawlineScraper(BaseScraper):
                     "practice_area": [],
                     "credit_type": [],
                     "credit_amount": [],
-                    "date_range": "next_30_days"  # Get courses in next 30 days
+                    "date_range": f"next_{DAYS_AHEAD}_days"
                 },
                 "sort": "date",
-                "page": 1,
-                "per_page": 50
+                "per_page": PER_PAGE
             }
             
             logger.info(f"Sending payload: {json.dumps(payload, indent=2)}")
             
-            # Fetch the events data
-            response = self.session.post(
-                self.api_url, 
-                json=payload,
-                headers=headers, 
-                timeout=30
+            # Live events are not paged; they come with the first page only
+            live_events = []
+            
+            def fetch_page(page: int) -> Page:
+                response = self.session.post(
+                    self.api_url, 
+                    json={**payload, "page": page},
+                    headers=headers, 
+                    timeout=30
+                )
+                response.raise_for_status()
+                data = self._decode_response(response)
+                if data is None:
+                    return Page([])
+                if page == 1:
+                    live_events.extend(data.get('live_events', []))
+                total_items, total_pages = self._page_totals(data)
+                # Lawline uses 'hits' for search results
+                return Page(data.get('hits', []), total_items=total_items, total_pages=total_pages)
+            
+            # Courses are sorted by date, so stop at the first one past the horizon
+            paginator = Paginator(
+                fetch_page,
+                per_page=PER_PAGE,
+                item_start=self._course_start,
+                horizon=datetime.now(timezone.utc) + timedelta(days=DAYS_AHEAD),
             )
-            response.raise_for_status()
-            
-            # Debug: Log the response
-            logger.info(f"Response status: {response.status_code}")
-            logger.info(f"Response headers: {dict(response.headers)}")
-            
-            # Try to get the response text first
-            response_text = response.text
-            logger.info(f"Response text (first 500 chars): {response_text[:500]}")
-            
-            # If the response is not valid JSON, try decompressing Brotli
-            try:
-                data = response.json()
-                logger.info(f"Successfully parsed JSON response")
-                logger.info(f"Response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-            except Exception as e:
-                logger.error(f"JSON decode failed: {e}")
-                # Try Brotli decompress
-                try:
-                    decompressed = brotli.decompress(response.content)
-                    logger.info(f"Brotli decompressed response (first 500 chars): {decompressed[:500]}")
-                    try:
-                        data = json.loads(decompressed)
-                        logger.info(f"Successfully parsed JSON after Brotli decompress")
-                        logger.info(f"Response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                    except Exception as e2:
-                        logger.error(f"JSON decode after Brotli decompress failed: {e2}")
-                        logger.error(f"Raw Brotli response: {decompressed[:500]}")
-                        return []
-                except Exception as e3:
-                    logger.error(f"Brotli decompress failed: {e3}")
-                    logger.error(f"Raw response bytes: {response.content[:500]}")
-                    return []
             
             events = []
-            
-            # Parse courses from the response - Lawline returns courses in a different structure
-            courses = data.get('hits', [])  # Lawline uses 'hits' for search results
-            logger.info(f"Found {len(courses)} courses")
-            
-            for course_data in courses:
+            for course_data in paginator:
                 try:
                     event = self._parse_course(course_data)
                     if event:
@@ -129,9 +119,9 @@ class LawlineScraper(BaseScraper):
                 except Exception as e:
                     logger.warning(f"Failed to parse course '{course_data.get('name', 'Unknown')}': {e}")
                     continue
+            logger.info(f"Found {len(events)} courses in {paginator.pages_fetched} page(s)")
             
             # Also check for any live events or webinars
-            live_events = data.get('live_events', [])
             logger.info(f"Found {len(live_events)} live events")
             
             for event_data in live_events:
@@ -156,6 +146,45 @@ class LawlineScraper(BaseScraper):
             logger.error(f"Traceback: {traceback.format_exc()}")
             return []
     
+    def _decode_response(self, response: requests.Response) -> Optional[Dict[str, Any]]:
+        """JSON body of a search response, falling back to a manual Brotli decode."""
+        logger.info(f"Response status: {response.status_code}")
+        logger.debug(f"Response headers: {dict(response.headers)}")
+        
+        # If the response is not valid JSON, try decompressing Brotli
+        try:
+            data = response.json()
+            logger.info(f"Response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+            return data
+        except Exception as e:
+            logger.error(f"JSON decode failed: {e}")
+            logger.error(f"Response text (first 500 chars): {response.text[:500]}")
+        try:
+            decompressed = brotli.decompress(response.content)
+        except Exception as e:
+            logger.error(f"Brotli decompress failed: {e}")
+            logger.error(f"Raw response bytes: {response.content[:500]}")
+            return None
+        try:
+            data = json.loads(decompressed)
+            logger.info(f"Successfully parsed JSON after Brotli decompress")
+            return data
+        except Exception as e:
+            logger.error(f"JSON decode after Brotli decompress failed: {e}")
+            logger.error(f"Raw Brotli response: {decompressed[:500]}")
+            return None
+    
+    def _page_totals(self, data: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
+        """Total hits and pages, if the search response reports them."""
+        total_items = next((data[key] for key in ('total', 'total_hits', 'nbHits') if isinstance(data.get(key), int)), None)
+        total_pages = next((data[key] for key in ('last_page', 'total_pages', 'nbPages') if isinstance(data.get(key), int)), None)
+        return total_items, total_pages
+    
+    def _course_start(self, course_data: Dict[str, Any]) -> Optional[datetime]:
+        """Start time of a raw course, for the paginator's horizon check."""
+        date_timestamp = course_data.get('date_timestamp')
+        return self._parse_timestamp(date_timestamp) if date_timestamp else None
+    
     def _parse_course(self, course_data: Dict[str, Any]) -> Optional[Event]:
         """Parse an individual course from the API response."""
         try:
@@ -9,9 +9,9 @@ import time
 import re
 import hashlib
 try:
-from .base_scraper import BaseScraper
-from .models import Event
-from .categorization_helper import EventCategorizer
+    from .base_scraper import BaseScraper
+    from .models import Event
+    from .categorization_helper import EventCategorizer
 except ImportError:
     import sys
     import os
@@ -56,7 +56,7 @@ class LawyersAllianceScraper(BaseScraper):
         """Get events from the Lawyers Alliance website."""
         events = []
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = self.session.get(self.url, headers=self.headers)
             response.raise_for_status()
 
             # For debugging, save the HTML content
@@ -125,7 +125,7 @@ class LawyersAllianceScraper(BaseScraper):
                             break
                     
                     if date_tag:
-                    date_str = date_tag.get_text(strip=True)
+                        date_str = date_tag.get_text(strip=True)
                         start_datetime_obj = self.parse_date(date_str)
                     else:
                         # Use current date as fallback
@@ -32,7 +32,7 @@ class LSuiteScraper(BaseScraper):
         events = []
         
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = self.session.get(self.url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html5lib')
             
@@ -0,0 +1,279 @@
+"""
+Per-scraper run metrics.
+
+A run wraps each scraper in ``collect(metrics)``. Code below it marks its
+stages with ``span("parse")``, ``span("serialize")`` and so on, and
+ScraperSession records every HTTP request as a "fetch" span with its byte
+count. Spans nest: a stage's time excludes the time of spans opened inside
+it, so fetch and categorize time is not counted again under parse.
+
+The active metrics travel in a context variable, so spans opened in executor
+threads started with ``contextvars.copy_context().run`` (as
+SyncScraperAdapter does) are attributed to the right scraper. Outside of
+``collect`` a span does nothing.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import requests
+
+STAGES = ('throttle', 'fetch', 'parse', 'categorize', 'serialize', 'persist')
+
+
+class _OpenSpan:
+    __slots__ = ('child_wall', 'child_cpu')
+
+    def __init__(self):
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+
+
+_current_metrics: ContextVar[Optional['ScraperMetrics']] = ContextVar('scraper_metrics', default=None)
+_span_stack: ContextVar[Tuple[_OpenSpan, ...]] = ContextVar('scraper_span_stack', default=())
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process so far, in KB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KB on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class ScraperMetrics:
+    """Timings and counters collected for one scraper run."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_seconds = 0.0
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.http_requests = 0
+        self.bytes_downloaded = 0
+        # Requests sent over the shared transport, and connections it had to open for them
+        self.transport_requests = 0
+        self.connections_opened = 0
+        self.retries = 0
+        # Detail pages fetched, and ones skipped because their listing entry was unchanged
+        self.details_fetched = 0
+        self.details_reused = 0
+        self.events = 0
+        self.success: Optional[bool] = None
+        # Whether the scraper ran out of time (its results may be partial)
+        self.timed_out = False
+        self.peak_rss_kb: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def add_stage(self, stage: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            totals = self.stages.setdefault(stage, {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'count': 0})
+            totals['wall_seconds'] += wall
+            totals['cpu_seconds'] += cpu
+            totals['count'] += 1
+
+    def add_request(self, response: requests.Response) -> None:
+        with self._lock:
+            self.http_requests += 1
+            # Bodies replayed from the HTTP cache were not downloaded again
+            if not getattr(response, 'from_cache', False):
+                self.bytes_downloaded += len(response.content or b'')
+
+    def add_transport_request(self) -> None:
+        with self._lock:
+            self.transport_requests += 1
+
+    def add_connection_opened(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def add_detail_lookup(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.details_reused += 1
+            else:
+                self.details_fetched += 1
+
+    @property
+    def connection_reuse_ratio(self) -> Optional[float]:
+        """Share of transport requests that went over an already open connection."""
+        if not self.transport_requests:
+            return None
+        return max(0.0, 1 - self.connections_opened / self.transport_requests)
+
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(totals['cpu_seconds'] for totals in self.stages.values())
+
+    @property
+    def slowest_stage(self) -> Optional[str]:
+        if not self.stages:
+            return None
+        return max(self.stages, key=lambda stage: self.stages[stage]['wall_seconds'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'wall_seconds': round(self.wall_seconds, 4),
+            'cpu_seconds': round(self.cpu_seconds, 4),
+            'http_requests': self.http_requests,
+            'bytes_downloaded': self.bytes_downloaded,
+            'retries': self.retries,
+            'connections_opened': self.connections_opened,
+            'connection_reuse_ratio': (round(self.connection_reuse_ratio, 4)
+                                       if self.connection_reuse_ratio is not None else None),
+            'details_fetched': self.details_fetched,
+            'details_reused': self.details_reused,
+            'events': self.events,
+            'timed_out': self.timed_out,
+            'peak_rss_kb': self.peak_rss_kb,
+            'slowest_stage': self.slowest_stage,
+            'stages': {
+                stage: {
+                    'wall_seconds': round(totals['wall_seconds'], 4),
+                    'cpu_seconds': round(totals['cpu_seconds'], 4),
+                    'count': totals['count'],
+                }
+                for stage, totals in sorted(self.stages.items(), key=lambda item: -item[1]['wall_seconds'])
+            },
+        }
+
+
+def current_metrics() -> Optional[ScraperMetrics]:
+    return _current_metrics.get()
+
+
+@contextmanager
+def collect(metrics: ScraperMetrics):
+    """Attribute spans and requests in this block (and threads it hands context to) to metrics."""
+    metrics_token = _current_metrics.set(metrics)
+    stack_token = _span_stack.set(())
+    started = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_seconds += time.perf_counter() - started
+        metrics.peak_rss_kb = peak_rss_kb()
+        _span_stack.reset(stack_token)
+        _current_metrics.reset(metrics_token)
+
+
+@contextmanager
+def span(stage: str):
+    """Time a stage of the current scraper. CPU time is that of the thread running the stage."""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    stack = _span_stack.get()
+    frame = _OpenSpan()
+    token = _span_stack.set(stack + (frame,))
+    wall_started = time.perf_counter()
+    cpu_started = time.thread_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_started
+        cpu = time.thread_time() - cpu_started
+        _span_stack.reset(token)
+        if stack:
+            with metrics._lock:
+                stack[-1].child_wall += wall
+                stack[-1].child_cpu += cpu
+        metrics.add_stage(stage, max(0.0, wall - frame.child_wall), max(0.0, cpu - frame.child_cpu))
+
+
+class ScraperSession(requests.Session):
+    """requests.Session that reports each request as a fetch span of the current scraper."""
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        with span('fetch'):
+            response = super().send(request, **kwargs)
+            metrics = _current_metrics.get()
+            if metrics is not None and not kwargs.get('stream'):
+                metrics.add_request(response)
+        return response
+
+
+def slowest_stages(all_metrics: Iterable[ScraperMetrics], limit: int = 5) -> List[Dict[str, Any]]:
+    """The slowest (scraper, stage) pairs across a run."""
+    entries = [
+        {'scraper': metrics.name, 'stage': stage, 'wall_seconds': round(totals['wall_seconds'], 4)}
+        for metrics in all_metrics
+        for stage, totals in metrics.stages.items()
+    ]
+    entries.sort(key=lambda entry: -entry['wall_seconds'])
+    return entries[:limit]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_prometheus(all_metrics: Iterable[ScraperMetrics]) -> str:
+    """Render metrics in the Prometheus text exposition format."""
+    all_metrics = list(all_metrics)
+    lines = []
+
+    def family(name: str, kind: str, help_text: str, samples: Iterable[Tuple[Dict[str, str], Any]]) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            if value is None:
+                continue
+            label_text = ','.join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}")
+
+    family('scraper_wall_seconds', 'gauge', 'Wall time of the scraper run.',
+           (({'scraper': m.name}, round(m.wall_seconds, 6)) for m in all_metrics))
+    family('scraper_cpu_seconds', 'gauge', 'CPU time spent in the scraper stages.',
+           (({'scraper': m.name}, round(m.cpu_seconds, 6)) for m in all_metrics))
+    family('scraper_stage_seconds', 'gauge', 'Wall time per scraper stage, excluding nested stages.',
+           (({'scraper': m.name, 'stage': stage}, round(totals['wall_seconds'], 6))
+            for m in all_metrics for stage, totals in m.stages.items()))
+    family('scraper_http_requests', 'gauge', 'HTTP requests made by the scraper.',
+           (({'scraper': m.name}, m.http_requests) for m in all_metrics))
+    family('scraper_bytes_downloaded', 'gauge', 'Response bytes downloaded by the scraper.',
+           (({'scraper': m.name}, m.bytes_downloaded) for m in all_metrics))
+    family('scraper_retries', 'gauge', 'HTTP requests retried after a transient failure.',
+           (({'scraper': m.name}, m.retries) for m in all_metrics))
+    family('scraper_connections_opened', 'gauge', 'New HTTP connections opened for the scraper.',
+           (({'scraper': m.name}, m.connections_opened) for m in all_metrics))
+    family('scraper_connection_reuse_ratio', 'gauge', 'Share of requests sent over a reused connection.',
+           (({'scraper': m.name}, round(m.connection_reuse_ratio, 6))
+            for m in all_metrics if m.connection_reuse_ratio is not None))
+    family('scraper_details_fetched', 'gauge', 'Detail pages fetched for new or changed listing entries.',
+           (({'scraper': m.name}, m.details_fetched) for m in all_metrics))
+    family('scraper_details_reused', 'gauge', 'Detail pages skipped because their listing entry was unchanged.',
+           (({'scraper': m.name}, m.details_reused) for m in all_metrics))
+    family('scraper_events', 'gauge', 'Events returned by the scraper.',
+           (({'scraper': m.name}, m.events) for m in all_metrics))
+    family('scraper_success', 'gauge', 'Whether the scraper run succeeded.',
+           (({'scraper': m.name}, int(m.success)) for m in all_metrics if m.success is not None))
+    family('scraper_timed_out', 'gauge', 'Whether the scraper hit its deadline.',
+           (({'scraper': m.name}, int(m.timed_out)) for m in all_metrics))
+    family('scraper_peak_rss_bytes', 'gauge', 'Process peak RSS when the scraper finished.',
+           (({'scraper': m.name}, m.peak_rss_kb * 1024) for m in all_metrics if m.peak_rss_kb is not None))
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path: str, all_metrics: Iterable[ScraperMetrics]) -> None:
+    """Write metrics to a Prometheus text file (e.g. for node_exporter's textfile collector)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(format_prometheus(all_metrics))
+    os.replace(tmp_path, path)
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -76,6 +78,14 @@ class Event:
             "metadata": safe_dict(self.metadata)
         }
 
+    def content_hash(self) -> str:
+        """Stable hash of the normalized fields written to the database.
+
+        Two scrapes of an unchanged event hash the same, so the save can be skipped.
+        """
+        payload = json.dumps(self.to_dict(), sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Event':
         """Create an event from a dictionary."""
@@ -201,121 +201,126 @@ class NYCBarScraper(BaseScraper):
         try:
             response = self.session.get(self.events_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            events = []
-            # Updated selector for new site structure
-            event_containers = soup.find_all('article', class_='card event-card')
-            if not event_containers:
-                print("[DEBUG] No event containers found with selector 'article.card.event-card'")
-            for container in event_containers:
-                try:
-                    # Title
-                    title_elem = container.find('h2') or container.find('h3')
-                    if not title_elem:
-                        continue
-                    title = title_elem.text.strip()
-                    # Registration link
-                    register_link = container.find('a', class_='register')
-                    if not register_link or not register_link.get('href'):
-                        continue
-                    link = register_link['href']
-                    # Date (from event-eyebrow or similar)
-                    eyebrow_elem = container.find('div', class_='event-eyebrow')
-                    date_str = eyebrow_elem.text.strip() if eyebrow_elem else None
-                    start_iso = None
-                    end_iso = None
-                    # Expected format example: "Mon, Sep 8, 2025 | 2-5:05 PM | CLE"
-                    if date_str and '|' in date_str:
-                        try:
-                            parts = [p.strip() for p in date_str.split('|') if p.strip()]
-                            # parts[0]=date, parts[1]=time range
-                            date_part = parts[0]
-                            time_part = parts[1] if len(parts) > 1 else ''
-                            # Parse date portion allowing optional weekday
-                            # Try formats with and without leading weekday
-                            dt_date = None
-                            for fmt in ['%a, %b %d, %Y', '%b %d, %Y']:
-                                try:
-                                    dt_date = datetime.strptime(date_part, fmt)
-                                    break
-                                except ValueError:
-                                    continue
-                            # Parse time range like "2-5:05 PM" or "5:45-9 PM" or "9 AM-5 PM"
-                            if dt_date and time_part:
-                                import re as _re
-                                # Updated regex to handle formats like "9 AM-5 PM"
-                                m = _re.search(r"^(\d{1,2})(?::(\d{2}))?\s*(AM|PM)?\s*-\s*(\d{1,2})(?::(\d{2}))?\s*(AM|PM)?$", time_part, _re.IGNORECASE)
-                                if m:
-                                    sh, sm, sh_ampm, eh, em, eh_ampm = m.groups()
-                                    sh = int(sh)
-                                    eh = int(eh)
-                                    sm = int(sm) if sm else 0
-                                    em = int(em) if em else 0
-
-                                    # Apply AM/PM conversion for start time
-                                    if sh_ampm:
-                                        if sh_ampm.upper() == 'PM' and sh != 12:
-                                            sh += 12
-                                        elif sh_ampm.upper() == 'AM' and sh == 12:
-                                            sh = 0
-
-                                    # Apply AM/PM conversion for end time
-                                    if eh_ampm:
-                                        if eh_ampm.upper() == 'PM' and eh != 12:
-                                            eh += 12
-                                        elif eh_ampm.upper() == 'AM' and eh == 12:
-                                            eh = 0
-                                    # If no AM/PM specified for end time but specified for start, use same
-                                    elif sh_ampm:
-                                        if sh_ampm.upper() == 'PM' and eh != 12:
-                                            eh += 12
-                                        elif sh_ampm.upper() == 'AM' and eh == 12:
-                                            eh = 0
-
-                                    start_dt = dt_date.replace(hour=sh, minute=sm, second=0, microsecond=0)
-                                    end_dt = dt_date.replace(hour=eh, minute=em, second=0, microsecond=0)
-                                    start_iso = start_dt.isoformat()
-                                    end_iso = end_dt.isoformat()
-                                else:
-                                    # Fallback: single time like "2:00 PM" or "9 AM"
-                                    for t_fmt in ['%I:%M %p', '%I %p', '%I%p']:
-                                        try:
-                                            t = datetime.strptime(time_part.strip(), t_fmt)
-                                            start_dt = dt_date.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
-                                            start_iso = start_dt.isoformat()
-                                            end_iso = None
-                                            break
-                                        except ValueError:
-                                            continue
-                        except Exception as e:
-                            logger.warning(f"Failed to parse NYC Bar date string '{date_str}': {e}")
-                    # Fallback: try to parse date from elsewhere if needed
-                    # Description (not available in list, would need to fetch detail page if needed)
-                    description = None
-                    # Create event object (minimal for now)
-                    event = Event(
-                        id=f"nycbar_{hashlib.sha256(link.encode('utf-8')).hexdigest()[:10]}",
-                        name=title,
-                        description=description,
-                        startDate=start_iso or date_str,
-                        endDate=end_iso,
-                        locationId=None,
-                        communityId=self.community_id,
-                        image=None,
-                        price=None,
-                        metadata={"source_url": link},
-                        category=["Legal"],
-                        tags=None
-                    )
-                    events.append(event)
-                except Exception as e:
-                    print(f"Error processing event: {e}")
-                    continue
-            return events
+            # A listing unchanged since the last run is not parsed again
+            return self.parse_events(response, self._parse_listing)
         except Exception as e:
             print(f"Error fetching events: {e}")
             return []
 
+    def _parse_listing(self, response: requests.Response) -> List[Event]:
+        """Events from the cards on the events page."""
+        soup = BeautifulSoup(response.text, 'html.parser')
+        events = []
+        # Updated selector for new site structure
+        event_containers = soup.find_all('article', class_='card event-card')
+        if not event_containers:
+            print("[DEBUG] No event containers found with selector 'article.card.event-card'")
+        for container in event_containers:
+            try:
+                # Title
+                title_elem = container.find('h2') or container.find('h3')
+                if not title_elem:
+                    continue
+                title = title_elem.text.strip()
+                # Registration link
+                register_link = container.find('a', class_='register')
+                if not register_link or not register_link.get('href'):
+                    continue
+                link = register_link['href']
+                # Date (from event-eyebrow or similar)
+                eyebrow_elem = container.find('div', class_='event-eyebrow')
+                date_str = eyebrow_elem.text.strip() if eyebrow_elem else None
+                start_iso = None
+                end_iso = None
+                # Expected format example: "Mon, Sep 8, 2025 | 2-5:05 PM | CLE"
+                if date_str and '|' in date_str:
+                    try:
+                        parts = [p.strip() for p in date_str.split('|') if p.strip()]
+                        # parts[0]=date, parts[1]=time range
+                        date_part = parts[0]
+                        time_part = parts[1] if len(parts) > 1 else ''
+                        # Parse date portion allowing optional weekday
+                        # Try formats with and without leading weekday
+                        dt_date = None
+                        for fmt in ['%a, %b %d, %Y', '%b %d, %Y']:
+                            try:
+                                dt_date = datetime.strptime(date_part, fmt)
+                                break
+                            except ValueError:
+                                continue
+                        # Parse time range like "2-5:05 PM" or "5:45-9 PM" or "9 AM-5 PM"
+                        if dt_date and time_part:
+                            import re as _re
+                            # Updated regex to handle formats like "9 AM-5 PM"
+                            m = _re.search(r"^(\d{1,2})(?::(\d{2}))?\s*(AM|PM)?\s*-\s*(\d{1,2})(?::(\d{2}))?\s*(AM|PM)?$", time_part, _re.IGNORECASE)
+                            if m:
+                                sh, sm, sh_ampm, eh, em, eh_ampm = m.groups()
+                                sh = int(sh)
+                                eh = int(eh)
+                                sm = int(sm) if sm else 0
+                                em = int(em) if em else 0
+
+                                # Apply AM/PM conversion for start time
+                                if sh_ampm:
+                                    if sh_ampm.upper() == 'PM' and sh != 12:
+                                        sh += 12
+                                    elif sh_ampm.upper() == 'AM' and sh == 12:
+                                        sh = 0
+
+                                # Apply AM/PM conversion for end time
+                                if eh_ampm:
+                                    if eh_ampm.upper() == 'PM' and eh != 12:
+                                        eh += 12
+                                    elif eh_ampm.upper() == 'AM' and eh == 12:
+                                        eh = 0
+                                # If no AM/PM specified for end time but specified for start, use same
+                                elif sh_ampm:
+                                    if sh_ampm.upper() == 'PM' and eh != 12:
+                                        eh += 12
+                                    elif sh_ampm.upper() == 'AM' and eh == 12:
+                                        eh = 0
+
+                                start_dt = dt_date.replace(hour=sh, minute=sm, second=0, microsecond=0)
+                                end_dt = dt_date.replace(hour=eh, minute=em, second=0, microsecond=0)
+                                start_iso = start_dt.isoformat()
+                                end_iso = end_dt.isoformat()
+                            else:
+                                # Fallback: single time like "2:00 PM" or "9 AM"
+                                for t_fmt in ['%I:%M %p', '%I %p', '%I%p']:
+                                    try:
+                                        t = datetime.strptime(time_part.strip(), t_fmt)
+                                        start_dt = dt_date.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
+                                        start_iso = start_dt.isoformat()
+                                        end_iso = None
+                                        break
+                                    except ValueError:
+                                        continue
+                    except Exception as e:
+                        logger.warning(f"Failed to parse NYC Bar date string '{date_str}': {e}")
+                # Fallback: try to parse date from elsewhere if needed
+                # Description (not available in list, would need to fetch detail page if needed)
+                description = None
+                # Create event object (minimal for now)
+                event = Event(
+                    id=f"nycbar_{hashlib.sha256(link.encode('utf-8')).hexdigest()[:10]}",
+                    name=title,
+                    description=description,
+                    startDate=start_iso or date_str,
+                    endDate=end_iso,
+                    locationId=None,
+                    communityId=self.community_id,
+                    image=None,
+                    price=None,
+                    metadata={"source_url": link},
+                    category=["Legal"],
+                    tags=None
+                )
+                events.append(event)
+            except Exception as e:
+                print(f"Error processing event: {e}")
+                continue
+        return events
+
 
 
 def main():
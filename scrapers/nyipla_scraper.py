@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
@@ -20,7 +19,7 @@ class NyiplaScaper(BaseScraper):
         url = "https://www.nyipla.org/nyipla/events.asp"
         
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -40,7 +39,7 @@ class NyiplaScaper(BaseScraper):
                     event_data = self.extract_event_from_link(link, url, current_month, current_year)
                     if event_data:
                         events.append(event_data)
-                        print(f"Found event: {event_data['title']}")
+                        print(f"Found event: {event_data.name}")
                 except Exception as e:
                     print(f"Error extracting event from link: {e}")
                     continue
@@ -194,7 +193,7 @@ class NyiplaScaper(BaseScraper):
     def get_event_details(self, event_url):
         """Fetch additional details from individual event page"""
         try:
-            response = requests.get(event_url, timeout=30)
+            response = self.session.get(event_url, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
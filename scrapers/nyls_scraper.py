@@ -33,7 +33,7 @@ class NYLSScraper(BaseScraper):
         events = []
         
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = self.session.get(self.url, headers=self.headers)
             response.raise_for_status()
             
             # Save debug file
@@ -30,76 +30,11 @@ class NYSBAScraper(BaseScraper):
                 'Referer': 'https://nysba.org/events-calendar/',
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Safari/605.1.15'
             }
-            response = requests.get(self.url, headers=headers)
+            response = self.session.get(self.url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            # A response unchanged since the last run is not parsed again
+            events = self.parse_events(response, self._parse_events_json)
 
-            events_list = data.get('events', [])
-            if not events_list:
-                logger.info("NYSBA scraper found no events in the 'events' key.")
-                return []
-
-            today = datetime.now().date()
-            three_months_from_now = today + timedelta(days=90)
-
-            for event_data in events_list:
-                try:
-                    start_date_str = event_data.get('start')
-                    if not start_date_str:
-                        continue
-
-                    start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-
-                    # Filter out past events and events more than 3 months in the future
-                    if not (today <= start_date <= three_months_from_now):
-                        continue
-
-                    event_id = f"nysba-{event_data.get('id')}"
-                    name = event_data.get('title')
-                    event_url = event_data.get('url')
-                    
-                    if not all([event_id, name, event_url]):
-                        logger.warning(f"Skipping event with missing data: {event_data}")
-                        continue
-
-                    # Build description
-                    description = f"Event at {event_data.get('region', 'N/A')}"
-                    
-                    # Use categorization helper
-                    base_categories = ['Bar Association', 'Legal Events', 'NYSBA']
-                    categories = EventCategorizer.categorize_event(name, description, base_categories)
-                    
-                    # Extract tags and event type
-                    tags = EventCategorizer.get_tags(name, description)
-                    event_type = EventCategorizer.get_event_type(name, description)
-                    
-                    # Check for CLE
-                    is_cle = EventCategorizer.is_cle_event(name, description)
-                    cle_credits = None
-                    if is_cle:
-                        # Try to extract CLE credits from description
-                        cle_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:cle|credit)', description.lower())
-                        if cle_match:
-                            cle_credits = float(cle_match.group(1))
-
-                    event = Event(
-                        id=event_id,
-                        name=name,
-                        startDate=start_date.isoformat(),
-                        endDate=start_date.isoformat(),  # Assume same day if no end date
-                        url=event_url,
-                        communityId="NYSBA",
-                        locationName=event_data.get('region', 'TBD'),
-                        description=description,
-                        event_type=event_type,
-                        category=categories,
-                        tags=tags,
-                        cle_credits=cle_credits
-                    )
-                    events.append(event)
-                except Exception as e:
-                    logger.error(f"Error processing NYSBA event: {e}", exc_info=True)
-            
             logger.info(f"Successfully scraped {len(events)} events from NYSBA after filtering")
 
         except requests.exceptions.RequestException as e:
@@ -108,6 +43,78 @@ class NYSBAScraper(BaseScraper):
             logger.error(f"An unexpected error occurred in NYSBA scraper: {e}", exc_info=True)
             
         return events
+
+    def _parse_events_json(self, response: requests.Response) -> List[Event]:
+        """Events in the next three months from the calendar API response."""
+        events = []
+        data = response.json()
+
+        events_list = data.get('events', [])
+        if not events_list:
+            logger.info("NYSBA scraper found no events in the 'events' key.")
+            return []
+
+        today = datetime.now().date()
+        three_months_from_now = today + timedelta(days=90)
+
+        for event_data in events_list:
+            try:
+                start_date_str = event_data.get('start')
+                if not start_date_str:
+                    continue
+
+                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+
+                # Filter out past events and events more than 3 months in the future
+                if not (today <= start_date <= three_months_from_now):
+                    continue
+
+                event_id = f"nysba-{event_data.get('id')}"
+                name = event_data.get('title')
+                event_url = event_data.get('url')
+
+                if not all([event_id, name, event_url]):
+                    logger.warning(f"Skipping event with missing data: {event_data}")
+                    continue
+
+                # Build description
+                description = f"Event at {event_data.get('region', 'N/A')}"
+
+                # Use categorization helper
+                base_categories = ['Bar Association', 'Legal Events', 'NYSBA']
+                categories = EventCategorizer.categorize_event(name, description, base_categories)
+
+                # Extract tags and event type
+                tags = EventCategorizer.get_tags(name, description)
+                event_type = EventCategorizer.get_event_type(name, description)
+
+                # Check for CLE
+                is_cle = EventCategorizer.is_cle_event(name, description)
+                cle_credits = None
+                if is_cle:
+                    # Try to extract CLE credits from description
+                    cle_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:cle|credit)', description.lower())
+                    if cle_match:
+                        cle_credits = float(cle_match.group(1))
+
+                event = Event(
+                    id=event_id,
+                    name=name,
+                    startDate=start_date.isoformat(),
+                    endDate=start_date.isoformat(),  # Assume same day if no end date
+                    url=event_url,
+                    communityId="NYSBA",
+                    locationName=event_data.get('region', 'TBD'),
+                    description=description,
+                    event_type=event_type,
+                    category=categories,
+                    tags=tags,
+                    cle_credits=cle_credits
+                )
+                events.append(event)
+            except Exception as e:
+                logger.error(f"Error processing NYSBA event: {e}", exc_info=True)
+        return events
     
     def _parse_event(self, event_data: Dict[str, Any]) -> Event:
         try:
@@ -0,0 +1,178 @@
+"""
+Lazy, prefetching pagination for the JSON event APIs.
+
+A Paginator walks a paged API one page at a time and yields its items as
+they arrive, so a scraper never holds more than a few pages in memory. Once
+the first page has told us how many items there are, the next ``prefetch``
+pages are fetched concurrently while the current one is being parsed. Without
+a total, pages are fetched one after another until a short or empty page.
+
+APIs sorted by start date can pass ``item_start`` and ``horizon``: the walk
+stops at the first item that starts after the horizon, and the pages queued
+behind it are cancelled.
+
+    def fetch(page):
+        data = session.get(url, params={'page': page, 'per_page': 50}).json()
+        return Page(data['events'], total_items=data.get('total_items'))
+
+    for item in Paginator(fetch, per_page=50):
+        ...
+
+Prefetched pages are fetched with the caller's context, so they count towards
+the scraper's metrics, rate limits and deadline.
+"""
+
+import contextvars
+import logging
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Iterator, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Pages fetched ahead of the one being consumed
+DEFAULT_PREFETCH = 3
+# Hard stop for APIs that never return a short page
+MAX_PAGES = 100
+
+
+@dataclass
+class Page:
+    """One page of an API response."""
+    items: List[Any]
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+
+
+class Paginator:
+    """Iterates over the items of a paged API, fetching pages ahead of time."""
+
+    def __init__(self, fetch_page: Callable[[int], Page], per_page: int,
+                 prefetch: int = DEFAULT_PREFETCH, first_page: int = 1, max_pages: int = MAX_PAGES,
+                 item_start: Optional[Callable[[Any], Optional[datetime]]] = None,
+                 horizon: Optional[datetime] = None):
+        self.fetch_page = fetch_page
+        self.per_page = per_page
+        self.prefetch = max(0, prefetch)
+        self.first_page = first_page
+        self.max_pages = max_pages
+        self.item_start = item_start
+        self.horizon = horizon
+        # Filled in while iterating
+        self.pages_fetched = 0
+        self.total_items: Optional[int] = None
+        self.stopped_at_horizon = False
+
+    def __iter__(self) -> Iterator[Any]:
+        first = self._fetch(self.first_page)
+        self.total_items = first.total_items
+        last_page = self._last_page(first)
+
+        if not (yield from self._yield_items(first)):
+            return
+        if last_page is None:
+            yield from self._iter_sequential(first)
+        elif last_page > self.first_page:
+            yield from self._iter_prefetched(last_page)
+
+    def _iter_sequential(self, previous: Page) -> Iterator[Any]:
+        """Pages one by one, until one comes back short or empty."""
+        number = self.first_page
+        while len(previous.items) >= self.per_page and number - self.first_page + 1 < self.max_pages:
+            number += 1
+            page = self._fetch_or_none(number)
+            if page is None or not page.items:
+                return
+            if not (yield from self._yield_items(page)):
+                return
+            previous = page
+
+    def _iter_prefetched(self, last_page: int) -> Iterator[Any]:
+        """Pages up to ``last_page``, keeping ``prefetch`` of them in flight."""
+        if self.prefetch == 0:
+            for number in range(self.first_page + 1, last_page + 1):
+                page = self._fetch_or_none(number)
+                if page is None or not page.items or not (yield from self._yield_items(page)):
+                    return
+            return
+
+        numbers = iter(range(self.first_page + 1, last_page + 1))
+        pending: Deque = deque()
+        with ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="paginator") as executor:
+            def submit_next() -> None:
+                number = next(numbers, None)
+                if number is not None:
+                    run = contextvars.copy_context().run
+                    pending.append((number, executor.submit(run, self._fetch, number)))
+
+            for _ in range(self.prefetch):
+                submit_next()
+            try:
+                while pending:
+                    number, future = pending.popleft()
+                    try:
+                        page = future.result()
+                    except requests.RequestException as e:
+                        logger.warning(f"Stopping pagination at page {number}: {e}")
+                        return
+                    if not page.items:
+                        return
+                    submit_next()
+                    if not (yield from self._yield_items(page)):
+                        return
+            finally:
+                # Stopped early (horizon, error or the caller broke off): drop queued pages
+                for _, future in pending:
+                    future.cancel()
+
+    def _yield_items(self, page: Page) -> Iterator[Any]:
+        """Yield a page's items; returns False once the horizon has been passed."""
+        for item in page.items:
+            if self._past_horizon(item):
+                self.stopped_at_horizon = True
+                return False
+            yield item
+        return True
+
+    def _past_horizon(self, item: Any) -> bool:
+        if self.horizon is None or self.item_start is None:
+            return False
+        try:
+            start = self.item_start(item)
+        except Exception:
+            return False
+        if start is None:
+            return False
+        horizon = self.horizon
+        # Compare naive and aware datetimes as UTC
+        if (start.tzinfo is None) != (horizon.tzinfo is None):
+            start = start.replace(tzinfo=timezone.utc) if start.tzinfo is None else start
+            horizon = horizon.replace(tzinfo=timezone.utc) if horizon.tzinfo is None else horizon
+        return start > horizon
+
+    def _last_page(self, first: Page) -> Optional[int]:
+        if first.total_pages is not None:
+            total_pages = first.total_pages
+        elif first.total_items is not None and self.per_page > 0:
+            total_pages = math.ceil(first.total_items / self.per_page)
+        else:
+            return None
+        return self.first_page + min(total_pages, self.max_pages) - 1
+
+    def _fetch(self, number: int) -> Page:
+        page = self.fetch_page(number)
+        self.pages_fetched += 1
+        return page
+
+    def _fetch_or_none(self, number: int) -> Optional[Page]:
+        """A later page; a failure ends the walk but keeps the items already yielded."""
+        try:
+            return self._fetch(number)
+        except requests.RequestException as e:
+            logger.warning(f"Stopping pagination at page {number}: {e}")
+            return None
@@ -0,0 +1,86 @@
+"""
+Multi-phrase substring matcher.
+
+PhraseMatcher compiles a list of phrases into one trie-shaped regular
+expression and finds every phrase that occurs in a text in a single scan,
+giving the same answer as checking ``phrase in text`` for each phrase.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Build a regex alternation that shares common prefixes between phrases."""
+    trie: Dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char != ""]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            # Greedy optional: prefer the longest phrase at a position
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """Finds which of a fixed set of phrases occur in a text, in one pass.
+
+    The regex scans the text without overlaps, reporting the longest phrase
+    at each match. The phrases that start inside a match are either contained
+    in it (known up front, see ``_implied``) or run past its end; the latter
+    can only be phrases that begin with one of the match's proper suffixes,
+    so those few candidates (``_overlaps``) are checked directly. Positions
+    after the match are covered by the scan itself, so together this gives
+    exactly the set a per-phrase ``in`` check would find.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases: List[str] = list(dict.fromkeys(phrases))
+        self._regex = re.compile(_trie_pattern(self.phrases)) if self.phrases else None
+        # For each phrase, every phrase (itself included) that it contains
+        self._implied: Dict[str, Set[str]] = {
+            phrase: {other for other in self.phrases if other in phrase}
+            for phrase in self.phrases
+        }
+        # For each phrase, (offset, other) pairs where other starts inside it and runs past its end
+        self._overlaps: Dict[str, List[Tuple[int, str]]] = {
+            phrase: [
+                (offset, other)
+                for offset in range(1, len(phrase))
+                for other in self.phrases
+                if len(other) > len(phrase) - offset and other.startswith(phrase[offset:])
+            ]
+            for phrase in self.phrases
+        }
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the first phrase occurring in text (longest at that position), or None."""
+        if self._regex is None or not text:
+            return None
+        match = self._regex.search(text)
+        return match.group() if match else None
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of phrases that occur in text."""
+        found: Set[str] = set()
+        if self._regex is None or not text:
+            return found
+        for match in self._regex.finditer(text):
+            phrase = match.group()
+            found |= self._implied[phrase]
+            start = match.start()
+            for offset, other in self._overlaps[phrase]:
+                if other not in found and text.startswith(other, start + offset):
+                    found |= self._implied[other]
+        return found
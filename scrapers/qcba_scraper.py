@@ -17,8 +17,8 @@ import requests
 from bs4 import BeautifulSoup
 import hashlib
 try:
-from .base_scraper import BaseScraper
-from .models import Event
+    from .base_scraper import BaseScraper
+    from .models import Event
 except ImportError:
     import sys
     import os
@@ -44,7 +44,7 @@ class QCBAScraper(BaseScraper):
         events = []
         
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = self.session.get(self.url, headers=self.headers)
             response.raise_for_status()
 
             with open("qcba_debug.html", "w", encoding="utf-8") as f:
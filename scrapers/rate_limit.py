@@ -0,0 +1,268 @@
+"""
+Per-host rate limiting and circuit breaking for scraper HTTP.
+
+Every request sent through the shared transport (and the async fetch helpers)
+first takes a token from its host's bucket, so concurrent scrapers and their
+detail-page fan-outs together stay under ``rate`` requests per second per
+host, with bursts of up to ``burst``. A ``Retry-After`` on a 429 or 503
+pauses the whole host for that long.
+
+Each host also has a circuit breaker. After ``failure_threshold`` consecutive
+failures (connection errors, timeouts, 429 and 5xx responses) requests to the
+host fail immediately with CircuitOpenError for ``cooldown`` seconds; then a
+single trial request is let through, and its outcome closes or re-opens the
+circuit. A trial that ends without an outcome (it ran out of deadline, was
+cancelled, or raised something else) is released with ``release_trial``,
+which keeps the circuit open for another cooldown.
+
+Defaults are module constants; busy or fragile hosts can be tuned with
+``get_rate_limiter().configure(host, rate=..., burst=...)`` or HOST_RATE_LIMITS.
+"""
+
+import asyncio
+import email.utils
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Requests per second per host, and how many may be sent back to back
+DEFAULT_RATE = float(os.environ.get("SCRAPER_RATE_LIMIT", "2"))
+DEFAULT_BURST = 4
+# (rate, burst) for hosts that need something other than the defaults
+HOST_RATE_LIMITS: Dict[str, Tuple[float, int]] = {}
+
+FAILURE_THRESHOLD = 5
+COOLDOWN_SECONDS = 60.0
+# Upper bound on how long a Retry-After header may pause a host
+MAX_RETRY_AFTER_SECONDS = 300.0
+
+FAILURE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+    pass
+
+
+def host_of(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait for a Retry-After value (delta-seconds or an HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Token bucket handing out reservations, so callers can sleep outside the lock."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # Negative tokens are reservations queued behind earlier callers
+            wait = -self._tokens / self.rate if self._tokens < 0 and self.rate > 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every reservation back for ``seconds`` (e.g. from Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open trial."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        # Number of the last half-open trial, so a late release can't end a newer one
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        return self.admit() is not None
+
+    def admit(self) -> Optional[int]:
+        """None if no request may be sent now; else 0, or the trial's number for a half-open trial."""
+        with self._lock:
+            if self.opened_at is None:
+                return 0
+            if time.monotonic() - self.opened_at < self.cooldown or self._trial_in_flight:
+                return None
+            self._trial_in_flight = True
+            self._trials += 1
+            return self._trials
+
+    def release_trial(self, trial: int) -> None:
+        """End a half-open trial that finished without an outcome; the circuit stays open for another cooldown."""
+        with self._lock:
+            if self._trial_in_flight and trial == self._trials:
+                self._trial_in_flight = False
+                self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if this opened (or re-opened) the circuit."""
+        with self._lock:
+            self.failures += 1
+            reopened = self._trial_in_flight
+            self._trial_in_flight = False
+            if reopened or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class HostRateLimiter:
+    """Token buckets and circuit breakers keyed by host."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 failure_threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN_SECONDS):
+        self.rate = rate
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._limits: Dict[str, Tuple[float, int]] = dict(HOST_RATE_LIMITS)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str, rate: float, burst: int) -> None:
+        """Set the rate and burst for one host."""
+        with self._lock:
+            self._limits[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limits.get(host, (self.rate, self.burst))
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.cooldown)
+            return breaker
+
+    def reserve(self, url: str) -> Tuple[float, int]:
+        """Check the host's circuit and take a token; returns (seconds to wait, trial number or 0)."""
+        host = host_of(url)
+        trial = self.breaker(host).admit()
+        if trial is None:
+            raise CircuitOpenError(f"Circuit open for {host}, not requesting {url}")
+        return self.bucket(host).reserve(), trial
+
+    def acquire(self, url: str) -> int:
+        """Block until a request to url may be sent.
+
+        Returns the number of the half-open trial this request is, or 0. The
+        caller must pass a trial number to ``release_trial`` once the request
+        is over, whatever its outcome.
+        """
+        delay, trial = self.reserve(url)
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            except BaseException:
+                self.release_trial(url, trial)
+                raise
+        return trial
+
+    async def acquire_async(self, url: str) -> int:
+        """Wait, without blocking the event loop, until a request to url may be sent; returns like acquire."""
+        delay, trial = self.reserve(url)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except BaseException:
+                self.release_trial(url, trial)
+                raise
+        return trial
+
+    def release_trial(self, url: str, trial: int) -> None:
+        """Release a half-open trial to url's host; a no-op if its outcome was recorded or trial is 0."""
+        if trial:
+            self.breaker(host_of(url)).release_trial(trial)
+
+    def record_response(self, url: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        host = host_of(url)
+        if status_code in (429, 503):
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                seconds = min(seconds, MAX_RETRY_AFTER_SECONDS)
+                logger.warning(f"{host} returned {status_code}, pausing requests for {seconds:.0f}s")
+                self.bucket(host).pause(seconds)
+        if status_code in FAILURE_STATUSES:
+            self.record_failure(url)
+        else:
+            self.breaker(host).record_success()
+
+    def record_failure(self, url: str) -> None:
+        host = host_of(url)
+        if self.breaker(host).record_failure():
+            logger.warning(f"Opening circuit for {host} for {self.cooldown:.0f}s after repeated failures")
+
+    def open_circuits(self) -> Dict[str, int]:
+        """Hosts whose circuit is currently open, with their consecutive failure counts."""
+        with self._lock:
+            return {host: breaker.failures for host, breaker in self._breakers.items() if breaker.is_open}
+
+
+_rate_limiter: Optional[HostRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the process-wide HostRateLimiter."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter()
+        return _rate_limiter
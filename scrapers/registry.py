@@ -0,0 +1,128 @@
+"""
+Registry of every scraper the runners know about.
+
+Each ScraperSpec names the module and class of a scraper, the community it
+writes events for and how often it is scheduled. Nothing is imported until a
+spec is loaded, so an entry point that runs one scraper only pays for that
+scraper's module (and its parsing dependencies).
+
+    spec = get_spec("nycbar")
+    events = spec.create().run()
+
+Schedules:
+  - ``daily``: run by the cron handlers and by run_all_scrapers_local.py
+  - ``manual``: run by run_all_scrapers_local.py; the cron handlers run them
+    only when asked for by name
+"""
+
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Type
+
+DAILY = "daily"
+MANUAL = "manual"
+SCHEDULES = (DAILY, MANUAL)
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """How to build one scraper."""
+    name: str
+    module: str
+    class_name: str
+    community_id: Optional[str] = None  # None: use the scraper's own default
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    schedule: str = DAILY
+
+    def load_class(self) -> Type:
+        """Import the scraper's module and return its class."""
+        if __package__:
+            module = importlib.import_module(f".{self.module}", __package__)
+        else:
+            # Loaded as a top-level module by a script; scrapers use package-relative imports
+            try:
+                module = importlib.import_module(f"scrapers.{self.module}")
+            except ModuleNotFoundError as e:
+                if e.name not in ("scrapers", f"scrapers.{self.module}"):
+                    raise
+                module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)
+
+    def constructor_kwargs(self) -> Dict[str, Any]:
+        kwargs = dict(self.kwargs)
+        if self.community_id is not None:
+            kwargs.setdefault("community_id", self.community_id)
+        return kwargs
+
+    def create(self):
+        """Import and instantiate the scraper."""
+        return self.load_class()(**self.constructor_kwargs())
+
+
+# Community ids are the ids in public/data/communities.json
+SCRAPERS = (
+    # Bar associations and legal organizations
+    ScraperSpec("brooklynbar", "brooklynbar_scraper", "BrooklynBarScraper", "com_brooklyn_bar"),
+    ScraperSpec("nysba", "nysba_scraper", "NYSBAScraper", "com_nysba"),
+    ScraperSpec("hnba_ics", "hnba_ics_scraper", "HNBAICSScraper", "com_hnba"),
+    ScraperSpec("lgbtbarny", "lgbtbarny_scraper", "LgbtBarNyScraper", "com_lgbt_bar_ny"),
+    ScraperSpec("wbasny", "wbasny_scraper", "WBASNYScraper", "com_wbasny"),
+    ScraperSpec("nawl", "nawl_scraper", "NAWLScraper", "com_nawl"),
+    ScraperSpec("fedbar_ics", "fedbar_ics_scraper", "FBAICSScraper", "com_fedbar"),
+    ScraperSpec("cuny_law_ics", "cuny_law_ics_scraper", "CUNYLawICSScraper", "com_cuny_law"),
+    ScraperSpec("chips_network", "chips_network_scraper", "ChIPsNetworkScraper", "com_chips"),
+    ScraperSpec("nycbar", "nycbar_scraper", "NYCBarScraper", "com_nycbar"),
+    ScraperSpec("fordham", "fordham_scraper", "FordhamScraper", "com_fordham_law"),
+    ScraperSpec("nyiac", "nyiac_scraper", "NYIACScraper", "com_nyiac"),
+    ScraperSpec("lawyers_alliance", "lawyers_alliance_scraper", "LawyersAllianceScraper",
+                "com_lawyers_alliance", schedule=MANUAL),
+    ScraperSpec("lawline", "lawline_scraper", "LawlineScraper", schedule=MANUAL),
+    ScraperSpec("lsuite", "lsuite_scraper", "LSuiteScraper", schedule=MANUAL),
+    ScraperSpec("barkergilmore", "barkergilmore_scraper", "BarkerGilmoreScraper", schedule=MANUAL),
+    ScraperSpec("qcba", "qcba_scraper", "QCBAScraper", schedule=MANUAL),
+    ScraperSpec("acc", "acc_scraper", "AccScraper", schedule=MANUAL),
+    ScraperSpec("google_calendar", "google_calendar_scraper", "GoogleCalendarScraper",
+                "com_google_calendar", schedule=MANUAL),
+    # Law schools
+    ScraperSpec("cardozo_law", "cardozo_law_scraper", "CardozoLawScraper", schedule=MANUAL),
+    ScraperSpec("brooklyn_law", "brooklyn_law_scraper", "BrooklynLawScraper", schedule=MANUAL),
+    ScraperSpec("columbia_law", "columbia_law_scraper", "ColumbiaLawScraper", schedule=MANUAL),
+    ScraperSpec("stjohns_law", "stjohns_law_scraper", "StJohnsLawScraper", schedule=MANUAL),
+    ScraperSpec("nyls", "nyls_scraper", "NYLSScraper", schedule=MANUAL),
+    # Non-school legal organizations
+    ScraperSpec("nycla", "nycla_scraper", "NyclaScaper", schedule=MANUAL),
+    ScraperSpec("nyipla", "nyipla_scraper", "NyiplaScaper", schedule=MANUAL),
+    ScraperSpec("federal_bar_council", "federal_bar_council_scraper", "FederalBarCouncilScraper", schedule=MANUAL),
+    ScraperSpec("pli", "pli_scraper", "PliScraper", schedule=MANUAL),
+    ScraperSpec("bronx_bar", "bronx_bar_scraper", "BronxBarScraper", schedule=MANUAL),
+)
+
+_BY_NAME = {spec.name: spec for spec in SCRAPERS}
+_BY_CLASS = {spec.class_name: spec for spec in SCRAPERS}
+
+
+def scraper_names() -> list:
+    return [spec.name for spec in SCRAPERS]
+
+
+def get_spec(name: str) -> ScraperSpec:
+    """Look up a scraper by name; raises KeyError listing the known names."""
+    try:
+        return _BY_NAME[name]
+    except KeyError:
+        raise KeyError(f"Unknown scraper {name!r}; available: {', '.join(scraper_names())}") from None
+
+
+def iter_specs(names: Optional[Iterable[str]] = None, schedule: Optional[str] = None) -> Iterator[ScraperSpec]:
+    """Specs in registry order, optionally only the named ones and/or one schedule."""
+    wanted = set(names) if names else None
+    for spec in SCRAPERS:
+        if wanted is not None and spec.name not in wanted:
+            continue
+        if schedule is not None and spec.schedule != schedule:
+            continue
+        yield spec
+
+
+def spec_for_class(class_name: str) -> Optional[ScraperSpec]:
+    return _BY_CLASS.get(class_name)
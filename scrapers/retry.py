@@ -0,0 +1,137 @@
+"""
+Retries for scraper HTTP requests.
+
+Sessions from the shared transport retry transient failures (connection
+errors, timeouts, 429 and 5xx responses) with jittered exponential backoff.
+Only idempotent methods are retried unless a policy says otherwise. Every
+request gets a timeout, and all attempts of one request together stay within
+``total_budget`` seconds, so one bad host cannot stall a concurrent run.
+Within a deadline_scope the timeouts are also cut to the time the scraper
+has left, and no attempt starts after its deadline (see deadline.py).
+
+A scraper can override the default policy for its source:
+
+    class LawlineScraper(BaseScraper):
+        # The search API is read-only even though it is a POST
+        retry_policy = RetryPolicy(retry_methods=IDEMPOTENT_METHODS | {"POST"})
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass, replace
+from typing import FrozenSet, Optional
+
+import requests
+
+try:
+    from .deadline import DeadlineExceeded, check_deadline, remaining_time
+    from .metrics import ScraperSession, current_metrics, span
+    from .rate_limit import CircuitOpenError, parse_retry_after
+except ImportError:
+    from deadline import DeadlineExceeded, check_deadline, remaining_time
+    from metrics import ScraperSession, current_metrics, span
+    from rate_limit import CircuitOpenError, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often, how long and for what a request is retried."""
+    max_attempts: int = 3
+    backoff_base: float = 0.5       # seconds before the first retry, doubled each time
+    backoff_max: float = 10.0       # cap on a single backoff
+    timeout: float = 30.0           # per-attempt timeout when the caller sets none
+    total_budget: float = 60.0      # seconds for all attempts of one request
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def backoff(self, retry_number: int) -> float:
+        """Full-jitter backoff before retry number ``retry_number`` (1-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling)
+
+    def with_overrides(self, **changes) -> 'RetryPolicy':
+        return replace(self, **changes)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class RetryingSession(ScraperSession):
+    """ScraperSession that applies a RetryPolicy to every request it sends."""
+
+    def __init__(self, retry_policy: Optional[RetryPolicy] = None):
+        super().__init__()
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        policy = self.retry_policy
+        retryable = request.method in policy.retry_methods and policy.max_attempts > 1
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            check_deadline(f"{request.method} {request.url}")
+            remaining = policy.total_budget - (time.monotonic() - started)
+            deadline_remaining = remaining_time()
+            if deadline_remaining is not None:
+                remaining = min(remaining, deadline_remaining)
+            kwargs['timeout'] = self._attempt_timeout(kwargs.get('timeout'), policy, remaining)
+            try:
+                response = super().send(request, **kwargs)
+            except (CircuitOpenError, DeadlineExceeded):
+                raise
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A timeout cut short by the deadline is reported as the deadline
+                check_deadline(f"{request.method} {request.url}")
+                delay = self._retry_delay(policy, retryable, attempt, started, None)
+                if delay is None:
+                    raise
+                logger.info(f"Retrying {request.method} {request.url} in {delay:.1f}s after {type(e).__name__}: {e}")
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    return response
+                delay = self._retry_delay(policy, retryable, attempt, started, response.headers.get('Retry-After'))
+                if delay is None:
+                    return response
+                logger.info(f"Retrying {request.method} {request.url} in {delay:.1f}s after HTTP {response.status_code}")
+                response.close()
+
+            metrics = current_metrics()
+            if metrics is not None:
+                metrics.add_retry()
+            with span('throttle'):
+                time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _attempt_timeout(timeout, policy: RetryPolicy, remaining: float):
+        """The caller's timeout (or the policy's), never longer than the budget left."""
+        remaining = max(remaining, 0.1)
+        if timeout is None:
+            return min(policy.timeout, remaining)
+        if isinstance(timeout, tuple):
+            return tuple(min(part, remaining) if part is not None else remaining for part in timeout)
+        return min(timeout, remaining)
+
+    @staticmethod
+    def _retry_delay(policy: RetryPolicy, retryable: bool, attempt: int, started: float,
+                     retry_after: Optional[str]) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if not retryable or attempt >= policy.max_attempts:
+            return None
+        delay = policy.backoff(attempt)
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            delay = max(delay, server_delay)
+        if time.monotonic() - started + delay >= policy.total_budget:
+            return None
+        deadline_remaining = remaining_time()
+        if deadline_remaining is not None and delay >= deadline_remaining:
+            return None
+        return delay
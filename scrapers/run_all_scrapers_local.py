@@ -7,10 +7,14 @@ This script runs all scrapers and saves their output to the data/ directory.
 import json
 import os
 import sys
-import importlib
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Type
+from typing import List, Dict, Any, Optional, Type
+from urllib.parse import urlparse
 
 # Fix for relative imports when running as a script
 if __name__ == "__main__":
@@ -23,131 +27,224 @@ if __name__ == "__main__":
     if __package__ is None:
         __package__ = "scrapers"
 
-def run_all_scrapers(target_scrapers: List[str] = None):
-    """Run all available scrapers and save results to JSON files."""
-    
-    # List of all available scrapers with their module names, class names, and constructor arguments
-    scraper_configs = [
-        ("aabany_rss", "aabany_rss_scraper", "AabanyRssScraper", {}),
-        ("brooklynbar", "brooklynbar_scraper", "BrooklynBarScraper", {}),
-        ("nysba", "nysba_scraper", "NYSBAScraper", {}),
-        ("hnba_ics", "hnba_ics_scraper", "HNBAICSScraper", {}),
-        ("lgbtbarny", "lgbtbarny_scraper", "LgbtBarNyScraper", {}),
-        ("wbasny", "wbasny_scraper", "WBASNYScraper", {}),
-        ("nawl", "nawl_scraper", "NAWLScraper", {}),
-        ("fedbar_ics", "fedbar_ics_scraper", "FBAICSScraper", {}),
-        ("cuny_law_ics", "cuny_law_ics_scraper", "CUNYLawICSScraper", {}),
-        ("chips_network", "chips_network_scraper", "ChIPsNetworkScraper", {}),
-        ("nycbar", "nycbar_scraper", "NYCBarScraper", {"community_id": "com_nycbar"}),
-        ("fordham", "fordham_scraper", "FordhamScraper", {"community_id": "com_fordham"}),
-        ("lawyers_alliance", "lawyers_alliance_scraper", "LawyersAllianceScraper", {"community_id": "com_lawyers_alliance"}),
-        ("nyiac", "nyiac_scraper", "NYIACScraper", {"community_id": "com_nyiac"}),
-        ("lawline", "lawline_scraper", "LawlineScraper", {}),
-        ("lsuite", "lsuite_scraper", "LSuiteScraper", {}),
-        ("barkergilmore", "barkergilmore_scraper", "BarkerGilmoreScraper", {}),
-        ("qcba", "qcba_scraper", "QCBAScraper", {}),
-        ("acc", "acc_scraper", "AccScraper", {}),
-        # Law Schools
-        ("cardozo_law", "cardozo_law_scraper", "CardozoLawScraper", {}),
-        ("brooklyn_law", "brooklyn_law_scraper", "BrooklynLawScraper", {}),
-        ("columbia_law", "columbia_law_scraper", "ColumbiaLawScraper", {}),
-        ("stjohns_law", "stjohns_law_scraper", "StJohnsLawScraper", {}),
-        ("nyls", "nyls_scraper", "NYLSScraper", {}),
-        # Non-School Legal Organizations  
-        ("nycla", "nycla_scraper", "NyclaScaper", {}),
-        ("nyipla", "nyipla_scraper", "NyiplaScaper", {}),
-        ("federal_bar_council", "federal_bar_council_scraper", "FederalBarCouncilScraper", {}),
-        ("pli", "pli_scraper", "PliScraper", {}),
-        ("bronx_bar", "bronx_bar_scraper", "BronxBarScraper", {}),
-    ]
+from .deadline import Deadline, deadline_scope, exit_process
+from .metrics import ScraperMetrics, collect, slowest_stages, span, write_prometheus
+from .registry import ScraperSpec, iter_specs, scraper_names
+from .rate_limit import get_rate_limiter
+from .transport import get_transport
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 2
+
+# Wall-clock budgets in seconds, per scraper and for the whole run
+DEFAULT_SCRAPER_TIMEOUT = 300
+DEFAULT_RUN_TIMEOUT = 1800
+# How long past the run budget to wait for scrapers that ignore their deadline
+DEADLINE_GRACE_SECONDS = 30
+
+# Attributes scrapers commonly use for their listing URL, in order of preference
+HOST_URL_ATTRIBUTES = ('url', 'events_url', 'api_url', 'ics_url', 'webinars_url', 'base_url')
+
+class HostLimiter:
+    """Caps how many scrapers may talk to the same host at once."""
+
+    def __init__(self, per_host_limit: int):
+        self.per_host_limit = max(1, per_host_limit)
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def limit(self, host: str):
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.Semaphore(self.per_host_limit))
+        with semaphore:
+            yield
+
+def scraper_host(scraper: Any, default: str) -> str:
+    """Best-effort guess of the host a scraper fetches from."""
+    candidates = [getattr(scraper, attr, None) for attr in HOST_URL_ATTRIBUTES]
+    urls = getattr(scraper, 'urls', None)
+    if isinstance(urls, (list, tuple)) and urls:
+        candidates.append(urls[0])
+    for candidate in candidates:
+        if isinstance(candidate, str) and candidate.startswith('http'):
+            host = urlparse(candidate).hostname
+            if host:
+                return host[4:] if host.startswith('www.') else host
+    return default
+
+def run_scraper(spec: ScraperSpec, data_dir: str, host_limiter: HostLimiter,
+                metrics: Optional[ScraperMetrics] = None,
+                scraper_timeout: Optional[float] = DEFAULT_SCRAPER_TIMEOUT,
+                run_deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """Run a single scraper, save its events to JSON and return its summary entry.
+
+    Past ``scraper_timeout`` (or ``run_deadline``) the scraper's requests fail
+    fast and whatever events it has are saved as a partial result.
+    """
+    metrics = metrics or ScraperMetrics(spec.name)
+    if run_deadline is not None and run_deadline.expired:
+        print(f"⏭️  {spec.name}: skipped, the run's time budget is used up")
+        metrics.timed_out = True
+        result = _timed_out_result()
+    else:
+        with collect(metrics), deadline_scope(scraper_timeout, parent=run_deadline) as deadline:
+            result = _run_scraper(spec, data_dir, host_limiter)
+        metrics.timed_out = deadline.hit or deadline.expired
+        if metrics.timed_out:
+            print(f"⏰ {spec.name}: ran out of time, kept {result['event_count']} events")
+    result['timed_out'] = metrics.timed_out
+    metrics.success = result['success']
+    metrics.events = result['event_count']
+    result['metrics'] = metrics.to_dict()
+    return result
+
+def _timed_out_result() -> Dict[str, Any]:
+    return {
+        'success': False,
+        'error': 'timed out',
+        'event_count': 0,
+        'output_file': None
+    }
+
+def _run_scraper(spec: ScraperSpec, data_dir: str, host_limiter: HostLimiter) -> Dict[str, Any]:
+    name = spec.name
+    try:
+        print(f"\n📊 Running {name} scraper...")
+        
+        # Import and instantiate scraper
+        scraper = spec.create()
+        
+        # Run scraper, holding a slot for its host so detail-page fan-outs don't pile up
+        with host_limiter.limit(scraper_host(scraper, default=name)):
+            with span('parse'):
+                events = scraper.get_events()
+        
+        if not events:
+            print(f"⚠️  {name}: No events found")
+            return {
+                'success': True,
+                'event_count': 0,
+                'output_file': None
+            }
+        
+        print(f"✅ {name}: Found {len(events)} events")
+        
+        # Convert events to serializable format
+        with span('serialize'):
+            events_data = []
+            for event in events:
+                event_dict = event.to_dict()
+                # Add scraper metadata
+                event_dict['scraper_name'] = name
+                event_dict['scraped_at'] = datetime.now(timezone.utc).isoformat()
+                events_data.append(event_dict)
+            payload = json.dumps({
+                'scraper_name': name,
+                'scraped_at': datetime.now(timezone.utc).isoformat(),
+                'total_events': len(events),
+                'events': events_data
+            }, indent=2, ensure_ascii=False, default=str)
+        
+        # Save to JSON file
+        output_file = os.path.join(data_dir, f"{name}_events.json")
+        with span('persist'):
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+        
+        print(f"💾 Saved {len(events)} events to {output_file}")
+        
+        # Show sample event with categorization
+        sample_event = events[0]
+        print(f"📋 Sample event: \"{sample_event.name[:60]}{'...' if len(sample_event.name) > 60 else ''}\"")
+        print(f"   → Categories: {sample_event.category[:3] if sample_event.category else []}")
+        print(f"   → Event Type: {sample_event.event_type}")
+        print(f"   → CLE Credits: {sample_event.cle_credits}")
+        
+        return {
+            'success': True,
+            'event_count': len(events),
+            'output_file': output_file
+        }
+        
+    except Exception as e:
+        print(f"❌ {name}: Error - {e}")
+        return {
+            'success': False,
+            'error': str(e),
+            'event_count': 0,
+            'output_file': None
+        }
+
+def run_all_scrapers(target_scrapers: List[str] = None, workers: int = DEFAULT_WORKERS,
+                     per_host_limit: int = DEFAULT_PER_HOST_LIMIT, metrics_file: Optional[str] = None,
+                     scraper_timeout: Optional[float] = DEFAULT_SCRAPER_TIMEOUT,
+                     run_timeout: Optional[float] = DEFAULT_RUN_TIMEOUT):
+    """Run all available scrapers concurrently and save results to JSON files.
+
+    Scrapers run on a bounded thread pool of ``workers`` threads, and at most
+    ``per_host_limit`` of them talk to the same host at once. ``workers=1``
+    runs them one after another. Per-scraper timings and counters go into the
+    summary, and into ``metrics_file`` in Prometheus text format if given.
+    Each scraper gets ``scraper_timeout`` seconds and the run ``run_timeout``;
+    scrapers that run out keep their partial results and are listed in the
+    summary.
+    """
     
+    scraper_configs = list(iter_specs())
     run_list = scraper_configs
     if target_scrapers:
-        run_list = [c for c in scraper_configs if c[0] in target_scrapers]
+        run_list = list(iter_specs(target_scrapers))
         if not run_list:
             print(f"❌ No matching scrapers found for: {', '.join(target_scrapers)}")
-            print(f"   Available scrapers: {', '.join([c[0] for c in scraper_configs])}")
+            print(f"   Available scrapers: {', '.join(scraper_names())}")
             return {}
     
     results = {}
     total_events = 0
     successful_scrapers = 0
+    workers = max(1, min(workers, len(run_list)))
+    run_started = time.monotonic()
     
     print(f"🚀 Starting local scraper run at {datetime.now(timezone.utc).isoformat()}")
+    print(f"⚙️  Workers: {workers}, per-host limit: {per_host_limit}")
     print("=" * 80)
     
     # Ensure data directory exists
     data_dir = os.path.join(os.path.dirname(__file__), 'data')
     os.makedirs(data_dir, exist_ok=True)
     
-    for name, module_name, class_name, kwargs in run_list:
-        try:
-            print(f"\n📊 Running {name} scraper...")
-            
-            # Import and instantiate scraper
-            module = importlib.import_module(f".{module_name}", __package__)
-            scraper_class = getattr(module, class_name)
-            scraper = scraper_class(**kwargs)
-            
-            # Run scraper
-            events = scraper.get_events()
-            
-            if events:
-                print(f"✅ {name}: Found {len(events)} events")
-                
-                # Convert events to serializable format
-                events_data = []
-                for event in events:
-                    event_dict = event.to_dict()
-                    # Add scraper metadata
-                    event_dict['scraper_name'] = name
-                    event_dict['scraped_at'] = datetime.now(timezone.utc).isoformat()
-                    events_data.append(event_dict)
-                
-                # Save to JSON file
-                output_file = os.path.join(data_dir, f"{name}_events.json")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'scraper_name': name,
-                        'scraped_at': datetime.now(timezone.utc).isoformat(),
-                        'total_events': len(events),
-                        'events': events_data
-                    }, f, indent=2, ensure_ascii=False, default=str)
-                
-                print(f"💾 Saved {len(events)} events to {output_file}")
-                
-                results[name] = {
-                    'success': True,
-                    'event_count': len(events),
-                    'output_file': output_file
-                }
-                total_events += len(events)
-                successful_scrapers += 1
-                
-                # Show sample event with categorization
-                if events:
-                    sample_event = events[0]
-                    print(f"📋 Sample event: \"{sample_event.name[:60]}{'...' if len(sample_event.name) > 60 else ''}\"")
-                    print(f"   → Categories: {sample_event.category[:3] if sample_event.category else []}")
-                    print(f"   → Event Type: {sample_event.event_type}")
-                    print(f"   → CLE Credits: {sample_event.cle_credits}")
-                
-            else:
-                print(f"⚠️  {name}: No events found")
-                results[name] = {
-                    'success': True,
-                    'event_count': 0,
-                    'output_file': None
-                }
-                
-        except Exception as e:
-            print(f"❌ {name}: Error - {e}")
-            results[name] = {
-                'success': False,
-                'error': str(e),
-                'event_count': 0,
-                'output_file': None
-            }
+    host_limiter = HostLimiter(per_host_limit)
+    all_metrics = {spec.name: ScraperMetrics(spec.name) for spec in run_list}
+    run_deadline = Deadline(run_timeout)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
+    futures = {
+        executor.submit(run_scraper, spec, data_dir, host_limiter, all_metrics[spec.name],
+                        scraper_timeout, run_deadline): spec.name
+        for spec in run_list
+    }
+    completed = {}
+    wait_limit = run_timeout + DEADLINE_GRACE_SECONDS if run_timeout is not None else None
+    try:
+        for future in as_completed(futures, timeout=wait_limit):
+            completed[futures[future]] = future.result()
+    except FuturesTimeoutError:
+        print(f"⏰ Run budget of {run_timeout}s exceeded; abandoning {len(futures) - len(completed)} scrapers")
+    finally:
+        # Don't wait for scrapers that ignored their deadline
+        executor.shutdown(wait=not run_deadline.expired, cancel_futures=True)
+    
+    # Keep the summary in configuration order regardless of completion order
+    for spec in run_list:
+        name = spec.name
+        if name not in completed:
+            all_metrics[name].timed_out = True
+            completed[name] = dict(_timed_out_result(), timed_out=True, metrics=all_metrics[name].to_dict())
+        result = completed[name]
+        results[name] = result
+        if result['success'] and result['event_count'] > 0:
+            total_events += result['event_count']
+            successful_scrapers += 1
     
     # Create summary file
     summary_file = os.path.join(data_dir, f"scraper_run_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
@@ -156,19 +253,41 @@ def run_all_scrapers(target_scrapers: List[str] = None):
         'total_scrapers': len(scraper_configs),
         'successful_scrapers': successful_scrapers,
         'total_events': total_events,
+        'workers': workers,
+        'per_host_limit': per_host_limit,
+        'wall_time_seconds': round(time.monotonic() - run_started, 2),
+        'scraper_timeout_seconds': scraper_timeout,
+        'run_timeout_seconds': run_timeout,
+        'timed_out_scrapers': [name for name, result in results.items() if result.get('timed_out')],
+        'slowest_stages': slowest_stages(all_metrics.values()),
+        'transport': get_transport().stats(),
+        'open_circuits': get_rate_limiter().open_circuits(),
         'results': results
     }
     
     with open(summary_file, 'w', encoding='utf-8') as f:
         json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
     
+    if metrics_file:
+        write_prometheus(metrics_file, all_metrics.values())
+    
     print("\n" + "=" * 80)
     print(f"🎉 Scraper run completed!")
     print(f"📊 Summary:")
     print(f"   • Total scrapers: {len(scraper_configs)}")
     print(f"   • Successful: {successful_scrapers}")
     print(f"   • Total events: {total_events}")
+    print(f"   • Wall time: {summary['wall_time_seconds']}s")
+    if summary['transport']['connection_reuse_ratio'] is not None:
+        print(f"   • Connection reuse: {summary['transport']['connection_reuse_ratio']:.0%} "
+              f"({summary['transport']['connections_opened']} connections for {summary['transport']['requests']} requests)")
+    if summary['timed_out_scrapers']:
+        print(f"   • Timed out (partial results): {', '.join(summary['timed_out_scrapers'])}")
+    if summary['open_circuits']:
+        print(f"   • Hosts cut off after repeated failures: {', '.join(summary['open_circuits'])}")
     print(f"   • Summary saved to: {summary_file}")
+    if metrics_file:
+        print(f"   • Metrics saved to: {metrics_file}")
     print(f"   • Individual files saved to: {data_dir}/")
     
     # Show top performers
@@ -179,6 +298,12 @@ def run_all_scrapers(target_scrapers: List[str] = None):
         for name, result in sorted_results[:5]:
             print(f"   • {name}: {result['event_count']} events")
     
+    # Show where the time went
+    if summary['slowest_stages']:
+        print(f"\n🐢 Slowest stages:")
+        for entry in summary['slowest_stages']:
+            print(f"   • {entry['scraper']} {entry['stage']}: {entry['wall_seconds']}s")
+    
     return summary
 
 if __name__ == "__main__":
@@ -186,14 +311,51 @@ if __name__ == "__main__":
     parser.add_argument(
         "--scrapers",
         nargs="+",
-        help="Run only the specified scrapers by name (e.g., aabany_rss brooklynbar)",
+        help="Run only the specified scrapers by name (e.g., nycbar brooklynbar)",
+        default=None,
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of scrapers to run concurrently (default: {DEFAULT_WORKERS}, 1 runs them sequentially)",
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help=f"Maximum scrapers hitting the same host at once (default: {DEFAULT_PER_HOST_LIMIT})",
+    )
+    parser.add_argument(
+        "--scraper-timeout",
+        type=float,
+        default=DEFAULT_SCRAPER_TIMEOUT,
+        help=f"Seconds each scraper may run before it is cut off (default: {DEFAULT_SCRAPER_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--run-timeout",
+        type=float,
+        default=DEFAULT_RUN_TIMEOUT,
+        help=f"Seconds the whole run may take (default: {DEFAULT_RUN_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--metrics-file",
         default=None,
+        help="Also write per-scraper metrics to this file in Prometheus text format",
     )
     args = parser.parse_args()
 
     try:
-        summary = run_all_scrapers(target_scrapers=args.scrapers)
+        summary = run_all_scrapers(
+            target_scrapers=args.scrapers,
+            workers=args.workers,
+            per_host_limit=args.per_host_limit,
+            metrics_file=args.metrics_file,
+            scraper_timeout=args.scraper_timeout,
+            run_timeout=args.run_timeout,
+        )
         print(f"\n✅ All done! Check the data/ directory for results.")
     except Exception as e:
         print(f"❌ Fatal error: {e}")
-        sys.exit(1) 
\ No newline at end of file
+        exit_process(1)
+    exit_process(0) 
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Process-wide HTTP transport for the scrapers.
+
+Every scraper gets its own RetryingSession (so headers, cookies and retry
+policy stay separate), but all of them are mounted on one PooledAdapter. Keep-alive
+connections therefore outlive a single scraper and are shared by the detail
+page fan-outs of every scraper talking to the same host.
+
+Requests are paced per host by the rate limiter in rate_limit.py. The
+adapter also reports, per scraper, how many requests it sent and how many
+new connections it had to open, which gives the connection reuse ratio in
+the run metrics.
+
+    session = get_transport().session()
+    session.get("https://www.nycbar.org/events/")
+
+Scrapers should fetch through ``self.session`` (or ``get_session()``), never
+with module-level ``requests.get``; check_transport.py enforces this.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    from .http_cache import HTTP_CACHE_ENABLED, CachingAdapter, ResponseCache, get_default_cache
+    from .deadline import check_deadline, remaining_time
+    from .metrics import current_metrics, span
+    from .rate_limit import CircuitOpenError, HostRateLimiter, get_rate_limiter
+    from .retry import RetryingSession, RetryPolicy
+except ImportError:
+    from http_cache import HTTP_CACHE_ENABLED, CachingAdapter, ResponseCache, get_default_cache
+    from deadline import check_deadline, remaining_time
+    from metrics import current_metrics, span
+    from rate_limit import CircuitOpenError, HostRateLimiter, get_rate_limiter
+    from retry import RetryingSession, RetryPolicy
+
+# Number of hosts whose connection pools are kept around
+POOL_CONNECTIONS = 64
+# Keep-alive connections kept per host; matches the widest detail-page fan-out
+POOL_MAXSIZE = 16
+
+
+# Process-wide totals behind TransportManager.stats()
+_counters = {'requests': 0, 'connections_opened': 0}
+_counters_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _counters_lock:
+        _counters[name] += 1
+
+
+class _CountingPoolMixin:
+    """Reports each new connection to the scraper whose request opened it."""
+
+    def _new_conn(self):
+        _count('connections_opened')
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.add_connection_opened()
+        return super()._new_conn()
+
+
+class CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledAdapter(CachingAdapter):
+    """Caching adapter with shared, counted keep-alive pools.
+
+    Requests wait for their host's rate limiter (if any) and report their
+    outcome to its circuit breaker. The adapter belongs to the
+    TransportManager, so closing a session that is mounted on it leaves the
+    pools open.
+    """
+
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 limiter: Optional[HostRateLimiter] = None):
+        super().__init__(cache, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.limiter = limiter
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        if self.limiter is None:
+            return self._send(request, *args, **kwargs)
+
+        with span('throttle'):
+            trial = self.limiter.acquire(request.url)
+        try:
+            # The wait for a token may have used up the scraper's deadline
+            check_deadline(f"{request.method} {request.url}")
+            try:
+                response = self._send(request, *args, **kwargs)
+            except CircuitOpenError:
+                raise
+            except requests.RequestException:
+                # A timeout cut short by the scraper's deadline says nothing about the host
+                if remaining_time() != 0:
+                    self.limiter.record_failure(request.url)
+                raise
+            self.limiter.record_response(request.url, response.status_code, response.headers.get('Retry-After'))
+            return response
+        finally:
+            # Without a recorded outcome a half-open trial would keep the circuit open for good
+            self.limiter.release_trial(request.url, trial)
+
+    def _send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        _count('requests')
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.add_transport_request()
+        return super().send(request, *args, **kwargs)
+
+    def close(self) -> None:
+        # Shared by every session; only the TransportManager closes it
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+class TransportManager:
+    """Hands out sessions that share one pooled adapter."""
+
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 limiter: Optional[HostRateLimiter] = None):
+        self._cache = cache
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.limiter = limiter or get_rate_limiter()
+        self._adapter: Optional[PooledAdapter] = None
+        self._lock = threading.Lock()
+
+    @property
+    def adapter(self) -> PooledAdapter:
+        with self._lock:
+            if self._adapter is None:
+                cache = self._cache
+                if cache is None and HTTP_CACHE_ENABLED:
+                    cache = get_default_cache()
+                self._adapter = PooledAdapter(cache, self.pool_connections, self.pool_maxsize, self.limiter)
+            return self._adapter
+
+    def session(self, retry_policy: Optional[RetryPolicy] = None) -> RetryingSession:
+        """A new session (own headers, cookies and retry policy) on the shared connection pools."""
+        session = RetryingSession(retry_policy)
+        adapter = self.adapter
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests sent and connections opened since the process started."""
+        with _counters_lock:
+            sent, opened = _counters['requests'], _counters['connections_opened']
+        return {
+            'requests': sent,
+            'connections_opened': opened,
+            'connection_reuse_ratio': round(max(0.0, 1 - opened / sent), 4) if sent else None,
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection. Sessions handed out earlier still work but reconnect."""
+        with self._lock:
+            adapter, self._adapter = self._adapter, None
+        if adapter is not None:
+            adapter.shutdown()
+
+
+_transport: Optional[TransportManager] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> TransportManager:
+    """Return the process-wide TransportManager."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = TransportManager()
+        return _transport
+
+
+def get_session(retry_policy: Optional[RetryPolicy] = None) -> RetryingSession:
+    """Shortcut for ``get_transport().session()``."""
+    return get_transport().session(retry_policy)
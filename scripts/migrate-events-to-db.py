@@ -2,23 +2,57 @@
 """
 Script to migrate events from JSON files to the database.
 This script reads events from public/data/all_events_combined.json and inserts them into the database.
+
+By default events are migrated in batches: existing events, communities and
+locations are looked up once for the whole file, and new events are written
+with create_many, a few batches at a time. --per-event uses the old one
+event at a time path.
+
+    python scripts/migrate-events-to-db.py --batch-size 1000 --concurrency 4
 """
 
+import argparse
 import json
 import os
 import sys
-from datetime import datetime
-from typing import Dict, Any, List
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Set, Tuple
 import asyncio
 from prisma import Prisma
 
+# Events per create_many call, and how many calls run at once
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_CONCURRENCY = 4
+# Keys per lookup query, to stay well under the database's bind parameter limit
+LOOKUP_CHUNK_SIZE = 5000
+
 # Add the project root to the path so we can import from src
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+def _parse_date(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _utc(value: datetime) -> datetime:
+    """Naive datetimes are stored as UTC; compare everything as aware UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
 class EventMigrator:
-    def __init__(self):
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, concurrency: int = DEFAULT_CONCURRENCY):
         self.prisma = Prisma()
         self.data_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "public", "data", "all_events_combined.json")
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        # Community ids by name and location ids by address, filled once per run
+        self.community_ids: Dict[str, str] = {}
+        self.location_ids: Dict[str, str] = {}
         
     async def connect(self):
         """Connect to the database."""
@@ -182,16 +216,167 @@ class EventMigrator:
         print(f"Successfully migrated: {success_count} events")
         print(f"Errors: {error_count} events")
 
+    async def migrate_all_events_batched(self):
+        """Migrate all events from JSON to database in batches."""
+        print("Loading events from JSON file...")
+        events = self.load_events_from_json()
+        
+        if not events:
+            print("No events found in JSON file!")
+            return
+        
+        print(f"Found {len(events)} events to migrate")
+        started = datetime.now()
+        
+        parsed, error_count = self._parse_events(events)
+        existing_ids, existing_keys = await self._load_existing_keys(parsed)
+        
+        # Skip events already in the database, and repeats within the file
+        new_events = []
+        for event_data, start_date, end_date in parsed:
+            external_id = event_data.get('externalId')
+            key = (event_data['name'], _utc(start_date))
+            if (external_id and external_id in existing_ids) or key in existing_keys:
+                continue
+            if external_id:
+                existing_ids.add(external_id)
+            existing_keys.add(key)
+            new_events.append((event_data, start_date, end_date))
+        existing_count = len(parsed) - len(new_events)
+        print(f"{existing_count} events already exist, {len(new_events)} to create")
+        
+        await self._load_communities({e.get('community') for e, _, _ in new_events if e.get('community')})
+        await self._load_locations([e['location'] for e, _, _ in new_events
+                                    if e.get('location') and e['location'].get('address')])
+        
+        now = datetime.now()
+        rows = [self._event_row(event_data, start_date, end_date, now)
+                for event_data, start_date, end_date in new_events]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def create_batch(batch: List[Dict[str, Any]]) -> Tuple[int, int]:
+            async with semaphore:
+                try:
+                    return await self.prisma.event.create_many(data=batch, skip_duplicates=True), 0
+                except Exception as e:
+                    print(f"Error creating a batch of {len(batch)} events: {e}")
+                    return 0, len(batch)
+        
+        outcomes = await asyncio.gather(*(create_batch(batch) for batch in _chunks(rows, self.batch_size)))
+        created_count = sum(created for created, _ in outcomes)
+        failed_count = sum(failed for _, failed in outcomes)
+        # Rows create_many skipped because they collide on another unique column (e.g. url)
+        skipped_count = len(rows) - created_count - failed_count
+        
+        print(f"\nMigration complete in {(datetime.now() - started).total_seconds():.1f}s!")
+        print(f"Created: {created_count} events")
+        print(f"Already existed: {existing_count} events")
+        if skipped_count:
+            print(f"Skipped as duplicates: {skipped_count} events")
+        print(f"Errors: {error_count + failed_count} events")
+    
+    def _parse_events(self, events: List[Dict[str, Any]]) -> Tuple[List[Tuple[Dict[str, Any], datetime, datetime]], int]:
+        """Events with their parsed start and end dates, and the number that could not be parsed."""
+        parsed = []
+        error_count = 0
+        for event_data in events:
+            try:
+                start_date = _parse_date(event_data['startDate'])
+                end_date = _parse_date(event_data['endDate']) if event_data.get('endDate') else start_date
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Error migrating event {event_data.get('name', 'Unknown')}: {e}")
+                error_count += 1
+                continue
+            if not event_data.get('name'):
+                print(f"Error migrating event with no name starting {event_data['startDate']}")
+                error_count += 1
+                continue
+            parsed.append((event_data, start_date, end_date))
+        return parsed, error_count
+    
+    async def _load_existing_keys(self, parsed) -> Tuple[Set[str], Set[Tuple[str, datetime]]]:
+        """externalIds and (name, startDate) pairs of the file's events already in the database."""
+        external_ids = sorted({e['externalId'] for e, _, _ in parsed if e.get('externalId')})
+        names = sorted({e['name'] for e, _, _ in parsed})
+        existing_ids: Set[str] = set()
+        existing_keys: Set[Tuple[str, datetime]] = set()
+        
+        for chunk in _chunks(external_ids, LOOKUP_CHUNK_SIZE):
+            for event in await self.prisma.event.find_many(where={"externalId": {"in": chunk}}):
+                existing_ids.add(event.externalId)
+        for chunk in _chunks(names, LOOKUP_CHUNK_SIZE):
+            for event in await self.prisma.event.find_many(where={"name": {"in": chunk}}):
+                existing_keys.add((event.name, _utc(event.startDate)))
+                if event.externalId:
+                    existing_ids.add(event.externalId)
+        return existing_ids, existing_keys
+    
+    async def _load_communities(self, names: Set[str]) -> None:
+        """Fill the community id cache, creating communities the file needs but the database lacks."""
+        missing = sorted(name for name in names if name not in self.community_ids)
+        for chunk in _chunks(missing, LOOKUP_CHUNK_SIZE):
+            for community in await self.prisma.community.find_many(where={"name": {"in": chunk}}):
+                self.community_ids.setdefault(community.name, community.id)
+        for name in missing:
+            if name not in self.community_ids:
+                self.community_ids[name] = await self.create_or_get_community(name)
+    
+    async def _load_locations(self, locations: List[Dict[str, Any]]) -> None:
+        """Fill the location id cache, creating locations the file needs but the database lacks."""
+        by_address: Dict[str, Dict[str, Any]] = {}
+        for location in locations:
+            if location['address'] not in self.location_ids:
+                by_address.setdefault(location['address'], location)
+        for chunk in _chunks(sorted(by_address), LOOKUP_CHUNK_SIZE):
+            for location in await self.prisma.location.find_many(where={"address": {"in": chunk}}):
+                self.location_ids.setdefault(location.address, location.id)
+        for address, location in by_address.items():
+            if address not in self.location_ids:
+                self.location_ids[address] = await self.create_or_get_location(location)
+    
+    def _event_row(self, event_data: Dict[str, Any], start_date: datetime, end_date: datetime,
+                   now: datetime) -> Dict[str, Any]:
+        location = event_data.get('location') or {}
+        return {
+            "externalId": event_data.get('externalId'),
+            "name": event_data['name'],
+            "description": event_data.get('description', ''),
+            "startDate": start_date,
+            "endDate": end_date,
+            "locationName": event_data.get('locationName', ''),
+            "url": event_data.get('url'),
+            "cleCredits": event_data.get('cleCredits'),
+            "status": "PENDING",  # Start as pending for admin review
+            "submittedBy": event_data.get('submittedBy', 'system@migration'),
+            "submittedAt": now,
+            "updatedAt": now,
+            "updatedBy": 'system@migration',
+            "notes": f"Migrated from JSON file on {now.isoformat()}",
+            "locationId": self.location_ids.get(location.get('address')) if location.get('address') else None,
+            "communityId": self.community_ids.get(event_data['community']) if event_data.get('community') else None,
+        }
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Migrate events from JSON files to the database.")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'Events per create_many call (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help=f'Batches written at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--per-event', action='store_true', help='Migrate one event at a time (slow; for debugging single events)')
+    return parser.parse_args()
+
 async def main():
     """Main function."""
-    migrator = EventMigrator()
+    args = parse_args()
+    migrator = EventMigrator(batch_size=args.batch_size, concurrency=args.concurrency)
     
     try:
         print("Connecting to database...")
         await migrator.connect()
         
         print("Starting migration...")
-        await migrator.migrate_all_events()
+        if args.per_event:
+            await migrator.migrate_all_events()
+        else:
+            await migrator.migrate_all_events_batched()
         
     except Exception as e:
         print(f"Error during migration: {e}")
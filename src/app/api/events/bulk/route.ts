@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { PrismaClient } from '@prisma/client';
+import { gunzipSync } from 'zlib';
 
 const prisma = new PrismaClient();
 
@@ -8,7 +9,11 @@ export async function POST(request: NextRequest) {
     // Test database connection first
     await prisma.$connect();
     
-    const { events, scraper, secret } = await request.json();
+    // Scrapers upload in chunks with gzip-compressed bodies
+    const body = request.headers.get('content-encoding') === 'gzip'
+      ? JSON.parse(gunzipSync(Buffer.from(await request.arrayBuffer())).toString('utf-8'))
+      : await request.json();
+    const { events, scraper, secret } = body;
 
     // Validate secret
     if (!secret || secret !== process.env.SCRAPER_SECRET) {
@@ -22,6 +27,7 @@ export async function POST(request: NextRequest) {
     const results = {
       created: 0,
       updated: 0,
+      unchanged: 0,
       errors: [] as string[]
     };
 
@@ -72,6 +78,12 @@ export async function POST(request: NextRequest) {
           });
         }
 
+        // Nothing to write if the scraped content is the same as last time
+        if (existingEvent && eventData.contentHash && existingEvent.contentHash === eventData.contentHash) {
+          results.unchanged++;
+          continue;
+        }
+
         // Helper function for safe array handling
         const sanitizeArray = (value: any): string[] => {
           if (Array.isArray(value)) {
@@ -102,6 +114,7 @@ export async function POST(request: NextRequest) {
           url: sanitizeString(eventData.url) || null,
           hasCLE: Boolean(eventData.hasCLE || (eventData.cleCredits && eventData.cleCredits > 0)),
           cleCredits: typeof eventData.cleCredits === 'number' ? eventData.cleCredits : null,
+          contentHash: sanitizeString(eventData.contentHash) || null,
           status: 'APPROVED',
           updatedAt: new Date()
         };
@@ -162,6 +175,8 @@ export async function POST(request: NextRequest) {
     return NextResponse.json({
       success: true,
       message: `Processed ${events.length} events`,
+      // Chunks are upserts by externalId, so a retried chunk (same key) is safe to re-apply
+      idempotencyKey: request.headers.get('idempotency-key'),
       ...results
     });
 